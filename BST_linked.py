@@ -12,16 +12,18 @@ __updated__ = "2022-03-17"
 # pylint: disable=protected-access
 
 # Imports
-from copy import deepcopy
+from Copy_Policy import DEEP, NONE, copier
+from Queue_linked import Queue
 
 
 class _BST_Node:
+    __slots__ = ('_value', '_left', '_right', '_height', '_count')
 
     def __init__(self, value):
         """
         -------------------------------------------------------
         Initializes a BST node containing value. Child pointers
-        are None, height is 1.
+        are None, height is 1, and count is 1.
         Use: node = _BST_Node(value)
         -------------------------------------------------------
         Parameters:
@@ -30,17 +32,19 @@ class _BST_Node:
             A _BST_Node object (_BST_Node)
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._left = None
         self._right = None
         self._height = 1
-        self._count = 0
+        # Number of nodes in the subtree rooted at this node.
+        self._count = 1
 
     def _update_height(self):
         """
         -------------------------------------------------------
-        Updates the height of the current node. _height is 1 plus
-        the maximum of the node's (up to) two child heights.
+        Updates the height and count of the current node. _height is 1
+        plus the maximum of the node's (up to) two child heights, and
+        _count is 1 plus the sum of the node's (up to) two child counts.
         Use: node._update_height()
         -------------------------------------------------------
         Returns:
@@ -49,15 +53,20 @@ class _BST_Node:
         """
         if self._left is None:
             left_height = 0
+            left_count = 0
         else:
             left_height = self._left._height
+            left_count = self._left._count
 
         if self._right is None:
             right_height = 0
+            right_count = 0
         else:
             right_height = self._right._height
+            right_count = self._right._count
 
         self._height = max(left_height, right_height) + 1
+        self._count = left_count + right_count + 1
         return
 
     def __str__(self):
@@ -67,23 +76,112 @@ class _BST_Node:
         Returns node height and value as a string - for debugging.
         -------------------------------------------------------
         """
-        return f"h: {self._height}, v: {self._value}"
+        return f"h: {self._height}, c: {self._count}, v: {self._value}"
 
 
 class BST:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty BST.
         Use: bst = BST()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             A BST object (BST)
         -------------------------------------------------------
         """
         self._root = None
         self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+
+    @classmethod
+    def from_sorted(cls, values, copy_policy=DEEP):
+        """
+        -------------------------------------------------------
+        Creates a tree of minimal height from values, which must be
+        in strictly increasing order. The middle value of each range
+        of values becomes the root of its subtree, so the tree is
+        built directly in O(n) without any searching or rebalancing.
+        Use: bst = BST.from_sorted(values)
+        Use: avl = AVL.from_sorted(values, copy_policy)
+        -------------------------------------------------------
+        Parameters:
+            values - values in strictly increasing order (iterable of ?)
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+        Returns:
+            bst - a new tree containing copies of values (cls)
+        -------------------------------------------------------
+        """
+        values = list(values)
+
+        for i in range(1, len(values)):
+            assert values[i - 1] < values[i], \
+                "Values must be in strictly increasing order"
+
+        bst = cls(copy_policy)
+        bst._root = bst._from_sorted_aux(values, 0, len(values))
+        bst._count = len(values)
+        return bst
+
+    @classmethod
+    def from_iterable(cls, values, copy_policy=DEEP):
+        """
+        -------------------------------------------------------
+        Creates a tree of minimal height from values in any order.
+        The values are sorted and, of each group of equal values,
+        only the first is kept, as insert would. O(n log n)
+        Use: bst = BST.from_iterable(values)
+        Use: avl = AVL.from_iterable(values, copy_policy)
+        -------------------------------------------------------
+        Parameters:
+            values - values in any order (iterable of ?)
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+        Returns:
+            bst - a new tree containing copies of values (cls)
+        -------------------------------------------------------
+        """
+        unique = []
+
+        # sorted is stable, so the first of equal values comes first.
+        for value in sorted(values):
+            if len(unique) == 0 or unique[-1] < value:
+                unique.append(value)
+
+        bst = cls.from_sorted(unique, copy_policy)
+        return bst
+
+    def _from_sorted_aux(self, values, lo, hi):
+        """
+        -------------------------------------------------------
+        Builds a tree of minimal height from values[lo:hi]. The
+        recursion depth is the height of the tree, O(log n).
+        Private recursive operation called only by from_sorted.
+        Use: node = self._from_sorted_aux(values, lo, hi)
+        -------------------------------------------------------
+        Parameters:
+            values - values in strictly increasing order (list of ?)
+            lo - index of the first value of the subtree (int)
+            hi - index after the last value of the subtree (int)
+        Returns:
+            node - the root of the new subtree (_BST_Node)
+        -------------------------------------------------------
+        """
+        if lo >= hi:
+            node = None
+        else:
+            mid = (lo + hi) // 2
+            node = _BST_Node(self._copy(values[mid]))
+            node._left = self._from_sorted_aux(values, lo, mid)
+            node._right = self._from_sorted_aux(values, mid + 1, hi)
+            node._update_height()
+        return node
 
     def is_empty(self):
         """
@@ -129,37 +227,51 @@ class BST:
     def _insert_aux(self, node, value):
         """
         -------------------------------------------------------
-        Inserts a copy of value into node.
-        Private recursive operation called only by insert.
+        Inserts a copy of value into the node subtree.
+        Private iterative operation called only by insert.
         Use: node, inserted = self._insert_aux(node, value)
         -------------------------------------------------------
         Parameters:
             node - a bst node (_BST_Node)
             value - data to be inserted into the node (?)
         Returns:
-            node - the current node (_BST_Node)
+            node - the root of the updated subtree (_BST_Node)
             inserted - True if value is inserted into node,
                 False otherwise. (boolean)
         -------------------------------------------------------
         """
-        if node is None:
-            # Base case: add a new node containing the value.
-            node = _BST_Node(value)
-            self._count += 1
-            inserted = True
-        elif value < node._value:
-            # General case: check the left subtree.
-            node._left, inserted = self._insert_aux(node._left, value)
-        elif value > node._value:
-            # General case: check the right subtree.
-            node._right, inserted = self._insert_aux(node._right, value)
-        else:
-            # Base case: value is already in the BST.
-            inserted = False
+        # The path holds the ancestors of the new node from node down.
+        path = []
+        current = node
+        inserted = True
+
+        while current is not None and inserted:
+            if value < current._value:
+                # Check the left subtree.
+                path.append(current)
+                current = current._left
+            elif value > current._value:
+                # Check the right subtree.
+                path.append(current)
+                current = current._right
+            else:
+                # Value is already in the BST.
+                inserted = False
 
         if inserted:
-            # Update the node height if any of its children have been changed.
-            node._update_height()
+            # Add a new node containing the value and update the
+            # ancestor counts and heights.
+            self._count += 1
+            current = _BST_Node(self._copy(value))
+
+            for ancestor in path:
+                ancestor._count += 1
+
+            if len(path) == 0:
+                node = current
+            else:
+                node = self._rebalance_path(
+                    path, current, value < path[-1]._value)
         return node, inserted
 
     def retrieve(self, key):
@@ -185,9 +297,36 @@ class BST:
                 node = node._right
             elif node._value == key:
                 # for comparison counting
-                value = deepcopy(node._value)
+                value = self._copy(node._value)
         return value
 
+    def __contains__(self, key):
+        """
+        -------------------------------------------------------
+        Determines if the bst contains key. Follows a single path
+        from the root, so it is O(h) rather than a walk through
+        every value.
+        Use: b = key in bst
+        -------------------------------------------------------
+        Parameters:
+            key - data to search for (?)
+        Returns:
+            found - True if bst contains key, False otherwise (boolean)
+        -------------------------------------------------------
+        """
+        node = self._root
+        found = False
+
+        while node is not None and not found:
+
+            if node._value > key:
+                node = node._left
+            elif node._value < key:
+                node = node._right
+            else:
+                found = True
+        return found
+
     def remove(self, key):
         """
         -------------------------------------------------------
@@ -210,7 +349,7 @@ class BST:
         -------------------------------------------------------
         Attempts to find a value matching key in a BST node. Deletes the node
         if found and returns the sub-tree root.
-        Private recursive operation called only by remove.
+        Private iterative operation called only by remove.
         Use: node, value = self._remove_aux(node, key)
         -------------------------------------------------------
         Parameters:
@@ -221,75 +360,149 @@ class BST:
             value - value in node containing key, None otherwise.
         -------------------------------------------------------
         """
-        if node is None:
-            # Base Case: the key is not in the tree.
-            value = None
-        elif key < node._value:
-            # Search the left subtree.
-            node._left, value = self._remove_aux(node._left, key)
-        elif key > node._value:
-            # Search the right subtree.
-            node._right, value = self._remove_aux(node._right, key)
-        else:
-            # Value has been found.
-            value = node._value
+        # The path holds the ancestors of the matching node from node down.
+        path = []
+        current = node
+        value = None
+
+        while current is not None and value is None:
+            if key < current._value:
+                # Search the left subtree.
+                path.append(current)
+                current = current._left
+            elif key > current._value:
+                # Search the right subtree.
+                path.append(current)
+                current = current._right
+            else:
+                # Value has been found.
+                value = current._value
+
+        if value is not None:
             self._count -= 1
-            # Replace this node with another node.
-            if node._left is None and node._right is None:
-                # node has no children.
-                node = None
-            elif node._left is None:
-                # node has no left child.
-                node = node._right
-            elif node._right is None:
-                # node has no right child.
-                node = node._left
+
+            for ancestor in path:
+                ancestor._count -= 1
+            # Replace the current node with another node.
+            if current._left is None:
+                # current has no left child.
+                repl_node = current._right
+            elif current._right is None:
+                # current has no right child.
+                repl_node = current._left
             else:
-                # Node has two children
-                if node._left._right is None:
-                    # left child is replacement node
-                    repl_node = node._left
-                else:
-                    # find replacement node in right subtree of left node
-                    repl_node = self._delete_node_left(node._left)
-                    repl_node._left = node._left
+                # current has two children
+                repl_node, left = self._delete_node_left(current._left)
+                repl_node._left = left
+                repl_node._right = current._right
+                repl_node = self._rebalance(repl_node)
 
-                repl_node._right = node._right
+            if len(path) == 0:
                 node = repl_node
-
-        if node is not None and value is not None:
-            # If the value was found, update the ancestor heights.
-            node._update_height()
+            else:
+                # Update the ancestor heights.
+                node = self._rebalance_path(
+                    path, repl_node, path[-1]._left is current)
         return node, value
 
-    def _delete_node_left(self, parent):
+    def _delete_node_left(self, node):
         """
         -------------------------------------------------------
-        Finds a replacement node for a node to be removed from the tree.
+        Finds a replacement node for a node to be removed from the tree
+        and detaches it from the node subtree.
         Private operation called only by _remove_aux.
-        Use: repl_node = self._delete_node_left(parent)
+        Use: repl_node, node = self._delete_node_left(node)
         -------------------------------------------------------
         Parameters:
-            parent - node to search for largest value (_BST_Node)
+            node - left child of the node to be removed (_BST_Node)
         Returns:
             repl_node - the node that replaces the deleted node. This node
                 is the node with the maximum value in the deleted node's left
                 subtree (_BST_Node)
+            node - the root of the left subtree with repl_node
+                removed (_BST_Node)
         -------------------------------------------------------
         """
-        child = parent._right
+        path = []
+        repl_node = node
 
-        if child._right is None:
-            # child has largest value in left subtree
-            repl_node = child
-            # move child's left tree up
-            parent._right = child._left
+        while repl_node._right is not None:
+            # The largest value is the right-most node.
+            path.append(repl_node)
+            repl_node = repl_node._right
+
+        for ancestor in path:
+            # repl_node leaves the subtree of each of its ancestors.
+            ancestor._count -= 1
+
+        if len(path) == 0:
+            # node is the replacement node, its left tree moves up
+            node = repl_node._left
         else:
-            repl_node = self._delete_node_left(child)
+            # move repl_node's left tree up and update the heights
+            node = self._rebalance_path(path, repl_node._left, False)
+        return repl_node, node
+
+    def _rebalance_path(self, path, node, left):
+        """
+        -------------------------------------------------------
+        Links node below the last ancestor in path, then rebalances
+        the ancestors from the bottom up. Stops early once an ancestor
+        is neither replaced nor changes height, since the ancestors
+        above it cannot change either. The ancestor counts must
+        already be updated.
+        Private operation called by the insert and remove operations.
+        Use: node = self._rebalance_path(path, node, left)
+        -------------------------------------------------------
+        Parameters:
+            path - the ancestors of node from the subtree root
+                down (list of _BST_Node)
+            node - the new subtree below the last ancestor (_BST_Node)
+            left - True if node is the left child of the last
+                ancestor, False otherwise (boolean)
+        Returns:
+            node - the root of the updated subtree (_BST_Node)
+        -------------------------------------------------------
+        """
+        i = len(path) - 1
+        changed = True
+
+        while changed and i >= 0:
+            parent = path[i]
+
+            if left:
+                parent._left = node
+            else:
+                parent._right = node
+            height = parent._height
+            node = self._rebalance(parent)
+            changed = node is not parent or node._height != height
+
+            if i > 0:
+                left = path[i - 1]._left is parent
+            i -= 1
 
-        # Recursively update all parent node heights
-        parent._update_height()
-        return repl_node
+        if not changed:
+            # The rest of the path is unchanged.
+            node = path[0]
+        return node
+
+    def _rebalance(self, node):
+        """
+        -------------------------------------------------------
+        Updates the height of node after one of its subtrees has
+        changed. The plain BST does not rotate, so node remains the
+        root of its subtree. Subclasses may restructure the subtree.
+        Use: node = self._rebalance(node)
+        -------------------------------------------------------
+        Parameters:
+            node - a bst node whose subtree has changed (_BST_Node)
+        Returns:
+            node - the root of the updated subtree (_BST_Node)
+        -------------------------------------------------------
+        """
+        node._update_height()
+        return node
 
     def height(self):
         """
@@ -331,6 +544,7 @@ class BST:
         """
         ---------------------------------------------------------
         Determines whether two subtrees are identical.
+        Private iterative operation called only by is_identical.
         Use: b = self._is_identical_aux(node1, node2)
         -------------------------------------------------------
         Parameters:
@@ -341,15 +555,21 @@ class BST:
                 subtree in the same order, otherwise returns False (boolean)
         -------------------------------------------------------
         """
-        if node1 is None and node2 is None:
-            # Reached a bottom of the tree.
-            identical = True
-        elif node1 is not None and node2 is not None \
-                and node1._value == node2._value and node1._height == node2._height:
-            identical = self._is_identical_aux(node1._left, node2._left) \
-                and self._is_identical_aux(node1._right, node2._right)
-        else:
-            identical = False
+        identical = True
+        stack = [(node1, node2)]
+
+        while identical and len(stack) > 0:
+            node1, node2 = stack.pop()
+
+            if node1 is None and node2 is None:
+                # Reached a bottom of the tree.
+                pass
+            elif node1 is not None and node2 is not None \
+                    and node1._value == node2._value and node1._height == node2._height:
+                stack.append((node1._right, node2._right))
+                stack.append((node1._left, node2._left))
+            else:
+                identical = False
         return identical
 
     def max(self):
@@ -370,7 +590,7 @@ class BST:
         while node._right is not None:
             node = node._right
 
-        value = deepcopy(node._value)
+        value = self._copy(node._value)
         return value
 
     def max_r(self):
@@ -403,7 +623,7 @@ class BST:
         # Find the node containing the largest _value.
         # (It is the right-most node.)
         if node._right is None:
-            value = deepcopy(node._value)
+            value = self._copy(node._value)
         else:
             value = self._max_aux(node._right)
         return value
@@ -426,7 +646,7 @@ class BST:
         while node._left is not None:
             node = node._left
 
-        value = deepcopy(node._value)
+        value = self._copy(node._value)
         return value
 
     def min_r(self):
@@ -459,7 +679,7 @@ class BST:
         # Find the node containing the minimum _value.
         # (It is the left-most node.)
         if node._left is None:
-            value = deepcopy(node._value)
+            value = self._copy(node._value)
         else:
             value = self._min_aux(node._left)
         return value
@@ -482,7 +702,8 @@ class BST:
         """
         ---------------------------------------------------------
         Returns the number of leaves (nodes with no children) in bst.
-        Use: count = bst.leaf_count()
+        Private iterative operation called only by leaf_count.
+        Use: count = self._leaf_count_aux(node)
         ---------------------------------------------------------
         Parameters:
             node - a BST node (_BST_Node)
@@ -490,14 +711,12 @@ class BST:
             count - number of nodes with no children below node (int)
         ---------------------------------------------------------
         """
-        if node is None:
-            count = 0
-        elif node._left is None and node._right is None:
-            # Base case: node has no children.
-            count = 1
-        else:
-            count = self._leaf_count_aux(node._left) + \
-                self._leaf_count_aux(node._right)
+        count = 0
+
+        for current in self._nodes_aux(node):
+            if current._left is None and current._right is None:
+                # current has no children.
+                count += 1
         return count
 
     def two_child_count(self):
@@ -516,6 +735,7 @@ class BST:
         """
         ---------------------------------------------------------
         Returns the number of types of nodes in a BST node.
+        Private iterative operation called only by two_child_count.
         -------------------------------------------------------
         Parameters:
             node - a BST node (_BST_Node)
@@ -523,17 +743,12 @@ class BST:
             count - number of nodes with two children in bst (int)
         ----------------------------------------------------------
         """
-        if node is None:
-            # Base case: node is empty.
-            count = 0
-        elif node._left is not None and node._right is not None:
-            # General case: node has two children.
-            count = 1 + self._two_child_count_aux(node._left) + \
-                self._two_child_count_aux(node._right)
-        else:
-            # General case: node has one child.
-            count = self._two_child_count_aux(node._left) + \
-                self._two_child_count_aux(node._right)
+        count = 0
+
+        for current in self._nodes_aux(node):
+            if current._left is not None and current._right is not None:
+                # current has two children.
+                count += 1
         return count
 
     def one_child_count(self):
@@ -552,6 +767,7 @@ class BST:
         """
         ---------------------------------------------------------
         Returns the number of types of nodes in a BST node.
+        Private iterative operation called only by one_child_count.
         -------------------------------------------------------
         Parameters:
             node - a BST node (_BST_Node)
@@ -559,19 +775,12 @@ class BST:
             count - number of nodes with one child in bst (int)
         ----------------------------------------------------------
         """
-        if node is None:
-            # Base case: empty node..
-            count = 0
-        elif node._left is None and node._right is not None:
-            # General case: node has one child.
-            count = 1 + self._one_child_count_aux(node._right)
-        elif node._left is not None and node._right is None:
-            # General case: node has one child.
-            count = 1 + self._one_child_count_aux(node._left)
-        else:
-            # General case: node has two children.
-            count = self._one_child_count_aux(node._left) + \
-                self._one_child_count_aux(node._right)
+        count = 0
+
+        for current in self._nodes_aux(node):
+            if (current._left is None) != (current._right is None):
+                # current has one child.
+                count += 1
         return count
 
     def is_balanced(self):
@@ -592,8 +801,8 @@ class BST:
         """
         ---------------------------------------------------------
         Determines whether the BST is is_balanced.
-        Private operation called only by _is_balanced_aux.
-        Use: b = self._balanced_aux(node)
+        Private iterative operation called only by is_balanced.
+        Use: b = self._is_balanced_aux(node)
         ---------------------------------------------------------
         Parameters:
             node - the node to check the balance of (_BST_Node)
@@ -601,17 +810,14 @@ class BST:
             has_balanced - True if node is is has_balanced, False otherwise (boolean)
         ---------------------------------------------------------
         """
-        if node is None or node._height == 1:
-            # Base case: node is empty or a leaf, so no children.
-            has_balanced = True
-        elif abs(self._node_height(node._left) -
-                 self._node_height(node._right)) > 1:
-            # Base case: left or right subtree is too deep.
-            has_balanced = False
-        else:
-            # General case: check the children of node.
-            has_balanced = self._is_balanced_aux(node._left) and \
-                self._is_balanced_aux(node._right)
+        has_balanced = True
+
+        for current in self._nodes_aux(node):
+            if current._height > 2 and abs(
+                    self._node_height(current._left) -
+                    self._node_height(current._right)) > 1:
+                # left or right subtree is too deep.
+                has_balanced = False
         return has_balanced
 
     def _node_height(self, node):
@@ -633,6 +839,327 @@ class BST:
             height = node._height
         return height
 
+    def _node_count(self, node):
+        """
+        ---------------------------------------------------------
+        Helper function to determine the count of node - handles empty node.
+        Private operation called by the order statistics operations.
+        Use: n = self._node_count(node)
+        ---------------------------------------------------------
+        Parameters:
+            node - the node to get the count of (_BST_Node)
+        Returns:
+            count - 0 if node is None, node._count otherwise (int)
+        ---------------------------------------------------------
+        """
+        if node is None:
+            count = 0
+        else:
+            count = node._count
+        return count
+
+    def rank(self, key):
+        """
+        -------------------------------------------------------
+        Determines the number of values in bst that are less than key.
+        key need not be in bst. O(h)
+        Use: n = bst.rank(key)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+        Returns:
+            n - the number of values in bst less than key (int)
+        -------------------------------------------------------
+        """
+        n = 0
+        node = self._root
+
+        while node is not None:
+            if key < node._value:
+                node = node._left
+            elif key > node._value:
+                # node and its left subtree are all less than key.
+                n += self._node_count(node._left) + 1
+                node = node._right
+            else:
+                n += self._node_count(node._left)
+                node = None
+        return n
+
+    def select(self, k):
+        """
+        -------------------------------------------------------
+        Returns a copy of the value of rank k in bst, i.e. the value
+        at index k of bst.inorder(). O(h)
+        Use: value = bst.select(k)
+        -------------------------------------------------------
+        Parameters:
+            k - the rank of the value, 0 <= k < len(bst) (int)
+        Returns:
+            value - a copy of the value with exactly k smaller values
+                in bst (?)
+        -------------------------------------------------------
+        """
+        assert 0 <= k < self._count, "Invalid rank"
+
+        node = self._root
+        value = None
+
+        while value is None:
+            left_count = self._node_count(node._left)
+
+            if k < left_count:
+                node = node._left
+            elif k > left_count:
+                # Skip node and its left subtree.
+                k -= left_count + 1
+                node = node._right
+            else:
+                value = self._copy(node._value)
+        return value
+
+    def count_range(self, lo, hi):
+        """
+        -------------------------------------------------------
+        Counts the values in bst in the range [lo, hi). O(h)
+        Use: n = bst.count_range(lo, hi)
+        -------------------------------------------------------
+        Parameters:
+            lo - the lower bound of the range, inclusive (?)
+            hi - the upper bound of the range, exclusive (?)
+        Returns:
+            n - the number of values v in bst such that
+                lo <= v < hi (int)
+        -------------------------------------------------------
+        """
+        n = self.rank(hi) - self.rank(lo)
+
+        if n < 0:
+            # lo is greater than hi: the range is empty.
+            n = 0
+        return n
+
+    def median(self):
+        """
+        -------------------------------------------------------
+        Returns a copy of the median value of bst. If bst has an
+        even number of values, the lower of the two middle values
+        is returned. O(h)
+        Use: value = bst.median()
+        -------------------------------------------------------
+        Returns:
+            value - a copy of the median value in bst (?)
+        -------------------------------------------------------
+        """
+        assert self._root is not None, "Cannot find median of an empty BST"
+
+        value = self.select((self._count - 1) // 2)
+        return value
+
+    def floor(self, key):
+        """
+        -------------------------------------------------------
+        Finds the largest value in bst that is less than or equal
+        to key. O(h)
+        Use: value = bst.floor(key)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+        Returns:
+            value - a copy of the largest value <= key, None if there
+                is no such value (?)
+        -------------------------------------------------------
+        """
+        value = self._neighbour_aux(self._floor_aux(key, True))
+        return value
+
+    def ceiling(self, key):
+        """
+        -------------------------------------------------------
+        Finds the smallest value in bst that is greater than or equal
+        to key. O(h)
+        Use: value = bst.ceiling(key)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+        Returns:
+            value - a copy of the smallest value >= key, None if there
+                is no such value (?)
+        -------------------------------------------------------
+        """
+        value = self._neighbour_aux(self._ceiling_aux(key, True))
+        return value
+
+    def predecessor(self, key):
+        """
+        -------------------------------------------------------
+        Finds the largest value in bst that is less than key. key
+        need not be in bst. O(h)
+        Use: value = bst.predecessor(key)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+        Returns:
+            value - a copy of the largest value < key, None if there
+                is no such value (?)
+        -------------------------------------------------------
+        """
+        value = self._neighbour_aux(self._floor_aux(key, False))
+        return value
+
+    def successor(self, key):
+        """
+        -------------------------------------------------------
+        Finds the smallest value in bst that is greater than key. key
+        need not be in bst. O(h)
+        Use: value = bst.successor(key)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+        Returns:
+            value - a copy of the smallest value > key, None if there
+                is no such value (?)
+        -------------------------------------------------------
+        """
+        value = self._neighbour_aux(self._ceiling_aux(key, False))
+        return value
+
+    def _floor_aux(self, key, equal):
+        """
+        -------------------------------------------------------
+        Finds the node with the largest value less than key, or
+        equal to key if equal is True.
+        Private operation called by floor and predecessor.
+        Use: node = self._floor_aux(key, equal)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+            equal - True if a value equal to key matches (boolean)
+        Returns:
+            found - the matching node, None if there is none (_BST_Node)
+        -------------------------------------------------------
+        """
+        node = self._root
+        found = None
+
+        while node is not None:
+            if key < node._value:
+                node = node._left
+            elif key > node._value:
+                # node is a candidate, look for a larger one.
+                found = node
+                node = node._right
+            elif equal:
+                found = node
+                node = None
+            else:
+                # The largest value in the left subtree, if any.
+                node = node._left
+
+                while node is not None:
+                    found = node
+                    node = node._right
+        return found
+
+    def _ceiling_aux(self, key, equal):
+        """
+        -------------------------------------------------------
+        Finds the node with the smallest value greater than key, or
+        equal to key if equal is True.
+        Private operation called by ceiling and successor.
+        Use: node = self._ceiling_aux(key, equal)
+        -------------------------------------------------------
+        Parameters:
+            key - data to compare against (?)
+            equal - True if a value equal to key matches (boolean)
+        Returns:
+            found - the matching node, None if there is none (_BST_Node)
+        -------------------------------------------------------
+        """
+        node = self._root
+        found = None
+
+        while node is not None:
+            if key > node._value:
+                node = node._right
+            elif key < node._value:
+                # node is a candidate, look for a smaller one.
+                found = node
+                node = node._left
+            elif equal:
+                found = node
+                node = None
+            else:
+                # The smallest value in the right subtree, if any.
+                node = node._right
+
+                while node is not None:
+                    found = node
+                    node = node._left
+        return found
+
+    def _neighbour_aux(self, node):
+        """
+        -------------------------------------------------------
+        Returns a copy of the value of node - handles empty node.
+        Private operation called by the ordered neighbour operations.
+        Use: value = self._neighbour_aux(node)
+        -------------------------------------------------------
+        Parameters:
+            node - a bst node (_BST_Node)
+        Returns:
+            value - None if node is None, otherwise a copy of
+                node._value (?)
+        -------------------------------------------------------
+        """
+        if node is None:
+            value = None
+        else:
+            value = self._copy(node._value)
+        return value
+
+    def range(self, lo, hi):
+        """
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates in order through the
+        values in bst in the range [lo, hi). Subtrees outside the range
+        are not visited, so the iteration costs O(h + k) for k values.
+        Values are not copied and must not be changed.
+        Use: for v in bst.range(lo, hi):
+        -------------------------------------------------------
+        Parameters:
+            lo - the lower bound of the range, inclusive (?)
+            hi - the upper bound of the range, exclusive (?)
+        Returns:
+            yields
+            value - the next value v in inorder such that
+                lo <= v < hi (?)
+        -------------------------------------------------------
+        """
+        # The stack holds the ancestors in range whose values are
+        # still to come.
+        stack = []
+        node = self._root
+        done = False
+
+        while not done and (node is not None or len(stack) > 0):
+            if node is not None:
+                if node._value < lo:
+                    # node and its left subtree are below the range.
+                    node = node._right
+                else:
+                    stack.append(node)
+                    node = node._left
+            else:
+                node = stack.pop()
+
+                if node._value < hi:
+                    yield node._value
+                    node = node._right
+                else:
+                    # All remaining values are above the range.
+                    done = True
+
     def retrieve_r(self, key):
         """
         -------------------------------------------------------
@@ -670,7 +1197,7 @@ class BST:
             elif key > current._value:
                 value = self._retrieve_r_aux(current._right, key)
             else:
-                value = deepcopy(current._value)
+                value = self._copy(current._value)
         return value
 
     def is_valid(self):
@@ -679,7 +1206,8 @@ class BST:
         Determines if a tree is a valid BST, i.e. the values in all left nodes
         are smaller than their parent, and the values in all right nodes are
         larger than their parent, and height of any node is 1 + max height of
-        its children.
+        its children, and count of any node is 1 + the sum of the counts
+        of its children.
         Use: b = bst.is_valid()
         ---------------------------------------------------------
         Returns:
@@ -692,8 +1220,9 @@ class BST:
     def _is_valid_aux(self, node, min_node, max_node):
         """
         ---------------------------------------------------------
-        Private recursive method to determine the BST validity of node,
-        used only by is_valid.
+        Private iterative method to determine the BST validity of node,
+        used only by is_valid. The node subtree is walked in inorder,
+        where every value must be larger than the one before it.
         Use: valid = self._is_valid_aux(node, min_node, max_node)
         ---------------------------------------------------------
         Parameters:
@@ -704,21 +1233,34 @@ class BST:
             valid - True if node is root of a valid BST, False otherwise (boolean)
         ---------------------------------------------------------
         """
-        if node is None:
-            valid = True
-        elif min_node is not None and node._value <= min_node._value:
-            # print("BST left value violation at value: {}".format(node._value))
-            valid = False
-        elif max_node is not None and node._value >= max_node._value:
-            # print("BST right value violation at value: {}".format(node._value))
-            valid = False
-        elif node._height != max(self._node_height(node._left), self._node_height(node._right)) + 1:
-            # print("BST height violation at value: {}".format(node._value))
+        valid = True
+        # the previous node in inorder is the lower bound
+        previous = min_node
+        stack = []
+
+        while valid and (node is not None or len(stack) > 0):
+            while node is not None:
+                # Visit the left subtree first.
+                stack.append(node)
+                node = node._left
+            node = stack.pop()
+
+            if previous is not None and node._value <= previous._value:
+                # print("BST value violation at value: {}".format(node._value))
+                valid = False
+            elif node._height != max(self._node_height(node._left), self._node_height(node._right)) + 1:
+                # print("BST height violation at value: {}".format(node._value))
+                valid = False
+            elif node._count != self._node_count(node._left) + self._node_count(node._right) + 1:
+                # print("BST count violation at value: {}".format(node._value))
+                valid = False
+            previous = node
+            node = node._right
+
+        if valid and max_node is not None and previous is not None \
+                and previous._value >= max_node._value:
+            # print("BST right value violation at value: {}".format(previous._value))
             valid = False
-        else:
-            # node becomes max node of left tree, min node of right tree
-            valid = self._is_valid_aux(node._left, min_node, node) \
-                and self._is_valid_aux(node._right, node, max_node)
         return valid
 
     def inorder(self):
@@ -731,30 +1273,34 @@ class BST:
             a - copy of the contents of the tree in inorder (list of ?)
         -------------------------------------------------------
         """
-        a = []
-        self._inorder_aux(self._root, a)
+        a = [self._copy(value) for value in self.iter_inorder()]
         return a
 
-    def _inorder_aux(self, node, a):
+    def iter_inorder(self):
         """
-        ---------------------------------------------------------
-        Traverses node subtree in inorder. a contains the contents of
-        node and its children in inorder.
-        Private recursive operation called only by inorder.
-        Use: self._inorder_aux(node, a)
-        ---------------------------------------------------------
-        Parameters:
-            node - an BST node (_BST_Node)
-            a - target list of data (list of ?)
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the tree in
+        inorder, one value at a time. Values are not copied and must
+        not be changed. Uses O(height) extra memory.
+        Use: for v in bst.iter_inorder():
+        -------------------------------------------------------
         Returns:
-            None
-        ---------------------------------------------------------
+            yields
+            value - the next value in inorder (?)
+        -------------------------------------------------------
         """
-        if node is not None:
-            self._inorder_aux(node._left, a)
-            a.append(deepcopy(node._value))
-            self._inorder_aux(node._right, a)
-        return
+        # The stack holds the ancestors whose values are still to come.
+        stack = []
+        node = self._root
+
+        while node is not None or len(stack) > 0:
+            while node is not None:
+                # Visit the left subtree first.
+                stack.append(node)
+                node = node._left
+            node = stack.pop()
+            yield node._value
+            node = node._right
 
     def preorder(self):
         """
@@ -766,30 +1312,34 @@ class BST:
             a - copy of the contents of the tree in preorder (list of ?)
         -------------------------------------------------------
         """
-        a = []
-        self._preorder_aux(self._root, a)
+        a = [self._copy(value) for value in self.iter_preorder()]
         return a
 
-    def _preorder_aux(self, node, a):
+    def iter_preorder(self):
         """
-        ---------------------------------------------------------
-        Traverses node subtree in preorder. a contains the contents of
-        node and its children in preorder.
-        Private recursive operation called only by preorder.
-        Use: self._preorder_aux(node, a)
-        ---------------------------------------------------------
-        Parameters:
-            node - an BST node (_BST_Node)
-            a - target of data (list of ?)
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the tree in
+        preorder, one value at a time. Values are not copied and must
+        not be changed. Uses O(height) extra memory.
+        Use: for v in bst.iter_preorder():
+        -------------------------------------------------------
         Returns:
-            None
-        ---------------------------------------------------------
+            yields
+            value - the next value in preorder (?)
+        -------------------------------------------------------
         """
-        if node is not None:
-            a.append(deepcopy(node._value))
-            self._preorder_aux(node._left, a)
-            self._preorder_aux(node._right, a)
-        return
+        # The stack holds the right subtrees still to be visited.
+        stack = []
+        node = self._root
+
+        while node is not None or len(stack) > 0:
+            if node is None:
+                node = stack.pop()
+            yield node._value
+
+            if node._right is not None:
+                stack.append(node._right)
+            node = node._left
 
     def postorder(self):
         """
@@ -801,30 +1351,41 @@ class BST:
             a - copy of the contents of the tree in postorder (list of ?)
         -------------------------------------------------------
         """
-        a = []
-        self._postorder_aux(self._root, a)
+        a = [self._copy(value) for value in self.iter_postorder()]
         return a
 
-    def _postorder_aux(self, node, a):
+    def iter_postorder(self):
         """
-        ---------------------------------------------------------
-        Traverses node subtree in postorder. a contains the contents of
-        node and its children in postorder.
-        Private recursive operation called only by postorder.
-        Use: self._postorder_aux(node, a)
-        ---------------------------------------------------------
-        Parameters:
-            node - an BST node (_BST_Node)
-            a - target of data (list of ?)
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the tree in
+        postorder, one value at a time. Values are not copied and must
+        not be changed. Uses O(height) extra memory.
+        Use: for v in bst.iter_postorder():
+        -------------------------------------------------------
         Returns:
-            None
-        ---------------------------------------------------------
+            yields
+            value - the next value in postorder (?)
+        -------------------------------------------------------
         """
-        if node is not None:
-            self._postorder_aux(node._left, a)
-            self._postorder_aux(node._right, a)
-            a.append(deepcopy(node._value))
-        return
+        # The stack holds the ancestors whose values are still to come.
+        stack = []
+        last = None
+        node = self._root
+
+        while node is not None or len(stack) > 0:
+            if node is not None:
+                # Visit the left subtree first.
+                stack.append(node)
+                node = node._left
+            else:
+                top = stack[-1]
+
+                if top._right is not None and top._right is not last:
+                    # Visit the right subtree before top.
+                    node = top._right
+                else:
+                    yield top._value
+                    last = stack.pop()
 
     def levelorder(self):
         """
@@ -837,23 +1398,43 @@ class BST:
             (list of ?)
         -------------------------------------------------------
         """
-        values = []
+        values = [self._copy(value) for value in self]
+        return values
 
-        if self._root is not None:
-            # Put the nodes for one level into a queue.
-            queue = []
-            queue.append(self._root)
+    def iter_levels(self):
+        """
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the tree one
+        level at a time, from the root (depth 0) down. Only two levels
+        are held in memory at a time, so a scan can stop after any depth.
+        Values are not copied and must not be changed.
+        Use: for depth, values in bst.iter_levels():
+        -------------------------------------------------------
+        Returns:
+            yields
+            depth - the depth of the level (int)
+            values - the values at depth, left to right (list of ?)
+        -------------------------------------------------------
+        """
+        depth = 0
+
+        if self._root is None:
+            level = []
+        else:
+            level = [self._root]
 
-            while len(queue) > 0:
-                # Add a copy of the data to the sublist
-                node = queue.pop(0)
-                values.append(deepcopy(node._value))
+        while len(level) > 0:
+            yield depth, [node._value for node in level]
+            # Collect the children of the current level.
+            children = []
 
+            for node in level:
                 if node._left is not None:
-                    queue.append(node._left)
+                    children.append(node._left)
                 if node._right is not None:
-                    queue.append(node._right)
-        return values
+                    children.append(node._right)
+            level = children
+            depth += 1
 
     def count(self):
         """
@@ -872,6 +1453,7 @@ class BST:
         """
         ---------------------------------------------------------
         Returns the number of nodes in a BST subtree.
+        Private iterative operation called only by count.
         -------------------------------------------------------
         Parameters:
             node - a BST node (_BST_Node)
@@ -879,15 +1461,37 @@ class BST:
             number - count of nodes in the current subtree (int)
         ----------------------------------------------------------
         """
-        if node is None:
-            # Base case: node does not exist
-            number = 0
-        else:
-            # General case: node exists.
-            number = 1 + self._count_aux(node._left) + \
-                self._count_aux(node._right)
+        number = len(self._nodes_aux(node))
         return number
 
+    def _nodes_aux(self, node):
+        """
+        ---------------------------------------------------------
+        Collects the nodes of a BST subtree in levelorder. The list is
+        extended while it is being walked, so no recursion or queue
+        is required.
+        Private operation called by operations that visit every node
+        in any order.
+        Use: nodes = self._nodes_aux(node)
+        -------------------------------------------------------
+        Parameters:
+            node - a BST node (_BST_Node)
+        Returns:
+            nodes - the nodes in the node subtree (list of _BST_Node)
+        ----------------------------------------------------------
+        """
+        nodes = []
+
+        if node is not None:
+            nodes.append(node)
+
+            for current in nodes:
+                if current._left is not None:
+                    nodes.append(current._left)
+                if current._right is not None:
+                    nodes.append(current._right)
+        return nodes
+
     def __iter__(self):
         """
         -------------------------------------------------------
@@ -901,16 +1505,103 @@ class BST:
         -------------------------------------------------------
         """
         if self._root is not None:
-            # Put the nodes for one level into a queue.
-            queue = []
-            queue.append(self._root)
+            # Put the nodes for one level into a queue - a linked
+            # queue removes from the front in O(1).
+            queue = Queue(NONE)
+            queue.insert(self._root)
 
-            while len(queue) > 0:
-                # Add a copy of the data to the sublist
-                node = queue.pop(0)
+            while not queue.is_empty():
+                node = queue.remove()
                 yield node._value
 
                 if node._left is not None:
-                    queue.append(node._left)
+                    queue.insert(node._left)
                 if node._right is not None:
-                    queue.append(node._right)
+                    queue.insert(node._right)
+
+
+class AVL(BST):
+    """
+    -------------------------------------------------------
+    Self-balancing (AVL) version of the BST. Nodes are rotated
+    on insert and remove so that the heights of the left and
+    right subtrees of every node differ by at most 1, keeping
+    the height of the tree O(log n) for any insertion order.
+    Use: avl = AVL()
+    -------------------------------------------------------
+    """
+
+    def _rebalance(self, node):
+        """
+        -------------------------------------------------------
+        Updates the height of node and rotates the node subtree if
+        it is out of balance.
+        Use: node = self._rebalance(node)
+        -------------------------------------------------------
+        Parameters:
+            node - a bst node whose subtree has changed (_BST_Node)
+        Returns:
+            node - the root of the balanced subtree (_BST_Node)
+        -------------------------------------------------------
+        """
+        node._update_height()
+        balance = self._node_height(node._left) - \
+            self._node_height(node._right)
+
+        if balance > 1:
+            # Left subtree is too deep.
+            if self._node_height(node._left._left) < \
+                    self._node_height(node._left._right):
+                # Left-right case: straighten the left subtree first.
+                node._left = self._rotate_left(node._left)
+            node = self._rotate_right(node)
+        elif balance < -1:
+            # Right subtree is too deep.
+            if self._node_height(node._right._right) < \
+                    self._node_height(node._right._left):
+                # Right-left case: straighten the right subtree first.
+                node._right = self._rotate_right(node._right)
+            node = self._rotate_left(node)
+        return node
+
+    def _rotate_left(self, node):
+        """
+        -------------------------------------------------------
+        Rotates the node subtree to the left. The right child of
+        node becomes the new subtree root.
+        Use: node = self._rotate_left(node)
+        -------------------------------------------------------
+        Parameters:
+            node - a bst node with a right child (_BST_Node)
+        Returns:
+            pivot - the new root of the subtree (_BST_Node)
+        -------------------------------------------------------
+        """
+        pivot = node._right
+        node._right = pivot._left
+        pivot._left = node
+        # node is now below pivot, so update it first.
+        node._update_height()
+        pivot._update_height()
+        return pivot
+
+    def _rotate_right(self, node):
+        """
+        -------------------------------------------------------
+        Rotates the node subtree to the right. The left child of
+        node becomes the new subtree root.
+        Use: node = self._rotate_right(node)
+        -------------------------------------------------------
+        Parameters:
+            node - a bst node with a left child (_BST_Node)
+        Returns:
+            pivot - the new root of the subtree (_BST_Node)
+        -------------------------------------------------------
+        """
+        pivot = node._left
+        node._left = pivot._right
+        pivot._right = node
+        # node is now below pivot, so update it first.
+        node._update_height()
+        pivot._update_height()
+        return pivot
@@ -0,0 +1,425 @@
+"""
+-------------------------------------------------------
+Benchmarks for the linked BST ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from random import randrange, shuffle
+from time import perf_counter
+
+from BST_linked import _BST_Node, BST, AVL
+from Copy_Policy import NONE
+
+# Constants
+SEP = '-' * 60
+
+
+class _Recursive_BST(BST):
+    """
+    -------------------------------------------------------
+    The original recursive BST algorithms, kept as a baseline
+    for benchmark_iterative.
+    -------------------------------------------------------
+    """
+
+    def _insert_aux(self, node, value):
+        if node is None:
+            node = _BST_Node(self._copy(value))
+            self._count += 1
+            inserted = True
+        elif value < node._value:
+            node._left, inserted = self._insert_aux(node._left, value)
+        elif value > node._value:
+            node._right, inserted = self._insert_aux(node._right, value)
+        else:
+            inserted = False
+
+        if inserted:
+            node._update_height()
+        return node, inserted
+
+    def _remove_aux(self, node, key):
+        if node is None:
+            value = None
+        elif key < node._value:
+            node._left, value = self._remove_aux(node._left, key)
+        elif key > node._value:
+            node._right, value = self._remove_aux(node._right, key)
+        else:
+            value = node._value
+            self._count -= 1
+
+            if node._left is None:
+                node = node._right
+            elif node._right is None:
+                node = node._left
+            else:
+                if node._left._right is None:
+                    repl_node = node._left
+                else:
+                    repl_node = self._delete_node_left_r(node._left)
+                    repl_node._left = node._left
+                repl_node._right = node._right
+                node = repl_node
+
+        if node is not None and value is not None:
+            node._update_height()
+        return node, value
+
+    def _delete_node_left_r(self, parent):
+        child = parent._right
+
+        if child._right is None:
+            repl_node = child
+            parent._right = child._left
+        else:
+            repl_node = self._delete_node_left_r(child)
+        parent._update_height()
+        return repl_node
+
+    def inorder(self):
+        a = []
+        self._inorder_aux(self._root, a)
+        return a
+
+    def _inorder_aux(self, node, a):
+        if node is not None:
+            self._inorder_aux(node._left, a)
+            a.append(self._copy(node._value))
+            self._inorder_aux(node._right, a)
+        return
+
+    def _count_aux(self, node):
+        if node is None:
+            number = 0
+        else:
+            number = 1 + self._count_aux(node._left) + \
+                self._count_aux(node._right)
+        return number
+
+    def _is_valid_aux(self, node, min_node, max_node):
+        if node is None:
+            valid = True
+        elif min_node is not None and node._value <= min_node._value:
+            valid = False
+        elif max_node is not None and node._value >= max_node._value:
+            valid = False
+        elif node._height != max(self._node_height(node._left),
+                                 self._node_height(node._right)) + 1:
+            valid = False
+        else:
+            valid = self._is_valid_aux(node._left, min_node, node) \
+                and self._is_valid_aux(node._right, node, max_node)
+        return valid
+
+    def _is_balanced_aux(self, node):
+        if node is None or node._height == 1:
+            has_balanced = True
+        elif abs(self._node_height(node._left) -
+                 self._node_height(node._right)) > 1:
+            has_balanced = False
+        else:
+            has_balanced = self._is_balanced_aux(node._left) and \
+                self._is_balanced_aux(node._right)
+        return has_balanced
+
+
+def _time_it(func, *args):
+    """
+    -------------------------------------------------------
+    Times a single call of func.
+    Use: seconds, result = _time_it(func, *args)
+    -------------------------------------------------------
+    Parameters:
+        func - the function to time (function)
+        args - the arguments to func (?)
+    Returns:
+        seconds - elapsed wall clock time of the call (float)
+        result - the value returned by func (?)
+    -------------------------------------------------------
+    """
+    start = perf_counter()
+    result = func(*args)
+    seconds = perf_counter() - start
+    return seconds, result
+
+
+def _build(cls, keys):
+    """
+    -------------------------------------------------------
+    Builds a tree of type cls by inserting keys one at a time.
+    Use: bst = _build(cls, keys)
+    -------------------------------------------------------
+    Parameters:
+        cls - a tree class (BST or AVL)
+        keys - the keys to insert (list of int)
+    Returns:
+        bst - the filled tree (cls)
+    -------------------------------------------------------
+    """
+    bst = cls()
+
+    for key in keys:
+        bst.insert(key)
+    return bst
+
+
+def _lookup(bst, keys):
+    """
+    -------------------------------------------------------
+    Retrieves every key in keys from bst.
+    Use: _lookup(bst, keys)
+    -------------------------------------------------------
+    Parameters:
+        bst - a tree (BST or AVL)
+        keys - the keys to retrieve (list of int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    for key in keys:
+        bst.retrieve(key)
+    return
+
+
+def benchmark_balanced(sizes=(10 ** 5, 10 ** 6), degenerate_limit=10 ** 4):
+    """
+    -------------------------------------------------------
+    Compares the plain BST with the AVL tree on sorted and random
+    streams of keys. Prints the build time, lookup time, and
+    final height of each tree. The plain BST is quadratic on sorted
+    input, so sorted runs of the plain BST larger than
+    degenerate_limit are skipped.
+    Use: benchmark_balanced(sizes)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of keys to test (tuple of int)
+        degenerate_limit - largest sorted stream given to the
+            plain BST (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'tree':<6}{'stream':<8}{'n':>9}{'build s':>12}"
+          f"{'lookup s':>12}{'height':>8}")
+    print(SEP)
+
+    for n in sizes:
+        sorted_keys = list(range(n))
+        random_keys = list(range(n))
+        shuffle(random_keys)
+
+        for cls in (BST, AVL):
+            for stream, keys in (("sorted", sorted_keys), ("random", random_keys)):
+                name = cls.__name__
+
+                if cls is BST and stream == "sorted" and n > degenerate_limit:
+                    print(f"{name:<6}{stream:<8}{n:>9}  skipped (O(n^2))")
+                else:
+                    try:
+                        build, bst = _time_it(_build, cls, keys)
+                        lookup, _ = _time_it(_lookup, bst, random_keys)
+                        print(f"{name:<6}{stream:<8}{n:>9}{build:>12.3f}"
+                              f"{lookup:>12.3f}{bst.height():>8}")
+                    except RecursionError:
+                        print(f"{name:<6}{stream:<8}{n:>9}  RecursionError")
+    print(SEP)
+    return
+
+
+def _balanced_order(n):
+    """
+    -------------------------------------------------------
+    Orders the keys 0 to n - 1 so that inserting them one at a time
+    into a plain BST builds a balanced tree (medians first).
+    Use: keys = _balanced_order(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+    Returns:
+        keys - the keys in balanced insertion order (list of int)
+    -------------------------------------------------------
+    """
+    keys = []
+    ranges = [(0, n - 1)]
+    i = 0
+
+    while i < len(ranges):
+        lo, hi = ranges[i]
+        i += 1
+
+        if lo <= hi:
+            mid = (lo + hi) // 2
+            keys.append(mid)
+            ranges.append((lo, mid - 1))
+            ranges.append((mid + 1, hi))
+    return keys
+
+
+def _remove_all(bst, keys):
+    """
+    -------------------------------------------------------
+    Removes every key in keys from bst.
+    Use: _remove_all(bst, keys)
+    -------------------------------------------------------
+    Parameters:
+        bst - a tree (BST)
+        keys - the keys to remove (list of int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    for key in keys:
+        bst.remove(key)
+    return
+
+
+def benchmark_iterative(n=10 ** 5, repeats=3):
+    """
+    -------------------------------------------------------
+    Compares the iterative BST operations with the original recursive
+    versions. insert and remove use n random keys, the traversals use
+    a balanced tree of n keys. Prints the time per key of each version
+    (the best of repeats runs) and the speedup.
+    Use: benchmark_iterative(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys in the tree (int)
+        repeats - the number of times each operation is timed (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = list(range(n))
+    shuffle(keys)
+    balanced_keys = _balanced_order(n)
+    per_op = {}
+
+    for cls in (_Recursive_BST, BST):
+        times = {"insert": [], "remove": []}
+
+        for _ in range(repeats):
+            seconds, bst = _time_it(_build, cls, keys)
+            times["insert"].append(seconds)
+            seconds, _ = _time_it(_remove_all, bst, keys)
+            times["remove"].append(seconds)
+            bst = _build(cls, balanced_keys)
+
+            for name in ("inorder", "count", "is_valid", "is_balanced"):
+                seconds, _ = _time_it(getattr(bst, name))
+                times.setdefault(name, []).append(seconds)
+
+        for name, seconds in times.items():
+            # Microseconds per key for the best run.
+            per_op[(cls, name)] = min(seconds) / n * 10 ** 6
+
+    print(SEP)
+    print(f"{'operation':<14}{'recursive us':>15}{'iterative us':>15}"
+          f"{'speedup':>10}")
+    print(SEP)
+
+    for name in ("insert", "remove", "inorder", "count", "is_valid",
+                 "is_balanced"):
+        recursive = per_op[(_Recursive_BST, name)]
+        iterative = per_op[(BST, name)]
+        print(f"{name:<14}{recursive:>15.3f}{iterative:>15.3f}"
+              f"{recursive / iterative:>9.2f}x")
+    print(SEP)
+    return
+
+
+def _scan_filter(bst, windows):
+    """
+    -------------------------------------------------------
+    Answers each window query by copying the whole tree in inorder
+    and keeping the values in the window.
+    Use: _scan_filter(bst, windows)
+    -------------------------------------------------------
+    Parameters:
+        bst - a tree (BST)
+        windows - the (lo, hi) queries (list of tuple)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    for lo, hi in windows:
+        [value for value in bst.inorder() if lo <= value < hi]
+    return
+
+
+def _range_scan(bst, windows):
+    """
+    -------------------------------------------------------
+    Answers each window query with bst.range.
+    Use: _range_scan(bst, windows)
+    -------------------------------------------------------
+    Parameters:
+        bst - a tree (BST)
+        windows - the (lo, hi) queries (list of tuple)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    for lo, hi in windows:
+        list(bst.range(lo, hi))
+    return
+
+
+def benchmark_range(sizes=(10 ** 3, 10 ** 4, 10 ** 5), window=100,
+                    queries=100):
+    """
+    -------------------------------------------------------
+    Compares window queries answered by bst.range with filtering a
+    full inorder traversal. Each query asks for the values in a
+    random window of window consecutive keys of an AVL tree holding
+    the keys 0 to n - 1. Prints the time per query of each method.
+    Use: benchmark_range(sizes)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of keys in the tree (tuple of int)
+        window - the number of keys in each window (int)
+        queries - the number of queries (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'n':>9}{'window':>8}{'filter us':>14}{'range us':>14}"
+          f"{'speedup':>10}")
+    print(SEP)
+
+    for n in sizes:
+        bst = AVL(NONE)
+
+        for key in range(n):
+            bst.insert(key)
+        windows = []
+
+        for _ in range(queries):
+            lo = randrange(max(n - window, 1))
+            windows.append((lo, lo + window))
+
+        scan, _ = _time_it(_scan_filter, bst, windows)
+        ranged, _ = _time_it(_range_scan, bst, windows)
+        # Microseconds per query.
+        scan = scan / queries * 10 ** 6
+        ranged = ranged / queries * 10 ** 6
+        print(f"{n:>9}{window:>8}{scan:>14.1f}{ranged:>14.1f}"
+              f"{scan / ranged:>9.1f}x")
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    benchmark_balanced()
+    benchmark_iterative()
+    benchmark_range()
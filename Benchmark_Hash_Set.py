@@ -0,0 +1,605 @@
+"""
+-------------------------------------------------------
+Benchmarks for the Hash Set ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+import gc
+import os
+import tempfile
+import tracemalloc
+from importlib import import_module
+from random import randrange, shuffle
+from time import perf_counter
+
+from Copy_Policy import NONE
+from Hash_Function import BUILTIN, KEYED, SEEDED
+import Hash_Set_chained
+import Hash_Set_open
+
+# Constants
+SEP = '-' * 82
+CHAINED = ("Hash_Set_array", "Hash_Set_sorted", "Hash_Set_BST")
+BUCKETS = (Hash_Set_chained.LIST_BUCKET, Hash_Set_chained.SORTED_LIST_BUCKET,
+           Hash_Set_chained.BST_BUCKET, Hash_Set_chained.AVL_BUCKET)
+
+
+def _run_ops(hs, keys, misses):
+    """
+    -------------------------------------------------------
+    Inserts keys into hs, finds every key, looks up every miss,
+    iterates through hs, then removes every key.
+    Use: times = _run_ops(hs, keys, misses)
+    -------------------------------------------------------
+    Parameters:
+        hs - an empty hash set (Hash_Set)
+        keys - the keys to store (list of ?)
+        misses - keys that are not in keys (list of ?)
+    Returns:
+        times - seconds spent on each operation, in the order insert,
+            find, miss, iterate, remove (list of float)
+    -------------------------------------------------------
+    """
+    times = []
+    start = perf_counter()
+
+    for key in keys:
+        hs.insert(key)
+    times.append(perf_counter() - start)
+    start = perf_counter()
+
+    for key in keys:
+        hs.find(key)
+    times.append(perf_counter() - start)
+    start = perf_counter()
+
+    for key in misses:
+        key in hs
+    times.append(perf_counter() - start)
+    start = perf_counter()
+
+    for _ in hs:
+        pass
+    times.append(perf_counter() - start)
+    start = perf_counter()
+
+    for key in keys:
+        hs.remove(key)
+    times.append(perf_counter() - start)
+    return times
+
+
+def check_mixed_buckets(n=500):
+    """
+    -------------------------------------------------------
+    Checks the set operations of chained Hash_Sets with every pair of
+    bucket types against Python sets. After each update the set must
+    keep its own bucket type, so it is checked again after more
+    values are inserted into it. Raises AssertionError on a mismatch.
+    Use: check_mixed_buckets(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of random keys in each set (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    first = {randrange(n * 2) for _ in range(n)}
+    second = {randrange(n * 2) for _ in range(n // 4)}
+    updates = ("update", "intersection_update", "difference_update",
+               "symmetric_difference_update")
+
+    for bucket in BUCKETS:
+        for other_bucket in BUCKETS:
+            for keys, other_keys in ((first, second), (second, first)):
+                for method in updates:
+                    hs = Hash_Set_chained.Hash_Set(1, bucket=bucket)
+                    other = Hash_Set_chained.Hash_Set(1, bucket=other_bucket)
+                    hs.insert_many(keys)
+                    other.insert_many(other_keys)
+                    expected = set(keys)
+                    getattr(hs, method)(other)
+                    getattr(expected, method)(other_keys)
+                    assert hs._bucket == bucket, (bucket, other_bucket, method)
+                    assert sorted(hs) == sorted(expected), \
+                        (bucket, other_bucket, method)
+
+                    for key in range(n * 2, n * 3):
+                        hs.insert(key)
+                        expected.add(key)
+                    assert sorted(hs) == sorted(expected), \
+                        (bucket, other_bucket, method)
+    print(f"mixed bucket set operations: {len(BUCKETS) ** 2} pairs ok")
+    return
+
+
+def benchmark_open(sizes=(10 ** 4, 10 ** 5)):
+    """
+    -------------------------------------------------------
+    Compares the open addressing Hash_Set with the chained versions
+    on shuffled int keys. Prints the time per key of each operation.
+    The chained sets start with enough slots that they never rehash,
+    the open set starts at its minimum size and grows as needed.
+    All versions store deep copies of the keys.
+    Chained versions that cannot be imported are reported and skipped.
+    Use: benchmark_open(sizes)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of keys to test (tuple of int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'version':<16}{'n':>8}{'insert us':>11}{'find us':>11}"
+          f"{'miss us':>11}{'iter us':>11}{'remove us':>11}")
+    print(SEP)
+
+    for n in sizes:
+        keys = list(range(n))
+        shuffle(keys)
+        misses = list(range(n, 2 * n))
+
+        for name in CHAINED:
+            try:
+                module = import_module(name)
+            except ImportError as e:
+                print(f"{name:<16}{n:>8}  skipped ({e})")
+            else:
+                capacity = n // module.Hash_Set._LOAD_FACTOR + 1
+                times = _run_ops(module.Hash_Set(capacity), keys, misses)
+                print(f"{name:<16}{n:>8}" + "".join(
+                    f"{t / n * 10 ** 6:>11.3f}" for t in times))
+
+        times = _run_ops(Hash_Set_open.Hash_Set(1), keys, misses)
+        print(f"{'Hash_Set_open':<16}{n:>8}" + "".join(
+            f"{t / n * 10 ** 6:>11.3f}" for t in times))
+    print(SEP)
+    return
+
+
+def benchmark_buckets(n=10 ** 5, load_factors=(1, 4, 20, 50)):
+    """
+    -------------------------------------------------------
+    Compares the bucket types of the chained Hash_Set at each load
+    factor on n shuffled int keys. Each set starts with a single slot
+    and grows and shrinks as needed. Prints the time per key of each
+    operation.
+    Use: benchmark_buckets(n, load_factors)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+        load_factors - the load factors to test (tuple of number)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = list(range(n))
+    shuffle(keys)
+    misses = list(range(n, 2 * n))
+    print(SEP)
+    print(f"{'bucket':<13}{'load':>5}{'n':>8}{'insert us':>11}{'find us':>11}"
+          f"{'miss us':>11}{'iter us':>11}{'remove us':>11}")
+    print(SEP)
+
+    for load_factor in load_factors:
+        for bucket in BUCKETS:
+            hs = Hash_Set_chained.Hash_Set(1, bucket=bucket,
+                                           load_factor=load_factor)
+            times = _run_ops(hs, keys, misses)
+            print(f"{bucket:<13}{load_factor:>5}{n:>8}" + "".join(
+                f"{t / n * 10 ** 6:>11.3f}" for t in times))
+    print(SEP)
+    return
+
+
+def _insert_latencies(hs, keys):
+    """
+    -------------------------------------------------------
+    Inserts keys into hs one at a time, timing each insert. The
+    garbage collector is paused so that its pauses are not counted.
+    Use: latencies = _insert_latencies(hs, keys)
+    -------------------------------------------------------
+    Parameters:
+        hs - an empty hash set (Hash_Set)
+        keys - the keys to insert (list of ?)
+    Returns:
+        latencies - seconds spent on each insert, sorted (list of float)
+    -------------------------------------------------------
+    """
+    latencies = []
+    gc.disable()
+
+    for key in keys:
+        start = perf_counter()
+        hs.insert(key)
+        latencies.append(perf_counter() - start)
+    gc.enable()
+    latencies.sort()
+    return latencies
+
+
+def benchmark_rehash_latency(n=2 * 10 ** 5):
+    """
+    -------------------------------------------------------
+    Compares insert latency with incremental and all at once
+    rehashing in each chained Hash_Set. Each set starts with a single
+    slot and grows to hold n shuffled int keys. Prints latency
+    percentiles and a histogram of insert latencies, with bins
+    doubling from 1 us. Versions that cannot be imported are
+    reported and skipped.
+    Use: benchmark_rehash_latency(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys to insert (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = list(range(n))
+    shuffle(keys)
+    bins = [2 ** i for i in range(21)]
+    print(SEP)
+
+    for name in CHAINED:
+        try:
+            module = import_module(name)
+        except ImportError as e:
+            print(f"{name}: skipped ({e})")
+        else:
+            for incremental in (False, True):
+                latencies = _insert_latencies(
+                    module.Hash_Set(1, incremental=incremental), keys)
+                us = [t * 10 ** 6 for t in latencies]
+                mode = "incremental" if incremental else "all at once"
+                print(f"{name}, {mode}: n = {n}")
+                print(f"  p50 {us[n // 2]:.1f} us, p99 {us[n * 99 // 100]:.1f} us,"
+                      f" p99.9 {us[n * 999 // 1000]:.1f} us, max {us[-1]:.1f} us")
+                i = 0
+
+                for limit in bins:
+                    count = 0
+
+                    while i < n and us[i] < limit:
+                        count += 1
+                        i += 1
+
+                    if count > 0:
+                        print(f"  < {limit:>8} us {count:>9}")
+            print(SEP)
+    return
+
+
+class _Key:
+    """
+    -------------------------------------------------------
+    A tuple key with a slow hash. Counts the calls to __hash__.
+    Use: key = _Key(i)
+    -------------------------------------------------------
+    """
+    hash_calls = 0
+
+    def __init__(self, i):
+        self.key = (f"user{i}", i, (i % 7, i % 11))
+
+    def __hash__(self):
+        _Key.hash_calls += 1
+        # Stands in for an expensive hash of a large key.
+        h = 0
+
+        for _ in range(20):
+            h = hash((h, self.key))
+        return h
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def benchmark_hash_calls(n=10 ** 5):
+    """
+    -------------------------------------------------------
+    Inserts n keys with a slow hash into each chained Hash_Set,
+    starting with a single slot, then finds every key. Prints the
+    time taken and the number of calls to __hash__ per key.
+    Versions that cannot be imported are reported and skipped.
+    Use: benchmark_hash_calls(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = [_Key(i) for i in range(n)]
+    shuffle(keys)
+    print(SEP)
+    print(f"{'version':<16}{'n':>8}{'insert s':>12}{'find s':>12}"
+          f"{'hashes/key':>12}")
+    print(SEP)
+
+    for name in CHAINED:
+        try:
+            module = import_module(name)
+        except ImportError as e:
+            print(f"{name:<16}{n:>8}  skipped ({e})")
+        else:
+            hs = module.Hash_Set(1)
+            _Key.hash_calls = 0
+            start = perf_counter()
+
+            for key in keys:
+                hs.insert(key)
+            middle = perf_counter()
+
+            for key in keys:
+                hs.find(key)
+            end = perf_counter()
+            print(f"{name:<16}{n:>8}{middle - start:>12.3f}{end - middle:>12.3f}"
+                  f"{_Key.hash_calls / n:>12.2f}")
+    print(SEP)
+    return
+
+
+def benchmark_bulk(n=2 * 10 ** 5):
+    """
+    -------------------------------------------------------
+    Compares loading n shuffled int keys into a Hash_Set that starts
+    with a single slot, one insert at a time and with insert_many,
+    then times contains_many and remove_many on the keys. Versions
+    that cannot be imported are reported and skipped.
+    Use: benchmark_bulk(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = list(range(n))
+    shuffle(keys)
+    print(SEP)
+    print(f"{'version':<16}{'n':>8}{'insert s':>11}{'insert_many s':>15}"
+          f"{'contains_many s':>17}{'remove_many s':>15}")
+    print(SEP)
+
+    for name in CHAINED + ("Hash_Set_open",):
+        try:
+            module = import_module(name)
+        except ImportError as e:
+            print(f"{name:<16}{n:>8}  skipped ({e})")
+        else:
+            hs = module.Hash_Set(1)
+            start = perf_counter()
+
+            for key in keys:
+                hs.insert(key)
+            insert_s = perf_counter() - start
+            hs = module.Hash_Set(1)
+            times = []
+
+            for method in (hs.insert_many, hs.contains_many, hs.remove_many):
+                start = perf_counter()
+                method(keys)
+                times.append(perf_counter() - start)
+            print(f"{name:<16}{n:>8}{insert_s:>11.3f}{times[0]:>15.3f}"
+                  f"{times[1]:>17.3f}{times[2]:>15.3f}")
+    print(SEP)
+    return
+
+
+def benchmark_shrink(n=10 ** 5):
+    """
+    -------------------------------------------------------
+    Fills a Hash_Set that starts with a single slot with n int keys,
+    removes all but 1% of them, then compacts it. Prints the number
+    of slots and the memory held by the set after each step. Versions
+    that cannot be imported are reported and skipped.
+    Use: benchmark_shrink(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = list(range(n))
+    shuffle(keys)
+    kept = n // 100
+    print(SEP)
+    print(f"{'version':<16}{'step':<10}{'values':>10}{'slots':>10}{'KiB':>12}")
+    print(SEP)
+
+    for name in CHAINED + ("Hash_Set_open",):
+        try:
+            module = import_module(name)
+        except ImportError as e:
+            print(f"{name:<16}  skipped ({e})")
+        else:
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            hs = module.Hash_Set(1)
+
+            for step in ("fill", "drain", "compact"):
+                if step == "fill":
+                    for key in keys:
+                        hs.insert(key)
+                elif step == "drain":
+                    for key in keys[kept:]:
+                        hs.remove(key)
+                else:
+                    hs.compact()
+                size = (tracemalloc.get_traced_memory()[0] - before) / 1024
+                print(f"{name:<16}{step:<10}{len(hs):>10}{hs._capacity:>10}"
+                      f"{size:>12.1f}")
+            tracemalloc.stop()
+    print(SEP)
+    return
+
+
+def benchmark_counters(n=10 ** 5):
+    """
+    -------------------------------------------------------
+    Times loading n shuffled int keys into a Hash_Set and a
+    Counted_Hash_Set that start with a single slot, then finding
+    every key. Prints the time per key and the stats of each set.
+    Use: benchmark_counters(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = list(range(n))
+    shuffle(keys)
+    print(SEP)
+    print(f"{'version':<18}{'class':<18}{'n':>8}{'insert us':>11}"
+          f"{'find us':>11}")
+    print(SEP)
+
+    for module in (Hash_Set_chained, Hash_Set_open):
+        for cls in (module.Hash_Set, module.Counted_Hash_Set):
+            hs = cls(1)
+            start = perf_counter()
+
+            for key in keys:
+                hs.insert(key)
+            middle = perf_counter()
+
+            for key in keys:
+                hs.find(key)
+            end = perf_counter()
+            print(f"{module.__name__:<18}{cls.__name__:<18}{n:>8}"
+                  f"{(middle - start) / n * 10 ** 6:>11.3f}"
+                  f"{(end - middle) / n * 10 ** 6:>11.3f}")
+
+            for key, value in hs.stats().items():
+                if key == "histogram":
+                    value = " ".join(str(count) for count in value)
+                print(f"  {key:<24}{value}")
+    print(SEP)
+    return
+
+
+def benchmark_adversarial(n=4000, capacity=1001):
+    """
+    -------------------------------------------------------
+    Inserts then finds n int keys chosen to collide in a Hash_Set
+    with capacity slots, for each bucket type and hash function.
+    The "slot" keys are multiples of capacity, so their built-in
+    hashes differ but all land in slot 0. The "hash" keys are
+    multiples of 2 ** 61 - 1, so their built-in hashes are all 0 and
+    no hash function that keeps equal values' hashes equal can
+    separate them. Prints the time taken and the largest slot.
+    Use: benchmark_adversarial(n, capacity)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+        capacity - the number of slots (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    attacks = (("slot", [i * capacity for i in range(n)]),
+               ("hash", [i * (2 ** 61 - 1) for i in range(n)]))
+    print(SEP)
+    print(f"{'bucket':<13}{'hash':<9}{'keys':<6}{'n':>7}{'insert s':>11}"
+          f"{'find s':>11}{'largest slot':>14}")
+    print(SEP)
+
+    for bucket in BUCKETS:
+        for hash_function in (BUILTIN, SEEDED, KEYED):
+            for attack, keys in attacks:
+                hs = Hash_Set_chained.Hash_Set(
+                    capacity, hash_function=hash_function, bucket=bucket)
+                start = perf_counter()
+
+                for key in keys:
+                    hs.insert(key)
+                middle = perf_counter()
+
+                for key in keys:
+                    hs.find(key)
+                end = perf_counter()
+                largest = max(len(slot) for slot in hs._table
+                              if slot is not None)
+                print(f"{bucket:<13}{hash_function:<9}{attack:<6}{n:>7}"
+                      f"{middle - start:>11.3f}{end - middle:>11.3f}"
+                      f"{largest:>14}")
+    print(SEP)
+    return
+
+
+def benchmark_mmap(n=10 ** 6, lookups=10 ** 5):
+    """
+    -------------------------------------------------------
+    Compares building an open addressing Hash_Set of n str keys with
+    insert_many against opening a saved copy of it with open_mmap,
+    then compares lookups in the two. Prints the time taken by each
+    step and the size of the file.
+    Use: benchmark_mmap(n, lookups)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of keys (int)
+        lookups - the number of keys looked up, half of them
+            missing (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    keys = [f"key{i}" for i in range(n)]
+    shuffle(keys)
+    probes = keys[:lookups // 2] + [f"miss{i}" for i in range(lookups // 2)]
+    path = os.path.join(tempfile.mkdtemp(), "keys.hset")
+    print(SEP)
+    start = perf_counter()
+    hs = Hash_Set_open.Hash_Set(1, NONE)
+    hs.insert_many(keys)
+    print(f"build with insert_many {perf_counter() - start:>10.3f} s")
+    start = perf_counter()
+    hs.save(path)
+    print(f"save                   {perf_counter() - start:>10.3f} s"
+          f"   {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+    start = perf_counter()
+    mapped = Hash_Set_open.Hash_Set.open_mmap(path)
+    print(f"open_mmap              {perf_counter() - start:>10.6f} s")
+
+    for name, target in (("in memory", hs), ("memory-mapped", mapped)):
+        start = perf_counter()
+
+        for key in probes:
+            key in target
+        print(f"{name + ' lookup':<23}"
+              f"{(perf_counter() - start) / lookups * 10 ** 6:>10.3f} us")
+    mapped.close()
+    os.remove(path)
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    check_mixed_buckets()
+    benchmark_open()
+    benchmark_buckets()
+    benchmark_rehash_latency()
+    benchmark_hash_calls()
+    benchmark_bulk()
+    benchmark_shrink()
+    benchmark_adversarial()
+    benchmark_counters()
+    benchmark_mmap()
@@ -0,0 +1,410 @@
+"""
+-------------------------------------------------------
+Benchmarks for the linked and skip list List ADTs.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from random import random, randrange
+from time import perf_counter
+
+from Copy_Policy import NONE
+from List_linked import List
+import List_skip
+from Sorts_List_linked import Sorts
+
+# Constants
+SEP = '-' * 72
+
+
+class _Scan_List(List):
+    """
+    -------------------------------------------------------
+    The original nested scan algorithms, kept as a baseline
+    for benchmark_set_ops and benchmark_clean.
+    -------------------------------------------------------
+    """
+
+    def intersection(self, source1, source2):
+        source1_node = source1._front
+
+        while source1_node is not None:
+            value = source1_node._value
+            _, current, _ = source2._linear_search(value)
+
+            if current is not None:
+                _, current, _ = self._linear_search(value)
+
+                if current is None:
+                    self._append(value)
+            source1_node = source1_node._next
+        return
+
+    def union(self, source1, source2):
+        for source in (source1, source2):
+            source_node = source._front
+
+            while source_node is not None:
+                value = source_node._value
+                _, current, _ = self._linear_search(value)
+
+                if current is None:
+                    self._append(value)
+                source_node = source_node._next
+        return
+
+    def clean(self):
+        key_node = self._front
+
+        while key_node is not None:
+            previous = key_node
+            current = key_node._next
+
+            while current is not None:
+                if current._value == key_node._value:
+                    self._count -= 1
+                    previous._next = current._next
+                else:
+                    previous = current
+                current = current._next
+            self._rear = previous
+            key_node = key_node._next
+        return
+
+
+def _make_list(values):
+    """
+    -------------------------------------------------------
+    Returns a List of values that stores references to them.
+    Use: lst = _make_list(values)
+    -------------------------------------------------------
+    Parameters:
+        values - the values to store (list of ?)
+    Returns:
+        lst - a new List (List)
+    -------------------------------------------------------
+    """
+    lst = List(NONE)
+
+    for value in values:
+        lst.append(value)
+    return lst
+
+
+def benchmark_set_ops(sizes=(10 ** 3, 10 ** 4, 10 ** 5), scan_limit=10 ** 4):
+    """
+    -------------------------------------------------------
+    Compares List.intersection and List.union with the original
+    nested scan versions on two lists of n random values drawn from
+    range(n), so both lists hold duplicates and about two thirds of
+    their distinct values in common. Ints are hashable; one element
+    lists are orderable but not hashable; one element sets are
+    neither, as sets are only partly ordered. The nested scans, and
+    the new versions on sets, are O(n^2), so runs larger than
+    scan_limit are skipped. Both versions must return the same
+    values in the same order.
+    Use: benchmark_set_ops(sizes, scan_limit)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of values in each list (tuple of int)
+        scan_limit - largest n given to the nested scans (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'values':<10}{'version':<8}{'n':>9}{'intersection s':>17}"
+          f"{'union s':>12}")
+    print(SEP)
+
+    for n in sizes:
+        ints1 = [randrange(n) for _ in range(n)]
+        ints2 = [randrange(n) for _ in range(n)]
+
+        for kind, values1, values2 in (
+                ("int", ints1, ints2),
+                ("[int]", [[i] for i in ints1], [[i] for i in ints2]),
+                ("{int}", [{i} for i in ints1], [{i} for i in ints2])):
+            source1 = _make_list(values1)
+            source2 = _make_list(values2)
+            expected = None
+
+            for version, cls in (("scan", _Scan_List), ("new", List)):
+                if n > scan_limit and (cls is _Scan_List or kind == "{int}"):
+                    print(f"{kind:<10}{version:<8}{n:>9}  skipped (O(n^2))")
+                else:
+                    times = []
+                    targets = []
+
+                    for method in (cls.intersection, cls.union):
+                        target = cls(NONE)
+                        start = perf_counter()
+                        method(target, source1, source2)
+                        times.append(perf_counter() - start)
+                        targets.append(list(target))
+
+                    if expected is None:
+                        expected = targets
+                    else:
+                        assert targets == expected, f"{kind} {version}"
+                    print(f"{kind:<10}{version:<8}{n:>9}{times[0]:>17.3f}"
+                          f"{times[1]:>12.3f}")
+    print(SEP)
+    return
+
+
+def benchmark_clean(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6),
+                    scan_limit=10 ** 4):
+    """
+    -------------------------------------------------------
+    Compares List.clean with the original nested scan version on a
+    list of n random values drawn from range(n // 2), so more
+    than half of the values are duplicates. Ints are hashable; one
+    element lists are orderable but not hashable; one element sets
+    are neither, as sets are only partly ordered; clean(key) hashes
+    the int in each one element list. The nested scan, and the new
+    version on sets, are O(n^2), so runs larger than scan_limit are
+    skipped. Every version must keep the same values in the same
+    order.
+    Use: benchmark_clean(sizes, scan_limit)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of values in the list (tuple of int)
+        scan_limit - largest n given to the nested scan (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'values':<10}{'version':<8}{'n':>9}{'clean s':>12}"
+          f"{'remaining':>12}")
+    print(SEP)
+
+    for n in sizes:
+        ints = [randrange(n // 2) for _ in range(n)]
+        lists = [[i] for i in ints]
+        sets = [{i} for i in ints]
+        expected = {}
+
+        for kind, version, cls, values, key in (
+                ("int", "scan", _Scan_List, ints, None),
+                ("int", "new", List, ints, None),
+                ("[int]", "scan", _Scan_List, lists, None),
+                ("[int]", "new", List, lists, None),
+                ("[int]", "key", List, lists, lambda value: value[0]),
+                ("{int}", "scan", _Scan_List, sets, None),
+                ("{int}", "new", List, sets, None)):
+            if n > scan_limit and (cls is _Scan_List or kind == "{int}"):
+                print(f"{kind:<10}{version:<8}{n:>9}  skipped (O(n^2))")
+            else:
+                source = cls(NONE)
+
+                for value in values:
+                    source.append(value)
+                start = perf_counter()
+
+                if key is None:
+                    source.clean()
+                else:
+                    source.clean(key)
+                clean_s = perf_counter() - start
+                remaining = list(source)
+                assert expected.setdefault(kind, remaining) == remaining, \
+                    f"{kind} {version}"
+                print(f"{kind:<10}{version:<8}{n:>9}{clean_s:>12.3f}"
+                      f"{len(source):>12}")
+    print(SEP)
+    return
+
+
+def _rebuild_sort(source, key, reverse):
+    """
+    -------------------------------------------------------
+    Sorts source by copying its values to a Python list, sorting
+    the Python list, and building a new List from it.
+    Use: target = _rebuild_sort(source, key, reverse)
+    -------------------------------------------------------
+    Parameters:
+        source - the list to sort (List)
+        key - a function that returns the part of a value to
+            compare, None to compare whole values (function)
+        reverse - True to sort from largest to smallest (bool)
+    Returns:
+        target - a new sorted List (List)
+    -------------------------------------------------------
+    """
+    values = Sorts.to_array(source)
+    values.sort(key=key, reverse=reverse)
+    return _make_list(values)
+
+
+def check_failed_sort(n=10 ** 3):
+    """
+    -------------------------------------------------------
+    Checks that a List.sort that fails leaves the list whole: values
+    that cannot be compared, and a key that fails on a value, must
+    raise their exception but leave the list with all of its values,
+    its count, and a rear that ends the list. Raises AssertionError
+    if they do not.
+    Use: check_failed_sort(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of values in the list (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+
+    def failing_key(value):
+        # Fails on a value found only after some runs are merged.
+        if value == n * 3 // 4:
+            raise ValueError("failing_key")
+        return value
+
+    ints = [randrange(n) for _ in range(n)]
+    ints[n * 3 // 4] = n * 3 // 4
+
+    for kind, values, key, error in (
+            ("int and str", ints[:n // 2] + ["a"] + ints[n // 2:], None,
+             TypeError),
+            ("failing key", ints, failing_key, ValueError)):
+        for reverse in (False, True):
+            source = _make_list(values)
+            failed = False
+
+            try:
+                source.sort(key, reverse)
+            except error:
+                failed = True
+            remaining = Sorts.to_array(source)
+            assert failed, f"{kind}: no exception"
+            assert len(source) == len(values) == len(remaining), kind
+            assert sorted(map(repr, remaining)) == sorted(map(repr, values)), \
+                kind
+            assert source._rear._next is None and \
+                source._rear._value is remaining[-1], kind
+    print(f"failed sorts of {n} values leave the list whole")
+    return
+
+
+def benchmark_sort(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)):
+    """
+    -------------------------------------------------------
+    Compares List.sort, which relinks the nodes in place, with
+    copying the values to a Python list, sorting it, and building a
+    new List. Sorts n random floats, the same floats in reverse, and
+    (int, float) pairs by their int with a key, which keeps equal
+    keys in their original order.
+    Use: benchmark_sort(sizes)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of values in the list (tuple of int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'values':<16}{'n':>9}{'rebuild s':>12}{'sort s':>12}")
+    print(SEP)
+
+    for n in sizes:
+        floats = [random() for _ in range(n)]
+        pairs = [(randrange(100), value) for value in floats]
+
+        for kind, values, key, reverse in (
+                ("float", floats, None, False),
+                ("float reverse", floats, None, True),
+                ("pair key", pairs, lambda pair: pair[0], False)):
+            source = _make_list(values)
+            start = perf_counter()
+            target = _rebuild_sort(source, key, reverse)
+            rebuild_s = perf_counter() - start
+            start = perf_counter()
+            source.sort(key, reverse)
+            sort_s = perf_counter() - start
+            assert Sorts.to_array(source) == Sorts.to_array(target)
+            print(f"{kind:<16}{n:>9}{rebuild_s:>12.3f}{sort_s:>12.3f}")
+    print(SEP)
+    return
+
+
+def benchmark_random_index(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6),
+                           ops=10 ** 4, linked_limit=10 ** 5):
+    """
+    -------------------------------------------------------
+    Compares positional access on the linked List, which walks
+    from the front, O(i), with the skip list List, O(log n).
+    Builds a list of n values, then times ops of each of l[i],
+    l[i] = value, insert(i, value), and pop(i) at random indexes.
+    Runs of the linked List larger than linked_limit are skipped.
+    Use: benchmark_random_index(sizes, ops, linked_limit)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of values in the list (tuple of int)
+        ops - the number of each operation to time (int)
+        linked_limit - largest n given to the linked List (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'version':<8}{'n':>9}{'build s':>10}{'get us':>10}"
+          f"{'set us':>10}{'insert us':>11}{'pop us':>10}")
+    print(SEP)
+
+    for n in sizes:
+        indexes = [randrange(n) for _ in range(ops)]
+
+        for version, cls in (("linked", List), ("skip", List_skip.List)):
+            if cls is List and n > linked_limit:
+                print(f"{version:<8}{n:>9}  skipped (O(n) per operation)")
+            else:
+                start = perf_counter()
+                source = cls(NONE)
+
+                for value in range(n):
+                    source.append(value)
+                build_s = perf_counter() - start
+                times = []
+                start = perf_counter()
+
+                for i in indexes:
+                    source[i]
+                times.append(perf_counter() - start)
+                start = perf_counter()
+
+                for i in indexes:
+                    source[i] = i
+                times.append(perf_counter() - start)
+                start = perf_counter()
+
+                for i in indexes:
+                    source.insert(i, i)
+                times.append(perf_counter() - start)
+                start = perf_counter()
+
+                for i in indexes:
+                    source.pop(i)
+                times.append(perf_counter() - start)
+                print(f"{version:<8}{n:>9}{build_s:>10.3f}"
+                      f"{times[0] / ops * 1e6:>10.2f}"
+                      f"{times[1] / ops * 1e6:>10.2f}"
+                      f"{times[2] / ops * 1e6:>11.2f}"
+                      f"{times[3] / ops * 1e6:>10.2f}")
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    check_failed_sort()
+    benchmark_set_ops()
+    benchmark_clean()
+    benchmark_sort()
+    benchmark_random_index()
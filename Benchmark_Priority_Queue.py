@@ -0,0 +1,96 @@
+"""
+-------------------------------------------------------
+Benchmarks for the Priority Queue ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from random import random
+from time import perf_counter
+
+from Copy_Policy import NONE
+import Priority_Queue_array
+import Priority_Queue_linked
+
+# Constants
+SEP = '-' * 68
+
+
+def _insert_remove(pq, values):
+    """
+    -------------------------------------------------------
+    Inserts every value into pq, then removes them all.
+    Use: insert_s, remove_s = _insert_remove(pq, values)
+    -------------------------------------------------------
+    Parameters:
+        pq - an empty priority queue (Priority_Queue)
+        values - the values to insert (list of ?)
+    Returns:
+        insert_s - seconds spent inserting (float)
+        remove_s - seconds spent removing (float)
+    -------------------------------------------------------
+    """
+    start = perf_counter()
+
+    for value in values:
+        pq.insert(value)
+
+    middle = perf_counter()
+
+    while not pq.is_empty():
+        pq.remove()
+
+    end = perf_counter()
+    return middle - start, end - middle
+
+
+def benchmark_priority_queue(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6),
+                             linked_limit=10 ** 4):
+    """
+    -------------------------------------------------------
+    Compares the linked and heap (array) priority queues on random
+    priorities. Prints the time to insert then remove n values, and
+    the time to build the heap from n values in one step. The linked
+    insert is O(n), so linked runs larger than linked_limit are skipped.
+    Use: benchmark_priority_queue(sizes)
+    -------------------------------------------------------
+    Parameters:
+        sizes - the numbers of values to test (tuple of int)
+        linked_limit - largest n given to the linked queue (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    print(SEP)
+    print(f"{'version':<10}{'n':>9}{'insert s':>12}{'remove s':>12}"
+          f"{'heapify s':>12}")
+    print(SEP)
+
+    for n in sizes:
+        values = [random() for _ in range(n)]
+
+        if n > linked_limit:
+            print(f"{'linked':<10}{n:>9}  skipped (O(n^2))")
+        else:
+            insert_s, remove_s = _insert_remove(
+                Priority_Queue_linked.Priority_Queue(NONE), values)
+            print(f"{'linked':<10}{n:>9}{insert_s:>12.3f}{remove_s:>12.3f}")
+
+        insert_s, remove_s = _insert_remove(
+            Priority_Queue_array.Priority_Queue(NONE), values)
+        start = perf_counter()
+        Priority_Queue_array.Priority_Queue(NONE, values)
+        heapify_s = perf_counter() - start
+        print(f"{'heap':<10}{n:>9}{insert_s:>12.3f}{remove_s:>12.3f}"
+              f"{heapify_s:>12.3f}")
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    benchmark_priority_queue()
@@ -0,0 +1,122 @@
+"""
+-------------------------------------------------------
+Benchmarks for the value copy policies of the linked
+data structures.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from functools import total_ordering
+from time import perf_counter
+
+from BST_linked import AVL
+from Copy_Policy import DEEP, SHALLOW, NONE
+from Deque_linked import Deque
+from List_linked import List
+from Priority_Queue_linked import Priority_Queue
+from Queue_linked import Queue
+from Sorted_List_linked import Sorted_List
+from Stack_linked import Stack
+
+# Constants
+SEP = '-' * 60
+POLICIES = (DEEP, SHALLOW, NONE)
+
+
+@total_ordering
+class _Record:
+    """
+    -------------------------------------------------------
+    A dict-shaped record. Records compare by key so that they
+    can be stored in the ordered containers.
+    Use: record = _Record(i)
+    -------------------------------------------------------
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.data = {"id": key, "name": f"user{key}", "tags": ["a", "b"],
+                     "scores": [key, key + 1, key + 2]}
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def _fill(container, add, read, records):
+    """
+    -------------------------------------------------------
+    Adds every record to container, then reads every record back.
+    Use: _fill(container, add, read, records)
+    -------------------------------------------------------
+    Parameters:
+        container - an empty container (?)
+        add - name of the method that stores a value (str)
+        read - function(container, record) that reads a value (function)
+        records - the values to store (list of _Record)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    add = getattr(container, add)
+
+    for record in records:
+        add(record)
+
+    for record in records:
+        read(container, record)
+    return
+
+
+def benchmark_copy(n=10 ** 4):
+    """
+    -------------------------------------------------------
+    Stores and reads back n dict-shaped records in each linked
+    container under each copy policy. Prints the throughput in
+    operations (stores plus reads) per second.
+    Use: benchmark_copy(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of records (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    records = [_Record(i) for i in range(n)]
+    # Keyed reads on the ordered containers would dominate the time,
+    # so the lists and queues read at the front.
+    containers = (
+        ("List", List, "append", lambda c, r: c.peek()),
+        ("Sorted_List", Sorted_List, "insert", lambda c, r: c.peek()),
+        ("Queue", Queue, "insert", lambda c, r: c.peek()),
+        ("Stack", Stack, "push", lambda c, r: c.peek()),
+        ("Deque", Deque, "insert_rear", lambda c, r: c.peek_front()),
+        ("Priority_Queue", Priority_Queue, "insert", lambda c, r: c.peek()),
+        ("AVL", AVL, "insert", lambda c, r: c.retrieve(r)),
+    )
+    print(SEP)
+    print(f"{'container':<16}" + "".join(f"{p + ' ops/s':>14}" for p in POLICIES))
+    print(SEP)
+
+    for name, cls, add, read in containers:
+        line = f"{name:<16}"
+
+        for copy_policy in POLICIES:
+            start = perf_counter()
+            _fill(cls(copy_policy), add, read, records)
+            seconds = perf_counter() - start
+            line += f"{2 * n / seconds:>14,.0f}"
+        print(line)
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    benchmark_copy()
@@ -0,0 +1,159 @@
+"""
+-------------------------------------------------------
+Memory benchmarks for the linked data structures.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+import tracemalloc
+from random import shuffle
+
+import BST_linked
+from BST_linked import BST
+from Copy_Policy import NONE
+import Deque_linked
+from Deque_linked import Deque
+import List_linked
+from List_linked import List
+import List_unrolled
+import Priority_Queue_linked
+from Priority_Queue_linked import Priority_Queue
+import Queue_linked
+from Queue_linked import Queue
+import Queue_unrolled
+import Sorted_List_linked
+from Sorted_List_linked import Sorted_List
+import Stack_linked
+from Stack_linked import Stack
+import Stack_unrolled
+
+# Constants
+SEP = '-' * 56
+
+
+def _bytes_per_element(cls, add, values):
+    """
+    -------------------------------------------------------
+    Measures the memory allocated by a container of type cls while
+    values are added to it. The values are created before measuring
+    and are stored by reference, so only the container is counted.
+    Use: size = _bytes_per_element(cls, add, values)
+    -------------------------------------------------------
+    Parameters:
+        cls - a container class (class)
+        add - name of the method that stores a value (str)
+        values - the values to store (list of ?)
+    Returns:
+        size - bytes allocated per stored value (float)
+    -------------------------------------------------------
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = cls(NONE)
+    add = getattr(container, add)
+
+    for value in values:
+        add(value)
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(values)
+
+
+def _bytes_per_element_without_slots(module, node, cls, add, values):
+    """
+    -------------------------------------------------------
+    Measures the memory allocated per value as _bytes_per_element
+    does, with the node class of module replaced by a copy that has
+    no __slots__, so that each node stores its attributes in a
+    __dict__: the node layout before __slots__ was added.
+    Use: size = _bytes_per_element_without_slots(module, node, cls,
+        add, values)
+    -------------------------------------------------------
+    Parameters:
+        module - the module that defines cls (module)
+        node - the name of the node class in module (str)
+        cls - a container class (class)
+        add - name of the method that stores a value (str)
+        values - the values to store (list of ?)
+    Returns:
+        size - bytes allocated per stored value (float)
+    -------------------------------------------------------
+    """
+    node_class = getattr(module, node)
+    namespace = {}
+
+    for name, attribute in vars(node_class).items():
+        # Leave out __slots__ and the descriptors it creates.
+        if name != '__slots__' and name not in node_class.__slots__:
+            namespace[name] = attribute
+
+    setattr(module, node, type(node, (), namespace))
+
+    try:
+        size = _bytes_per_element(cls, add, values)
+    finally:
+        setattr(module, node, node_class)
+    return size
+
+
+def benchmark_memory(n=10 ** 5):
+    """
+    -------------------------------------------------------
+    Prints the bytes allocated per element by each linked container
+    holding n values, with the nodes laid out with __slots__ as they
+    are now, and with a __dict__ per node as they were before. The
+    unrolled containers have no earlier layout to compare with.
+    Use: benchmark_memory(n)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of values to store (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    values = list(range(n))
+    # The BST is filled in random order so that it stays shallow.
+    bst_values = values[:]
+    shuffle(bst_values)
+    containers = (
+        ("List", List, "append", values, List_linked, "_List_Node"),
+        ("List_unrolled", List_unrolled.List, "append", values, None, None),
+        ("Sorted_List", Sorted_List, "insert", values, Sorted_List_linked,
+         "_SL_Node"),
+        ("Queue", Queue, "insert", values, Queue_linked, "_Queue_Node"),
+        ("Queue_unrolled", Queue_unrolled.Queue, "insert", values, None,
+         None),
+        ("Stack", Stack, "push", values, Stack_linked, "_Stack_Node"),
+        ("Stack_unrolled", Stack_unrolled.Stack, "push", values, None,
+         None),
+        ("Deque", Deque, "insert_rear", values, Deque_linked, "_Deque_Node"),
+        ("Priority_Queue", Priority_Queue, "insert", values,
+         Priority_Queue_linked, "_PQ_Node"),
+        ("BST", BST, "insert", bst_values, BST_linked, "_BST_Node"),
+    )
+    print(SEP)
+    print(f"{'container':<16}{'n':>10}{'dict bytes':>15}"
+          f"{'slots bytes':>15}")
+    print(SEP)
+
+    for name, cls, add, data, module, node in containers:
+        size = _bytes_per_element(cls, add, data)
+
+        if module is None:
+            print(f"{name:<16}{n:>10}{'-':>15}{size:>15.1f}")
+        else:
+            before = _bytes_per_element_without_slots(module, node, cls,
+                                                      add, data)
+            print(f"{name:<16}{n:>10}{before:>15.1f}{size:>15.1f}")
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    benchmark_memory()
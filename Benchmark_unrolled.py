@@ -0,0 +1,115 @@
+"""
+-------------------------------------------------------
+Benchmarks for the unrolled List, Queue, and Stack against
+the linked versions that store one value per node.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from time import perf_counter
+
+from Benchmark_memory import _bytes_per_element
+from Copy_Policy import NONE
+import List_linked
+import List_unrolled
+import Queue_linked
+import Queue_unrolled
+import Stack_linked
+import Stack_unrolled
+
+# Constants
+SEP = '-' * 72
+# name, linked class, unrolled class, add method, remove method
+CONTAINERS = (
+    ("List", List_linked.List, List_unrolled.List, "append",
+     "remove_front"),
+    ("Queue", Queue_linked.Queue, Queue_unrolled.Queue, "insert", "remove"),
+    ("Stack", Stack_linked.Stack, Stack_unrolled.Stack, "push", "pop"),
+)
+
+
+def _throughput(cls, add, remove, values, passes):
+    """
+    -------------------------------------------------------
+    Times filling a container of type cls with values, iterating
+    over it passes times, and removing every value.
+    Use: add_s, iterate_s, remove_s = _throughput(cls, add, remove,
+        values, passes)
+    -------------------------------------------------------
+    Parameters:
+        cls - a container class (class)
+        add - name of the method that stores a value (str)
+        remove - name of the method that removes a value (str)
+        values - the values to store (list of ?)
+        passes - the number of times to iterate (int)
+    Returns:
+        add_s - seconds spent adding (float)
+        iterate_s - seconds per pass of iteration (float)
+        remove_s - seconds spent removing (float)
+    -------------------------------------------------------
+    """
+    container = cls(NONE)
+    add = getattr(container, add)
+    remove = getattr(container, remove)
+    start = perf_counter()
+
+    for value in values:
+        add(value)
+
+    add_s = perf_counter() - start
+    start = perf_counter()
+
+    for _ in range(passes):
+        for _ in container:
+            pass
+
+    iterate_s = (perf_counter() - start) / passes
+    start = perf_counter()
+
+    for _ in values:
+        remove()
+
+    remove_s = perf_counter() - start
+    return add_s, iterate_s, remove_s
+
+
+def benchmark_unrolled(n=10 ** 6, passes=5):
+    """
+    -------------------------------------------------------
+    Compares each linked container with its unrolled version holding
+    n values. Prints the bytes allocated per value, the time to add
+    n values, the values iterated per second, and the time to
+    remove n values.
+    Use: benchmark_unrolled(n, passes)
+    -------------------------------------------------------
+    Parameters:
+        n - the number of values to store (int)
+        passes - the number of iterations to average (int)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    values = list(range(n))
+    print(SEP)
+    print(f"{'container':<10}{'layout':<10}{'bytes/value':>12}{'add s':>10}"
+          f"{'iterate M/s':>13}{'remove s':>10}")
+    print(SEP)
+
+    for name, linked, unrolled, add, remove in CONTAINERS:
+        for layout, cls in (("linked", linked), ("unrolled", unrolled)):
+            size = _bytes_per_element(cls, add, values)
+            add_s, iterate_s, remove_s = _throughput(cls, add, remove,
+                                                     values, passes)
+            print(f"{name:<10}{layout:<10}{size:>12.1f}{add_s:>10.3f}"
+                  f"{n / iterate_s / 1e6:>13.1f}{remove_s:>10.3f}")
+    print(SEP)
+    return
+
+
+if __name__ == "__main__":
+    benchmark_unrolled()
@@ -0,0 +1,66 @@
+"""
+-------------------------------------------------------
+Value copy policies for the linked data structures.
+Every container copies values as they are stored and as they
+are returned by its read operations (peek, find, retrieve, etc.)
+according to the copy policy given to its constructor:
+    DEEP - values are deep copied (the default)
+    SHALLOW - values are shallow copied
+    NONE - values are not copied: the container stores and returns
+        references to the caller's values, which must not be
+        changed while they are stored
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from copy import copy, deepcopy
+
+# Constants
+DEEP = "deep"
+SHALLOW = "shallow"
+NONE = "none"
+
+
+def copier(copy_policy):
+    """
+    -------------------------------------------------------
+    Returns the function that copies a value under copy_policy.
+    Use: self._copy = copier(copy_policy)
+    -------------------------------------------------------
+    Parameters:
+        copy_policy - one of DEEP, SHALLOW, or NONE (str)
+    Returns:
+        func - a function that takes a value and returns the value
+            to store or return (function)
+    -------------------------------------------------------
+    """
+    assert copy_policy in (DEEP, SHALLOW, NONE), \
+        f"Invalid copy policy: {copy_policy}"
+
+    if copy_policy == DEEP:
+        func = deepcopy
+    elif copy_policy == SHALLOW:
+        func = copy
+    else:
+        func = _no_copy
+    return func
+
+
+def _no_copy(value):
+    """
+    -------------------------------------------------------
+    Returns value itself. Used by the NONE copy policy.
+    Use: value = _no_copy(value)
+    -------------------------------------------------------
+    Parameters:
+        value - a data element (?)
+    Returns:
+        value - the same data element (?)
+    -------------------------------------------------------
+    """
+    return value
@@ -12,10 +12,11 @@ __updated__ = "2022-03-07"
 # pylint: disable=protected-access
 
 # Imports
-from copy import deepcopy
+from Copy_Policy import DEEP, copier
 
 
 class _Deque_Node:
+    __slots__ = ('_value', '_prev', '_next')
 
     def __init__(self, value, _prev, _next):
         """
@@ -32,19 +33,22 @@ class _Deque_Node:
 
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._prev = _prev
         self._next = _next
 
 
 class Deque:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty deque.
         Use: d = Deque()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             a new Deque object (Deque)
         -------------------------------------------------------
@@ -52,6 +56,8 @@ class Deque:
         self._front = None
         self._rear = None
         self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
 
     def is_empty(self):
         """
@@ -89,7 +95,7 @@ class Deque:
             None
         -------------------------------------------------------
         """
-        node = _Deque_Node(value, None, self._front)
+        node = _Deque_Node(self._copy(value), None, self._front)
 
         if self._front is None:
             self._rear = node
@@ -111,7 +117,7 @@ class Deque:
             None
         -------------------------------------------------------
         """
-        node = _Deque_Node(value, self._rear, None)
+        node = _Deque_Node(self._copy(value), self._rear, None)
 
         if self._rear is None:
             self._front = node
@@ -177,7 +183,7 @@ class Deque:
         """
         assert self._front is not None, "Cannot peek at an empty deque"
 
-        return deepcopy(self._front._value)
+        return self._copy(self._front._value)
 
     def peek_rear(self):
         """
@@ -191,7 +197,7 @@ class Deque:
         """
         assert self._rear is not None, "Cannot peek at an empty deque"
 
-        return deepcopy(self._rear._value)
+        return self._copy(self._rear._value)
 
     def _swap(self, l, r):
         """
@@ -279,7 +285,7 @@ class Deque:
             if max_node._value < curr._value:
                 max_node = curr
             curr = curr._next
-        return deepcopy(max_node._value)
+        return self._copy(max_node._value)
 
     def min(self):
         """
@@ -300,7 +306,7 @@ class Deque:
             if min_node._value > curr._value:
                 min_node = curr
             curr = curr._next
-        return deepcopy(min_node._value)
+        return self._copy(min_node._value)
 
     def __iter__(self):
         """
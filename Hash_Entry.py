@@ -0,0 +1,173 @@
+"""
+-------------------------------------------------------
+Hash Set entry: a value stored with its hash.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from copy import deepcopy
+
+
+class Hash_Entry:
+    """
+    -------------------------------------------------------
+    A value and its hash, computed once when the entry is created.
+    Entries are ordered by hash first and by value only when the
+    hashes are equal, so most comparisons between entries compare
+    two ints, and entries with different hashes are never equal.
+    -------------------------------------------------------
+    """
+    __slots__ = ('_hash', '_value')
+
+    def __init__(self, value, hashkey=None):
+        """
+        -------------------------------------------------------
+        Initializes an entry containing value.
+        Use: entry = Hash_Entry(value)
+        Use: entry = Hash_Entry(value, hashkey)
+        -------------------------------------------------------
+        Parameters:
+            value - a hashable data element (?)
+            hashkey - hash(value), computed if not given (int)
+        Returns:
+            A Hash_Entry object (Hash_Entry)
+        -------------------------------------------------------
+        """
+        if hashkey is None:
+            hashkey = hash(value)
+        self._hash = hashkey
+        self._value = value
+
+    def __hash__(self):
+        """
+        -------------------------------------------------------
+        Returns the stored hash of the entry value.
+        Use: h = hash(entry)
+        -------------------------------------------------------
+        Returns:
+            the hash of the entry value (int)
+        -------------------------------------------------------
+        """
+        return self._hash
+
+    def __eq__(self, other):
+        """
+        -------------------------------------------------------
+        Compares two entries for equality. The values are only
+        compared if the hashes are equal.
+        Use: b = entry == other
+        -------------------------------------------------------
+        Parameters:
+            other - another entry (Hash_Entry)
+        Returns:
+            True if the entries have equal values, False otherwise (bool)
+        -------------------------------------------------------
+        """
+        return self._hash == other._hash and self._value == other._value
+
+    def __lt__(self, other):
+        """
+        -------------------------------------------------------
+        Determines if this entry comes before other.
+        Use: b = entry < other
+        -------------------------------------------------------
+        Parameters:
+            other - another entry (Hash_Entry)
+        Returns:
+            True if this entry has the smaller hash, or the same hash
+                and the smaller value, False otherwise (bool)
+        -------------------------------------------------------
+        """
+        return self._hash < other._hash or \
+            (self._hash == other._hash and self._value < other._value)
+
+    def __le__(self, other):
+        """
+        -------------------------------------------------------
+        Determines if this entry comes before or is equal to other.
+        Use: b = entry <= other
+        -------------------------------------------------------
+        Parameters:
+            other - another entry (Hash_Entry)
+        Returns:
+            True if this entry is less than or equal to other,
+                False otherwise (bool)
+        -------------------------------------------------------
+        """
+        return self._hash < other._hash or \
+            (self._hash == other._hash and self._value <= other._value)
+
+    def __gt__(self, other):
+        """
+        -------------------------------------------------------
+        Determines if this entry comes after other.
+        Use: b = entry > other
+        -------------------------------------------------------
+        Parameters:
+            other - another entry (Hash_Entry)
+        Returns:
+            True if this entry has the larger hash, or the same hash
+                and the larger value, False otherwise (bool)
+        -------------------------------------------------------
+        """
+        return self._hash > other._hash or \
+            (self._hash == other._hash and self._value > other._value)
+
+    def __ge__(self, other):
+        """
+        -------------------------------------------------------
+        Determines if this entry comes after or is equal to other.
+        Use: b = entry >= other
+        -------------------------------------------------------
+        Parameters:
+            other - another entry (Hash_Entry)
+        Returns:
+            True if this entry is greater than or equal to other,
+                False otherwise (bool)
+        -------------------------------------------------------
+        """
+        return self._hash > other._hash or \
+            (self._hash == other._hash and self._value >= other._value)
+
+    def __copy__(self):
+        """
+        -------------------------------------------------------
+        Returns a shallow copy of the entry. The value is shared.
+        Use: entry = copy(entry)
+        -------------------------------------------------------
+        Returns:
+            a new entry with the same value and hash (Hash_Entry)
+        -------------------------------------------------------
+        """
+        return Hash_Entry(self._value, self._hash)
+
+    def __deepcopy__(self, memo):
+        """
+        -------------------------------------------------------
+        Returns a deep copy of the entry. The stored hash is reused
+        rather than computed again.
+        Use: entry = deepcopy(entry)
+        -------------------------------------------------------
+        Parameters:
+            memo - the deepcopy memo (dict)
+        Returns:
+            a new entry with a deep copy of the value (Hash_Entry)
+        -------------------------------------------------------
+        """
+        return Hash_Entry(deepcopy(self._value, memo), self._hash)
+
+    def __str__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Returns the entry value as a string - for debugging.
+        -------------------------------------------------------
+        """
+        return str(self._value)
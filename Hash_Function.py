@@ -0,0 +1,99 @@
+"""
+-------------------------------------------------------
+Hash functions for the Hash Set ADT.
+A hash set hashes its values with the hash function given to its
+constructor:
+    BUILTIN - Python's hash (the default)
+    SEEDED - Python's hash mixed with a random seed chosen when
+        this module is imported, so the slot a value lands in
+        cannot be predicted from its built-in hash
+    KEYED - BLAKE2b keyed with a random key chosen when this module
+        is imported. str and bytes values are hashed from their
+        contents, so keys chosen to collide cannot be found without
+        the key. Other values are hashed from their built-in hash,
+        so that values that are equal keep equal hashes
+The seed and key are shared by every hash set in a process, so two
+hash sets with the same hash function store the same hashes.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from hashlib import blake2b
+from os import urandom
+
+# Constants
+BUILTIN = "builtin"
+SEEDED = "seeded"
+KEYED = "keyed"
+
+_SEED = int.from_bytes(urandom(8), "little")
+_KEY = urandom(16)
+
+
+def hasher(hash_function):
+    """
+    -------------------------------------------------------
+    Returns the function that hashes a value under hash_function.
+    Use: self._hash = hasher(hash_function)
+    -------------------------------------------------------
+    Parameters:
+        hash_function - one of BUILTIN, SEEDED, or KEYED (str)
+    Returns:
+        func - a function that takes a value and returns its
+            hash (function)
+    -------------------------------------------------------
+    """
+    assert hash_function in (BUILTIN, SEEDED, KEYED), \
+        f"Invalid hash function: {hash_function}"
+
+    if hash_function == BUILTIN:
+        func = hash
+    elif hash_function == SEEDED:
+        func = _seeded_hash
+    else:
+        func = _keyed_hash
+    return func
+
+
+def _seeded_hash(value):
+    """
+    -------------------------------------------------------
+    Returns the built-in hash of value mixed with the module seed.
+    Used by the SEEDED hash function.
+    Use: h = _seeded_hash(value)
+    -------------------------------------------------------
+    Parameters:
+        value - a hashable data element (?)
+    Returns:
+        h - the hash of value (int)
+    -------------------------------------------------------
+    """
+    return hash((_SEED, value))
+
+
+def _keyed_hash(value):
+    """
+    -------------------------------------------------------
+    Returns the keyed BLAKE2b hash of value. Used by the KEYED
+    hash function.
+    Use: h = _keyed_hash(value)
+    -------------------------------------------------------
+    Parameters:
+        value - a hashable data element (?)
+    Returns:
+        h - the hash of value (int)
+    -------------------------------------------------------
+    """
+    if isinstance(value, str):
+        data = b"s" + value.encode("utf-8", "surrogatepass")
+    elif isinstance(value, bytes):
+        data = b"b" + value
+    else:
+        data = b"h" + hash(value).to_bytes(8, "little", signed=True)
+    return int.from_bytes(blake2b(data, digest_size=8, key=_KEY).digest(),
+                          "little", signed=True)
@@ -0,0 +1,1395 @@
+"""
+-------------------------------------------------------
+Chained version of the Hash Set ADT. Each slot of the table holds
+the values that hash to it in a bucket: a linked List, a linked
+Sorted_List, a BST, or an AVL tree, chosen when the Hash_Set is
+created.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=W0212
+
+# Imports
+from functools import partial
+from time import perf_counter
+
+from BST_linked import AVL, BST
+from Copy_Policy import DEEP, NONE, copier
+from Hash_Entry import Hash_Entry
+from Hash_Function import BUILTIN, hasher
+import Hash_Set_mmap
+from List_linked import List
+from Sorted_List_linked import Sorted_List
+
+# Constants
+SEP = '-' * 40
+# Bucket types: the data structure that holds the values of a slot.
+LIST_BUCKET = "list"
+SORTED_LIST_BUCKET = "sorted list"
+BST_BUCKET = "bst"
+AVL_BUCKET = "avl"
+# For each bucket type, the function that creates an empty slot, the
+# function that adds an entry to a slot, the function that returns
+# the entry in a slot matching a key, and the function that iterates
+# through the entries of a slot. Tree slots are iterated in inorder.
+# Slots store and return entries without copying them: the Hash_Set
+# copies values by its own copy policy when they are inserted and found.
+_BUCKETS = {
+    LIST_BUCKET: (partial(List, NONE), List.append, List.find,
+                  List.__iter__),
+    SORTED_LIST_BUCKET: (partial(Sorted_List, NONE), Sorted_List.insert,
+                         Sorted_List.find, Sorted_List.__iter__),
+    BST_BUCKET: (partial(BST, NONE), BST.insert, BST.retrieve,
+                 BST.iter_inorder),
+    AVL_BUCKET: (partial(AVL, NONE), AVL.insert, AVL.retrieve,
+                 AVL.iter_inorder),
+}
+
+
+class _Counted_Entry(Hash_Entry):
+    """
+    -------------------------------------------------------
+    An entry used by a Counted_Hash_Set to look up a key. Each
+    comparison adds one to the comparison counter of the set.
+    Since it is a subclass of Hash_Entry, Python calls its
+    comparison methods on either side of a comparison with a
+    stored entry.
+    Use: entry = _Counted_Entry(entry, hs)
+    -------------------------------------------------------
+    """
+    __slots__ = ('_hs',)
+    __hash__ = Hash_Entry.__hash__
+
+    def __init__(self, entry, hs):
+        super().__init__(entry._value, entry._hash)
+        self._hs = hs
+
+    def __eq__(self, other):
+        self._hs._comparisons += 1
+        return Hash_Entry.__eq__(self, other)
+
+    def __lt__(self, other):
+        self._hs._comparisons += 1
+        return Hash_Entry.__lt__(self, other)
+
+    def __le__(self, other):
+        self._hs._comparisons += 1
+        return Hash_Entry.__le__(self, other)
+
+    def __gt__(self, other):
+        self._hs._comparisons += 1
+        return Hash_Entry.__gt__(self, other)
+
+    def __ge__(self, other):
+        self._hs._comparisons += 1
+        return Hash_Entry.__ge__(self, other)
+
+
+class Hash_Set:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    # Default maximum number of values per slot.
+    _LOAD_FACTOR = 20
+    # Number of values (or empty slots) moved to the new table by each
+    # insert and remove during an incremental rehash.
+    _REHASH_STEP = 2
+    # The table shrinks when it holds fewer than load factor divided
+    # by this many values per slot. The gap keeps it from growing and
+    # shrinking over and over.
+    _SHRINK_DIVISOR = 4
+
+    def __init__(self, capacity, copy_policy=DEEP, hash_function=BUILTIN,
+                 incremental=True, bucket=AVL_BUCKET,
+                 load_factor=_LOAD_FACTOR):
+        """
+        -------------------------------------------------------
+        Initializes an empty Hash_Set of size slots. A slot that
+        holds k values costs O(k) to search with LIST_BUCKET or
+        SORTED_LIST_BUCKET, O(k) in the worst case with BST_BUCKET,
+        and O(log k) with AVL_BUCKET. With AVL_BUCKET and the KEYED
+        hash function, keys chosen to land in one slot cost at most
+        O(log n) each. The first parameters are those of the open
+        Hash_Set, in the same order, so either can be built from the
+        same arguments.
+        Use: hs = Hash_Set(slots)
+        Use: hs = Hash_Set(slots, copy_policy, hash_function,
+            incremental, bucket, load_factor)
+        -------------------------------------------------------
+        Parameter:
+            capacity - size of initial table in Hash Set  (int > 0)
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+            hash_function - how values are hashed: BUILTIN, SEEDED,
+                or KEYED from Hash_Function (str)
+            incremental - True to move the values to a larger table a
+                few slots at a time as values are inserted and removed,
+                False to move them all at once (boolean)
+            bucket - the data structure of each slot: LIST_BUCKET,
+                SORTED_LIST_BUCKET, BST_BUCKET, or AVL_BUCKET (str)
+            load_factor - the table grows when it holds more than this
+                many values per slot (number > 0)
+        Returns:
+            A new Hash_Set object (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert bucket in _BUCKETS, f"Invalid bucket type: {bucket}"
+        assert load_factor > 0, "Load factor must be > 0"
+
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+        self._bucket = bucket
+        self._new_slot, self._slot_add, self._slot_find, \
+            self._slot_entries = _BUCKETS[bucket]
+        self._hash_function = hash_function
+        self._hash = hasher(hash_function)
+        self._load_factor = load_factor
+        self._shrink_factor = load_factor / Hash_Set._SHRINK_DIVISOR
+        self._capacity = capacity
+        # The table never shrinks below its initial size.
+        self._min_capacity = capacity
+        # Slots are created by _add_entry when first used.
+        self._table = [None] * self._capacity
+        self._count = 0
+        self._incremental = incremental
+        # The table being moved into self._table during a rehash, and
+        # the number of its slots that have been moved.
+        self._old_table = None
+        self._old_capacity = 0
+        self._moved = 0
+        # Number of rehashes started. The other counters are only kept
+        # by a Counted_Hash_Set.
+        self._rehashes = 0
+        self._lookups = 0
+        self._comparisons = 0
+        self._rehash_time = 0.0
+        return
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the Hash Set.
+        Use: n = len(hs)
+        -------------------------------------------------------
+        Returns:
+            the number of values in the Hash Set.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the Hash Set is empty.
+        Use: b = hs.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if the Hash Set is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def _find_position(self, entry):
+        """
+        -------------------------------------------------------
+        Returns the table and the index of the slot for an entry.
+        During a rehash, an entry whose old slot has not been moved
+        yet is still in the old table. Uses the hash stored in entry.
+        The slot itself is not created: only _add_entry creates slots.
+        Use: table, i = hs._find_position(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a key (Hash_Entry)
+        Returns:
+            table - self._table or self._old_table (list)
+            i - the index of the slot for entry in table (int)
+        -------------------------------------------------------
+        """
+        hashkey = entry._hash
+        table = self._table
+        i = hashkey % self._capacity
+
+        if self._old_table is not None:
+            old_i = hashkey % self._old_capacity
+
+            if old_i == self._moved:
+                # The entry's old slot is partly moved: finish moving it.
+                self._move_slot()
+            elif old_i > self._moved:
+                table = self._old_table
+                i = old_i
+        return table, i
+
+    def _find_entry(self, entry):
+        """
+        ---------------------------------------------------------
+        Returns the stored entry matching entry. Does not change the
+        table: no slot is created or moved, so it can be called while
+        iterating through the entries of the Hash Set.
+        Use: entry = self._find_entry(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a key (Hash_Entry)
+        Returns:
+            found - the stored entry matching entry, None if there
+                is none (Hash_Entry)
+        -------------------------------------------------------
+        """
+        hashkey = entry._hash
+        slot = self._table[hashkey % self._capacity]
+
+        if slot is None:
+            found = None
+        else:
+            found = self._slot_find(slot, entry)
+
+        if found is None and self._old_table is not None:
+            old_i = hashkey % self._old_capacity
+
+            if old_i >= self._moved:
+                # The key may not have been moved yet.
+                slot = self._old_table[old_i]
+
+                if slot is not None:
+                    found = self._slot_find(slot, entry)
+        return found
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the Hash Set contains key.
+        Use: b = key in hs
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+        Returns:
+            True if the Hash Set contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._contains_entry(Hash_Entry(key, self._hash(key)))
+
+    def insert(self, value):
+        """
+        ---------------------------------------------------------
+        Inserts a copy of value into the Hash Set, allows only one copy
+        of value. Calls _rehash if the Hash Set load factor is exceeded.
+        Use: inserted = hs.insert(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a comparable data element (?)
+        Returns:
+            inserted - True if value is inserted, False otherwise.
+        -------------------------------------------------------
+        """
+        inserted = self._add_entry(Hash_Entry(value, self._hash(value)))
+
+        if inserted:
+            if self._count > (self._load_factor * self._capacity):
+                self._rehash(self._capacity * 2 + 1)
+
+        if self._old_table is not None:
+            self._move_values(Hash_Set._REHASH_STEP)
+        return inserted
+
+    def find(self, key):
+        """
+        ---------------------------------------------------------
+        Returns a copy of the value identified by key.
+        Use: value = hs.find(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+        Returns:
+            value - a copy of the value if it exists in the Hash Set,
+                None otherwise.
+        -------------------------------------------------------
+        """
+        entry = self._find_entry(Hash_Entry(key, self._hash(key)))
+
+        if entry is None:
+            value = None
+        else:
+            value = self._copy(entry._value)
+        return value
+
+    def remove(self, key):
+        """
+        ---------------------------------------------------------
+        Removes the value matching key from the Hash Set, if it exists.
+        Calls _shrink in case the Hash Set is below its shrink factor.
+        Use: value = hs.remove(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+        Returns:
+            value - if it exists in the Hash Set, None otherwise.
+        -------------------------------------------------------
+        """
+        entry = self._remove_entry(Hash_Entry(key, self._hash(key)))
+
+        if entry is None:
+            value = None
+        else:
+            value = entry._value
+            self._shrink()
+
+        if self._old_table is not None:
+            self._move_values(Hash_Set._REHASH_STEP)
+        return value
+
+    def insert_many(self, values):
+        """
+        ---------------------------------------------------------
+        Inserts values into the Hash Set, allows only one copy of each
+        value. All of the hashes are computed first, then the table is
+        grown at most once to hold all of the values, so no value is
+        moved more than once.
+        Use: n = hs.insert_many(values)
+        -------------------------------------------------------
+        Parameters:
+            values - the values to insert (iterable of ?)
+        Returns:
+            n - the number of values inserted (int)
+        -------------------------------------------------------
+        """
+        entries = [Hash_Entry(value, self._hash(value)) for value in values]
+        self._presize(self._count + len(entries))
+        n = 0
+
+        for entry in entries:
+            if self._add_entry(entry):
+                n += 1
+        return n
+
+    def contains_many(self, keys):
+        """
+        ---------------------------------------------------------
+        Determines which of keys the Hash Set contains. All of the
+        hashes are computed first.
+        Use: found = hs.contains_many(keys)
+        -------------------------------------------------------
+        Parameters:
+            keys - the keys to look for (iterable of ?)
+        Returns:
+            found - for each key in order, True if the Hash Set
+                contains it, False otherwise (list of boolean)
+        -------------------------------------------------------
+        """
+        entries = [Hash_Entry(key, self._hash(key)) for key in keys]
+        found = []
+
+        for entry in entries:
+            found.append(self._contains_entry(entry))
+        return found
+
+    def remove_many(self, keys):
+        """
+        ---------------------------------------------------------
+        Removes the values matching keys from the Hash Set, if they
+        exist. All of the hashes are computed first.
+        Use: values = hs.remove_many(keys)
+        -------------------------------------------------------
+        Parameters:
+            keys - the keys to remove (iterable of ?)
+        Returns:
+            values - for each key in order, the value removed if it
+                existed in the Hash Set, None otherwise (list of ?)
+        -------------------------------------------------------
+        """
+        entries = [Hash_Entry(key, self._hash(key)) for key in keys]
+        values = []
+
+        for entry in entries:
+            entry = self._remove_entry(entry)
+
+            if entry is None:
+                values.append(None)
+            else:
+                values.append(entry._value)
+        self._shrink()
+        return values
+
+    def union(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in either this Hash Set
+        or other. The larger set is copied and the values of the
+        smaller set are added to the copy.
+        Use: target = source.union(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        target = larger._copy_set(larger._count + smaller._count)
+
+        for entry in smaller._entries():
+            target._add_entry(entry)
+        return target
+
+    def intersection(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in both this Hash Set and
+        other. The values of the smaller set are looked for in the
+        larger set.
+        Use: target = source.intersection(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        target = smaller._select(larger, True)
+        return target
+
+    def difference(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in this Hash Set that are
+        not in other. If other is the smaller set, this Hash Set is
+        copied and the values of other are removed from the copy.
+        Use: target = source.difference(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        if other._count < self._count:
+            target = self._copy_set(self._count)
+
+            for entry in other._entries():
+                target._remove_entry(entry)
+        else:
+            target = self._select(other, False)
+        return target
+
+    def symmetric_difference(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in exactly one of this
+        Hash Set and other. The larger set is copied, then each value
+        of the smaller set is removed from the copy if it is there and
+        added to the copy if it is not.
+        Use: target = source.symmetric_difference(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        target = larger._copy_set(larger._count + smaller._count)
+
+        for entry in smaller._entries():
+            if target._remove_entry(entry) is None:
+                target._add_entry(entry)
+        return target
+
+    def issubset(self, other):
+        """
+        ---------------------------------------------------------
+        Determines if every value in this Hash Set is in other.
+        Use: b = source.issubset(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            subset - True if this Hash Set is a subset of other,
+                False otherwise (boolean)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        subset = self._count <= other._count
+        entries = self._entries()
+        entry = next(entries, None)
+
+        while subset and entry is not None:
+            subset = other._contains_entry(entry)
+            entry = next(entries, None)
+        return subset
+
+    def isdisjoint(self, other):
+        """
+        ---------------------------------------------------------
+        Determines if this Hash Set and other have no values in common.
+        The values of the smaller set are looked for in the larger set.
+        Use: b = source.isdisjoint(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            disjoint - True if no value is in both sets, False
+                otherwise (boolean)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        disjoint = True
+        entries = smaller._entries()
+        entry = next(entries, None)
+
+        while disjoint and entry is not None:
+            disjoint = not larger._contains_entry(entry)
+            entry = next(entries, None)
+        return disjoint
+
+    def update(self, other):
+        """
+        ---------------------------------------------------------
+        Adds the values of other to this Hash Set. The table is grown
+        at most once.
+        Use: source.update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        entries = list(other._entries())
+        self._presize(self._count + len(entries))
+
+        for entry in entries:
+            self._add_entry(entry)
+        return
+
+    def intersection_update(self, other):
+        """
+        ---------------------------------------------------------
+        Removes the values of this Hash Set that are not in other. If
+        other is the smaller set, this Hash Set is rebuilt, with its own
+        bucket type and load factor, from its values that are in other.
+        Use: source.intersection_update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        if other._count < self._count:
+            entries = []
+
+            for entry in other._entries():
+                entry = self._find_entry(entry)
+
+                if entry is not None:
+                    entries.append(entry)
+            self._old_table = None
+            self._capacity = self._min_capacity
+            self._table = [None] * self._capacity
+            self._count = 0
+            self._presize(len(entries))
+
+            for entry in entries:
+                self._move_value(entry)
+            self._count = len(entries)
+        else:
+            entries = [entry for entry in self._entries()
+                       if not other._contains_entry(entry)]
+
+            for entry in entries:
+                self._remove_entry(entry)
+        self._shrink()
+        return
+
+    def difference_update(self, other):
+        """
+        ---------------------------------------------------------
+        Removes the values of other from this Hash Set. Iterates
+        through the smaller of the two sets.
+        Use: source.difference_update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        if other._count < self._count:
+            entries = list(other._entries())
+        else:
+            entries = [entry for entry in self._entries()
+                       if other._contains_entry(entry)]
+
+        for entry in entries:
+            self._remove_entry(entry)
+        self._shrink()
+        return
+
+    def symmetric_difference_update(self, other):
+        """
+        ---------------------------------------------------------
+        Removes the values of other that are in this Hash Set and adds
+        the ones that are not. The table is grown at most once.
+        Use: source.symmetric_difference_update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        entries = list(other._entries())
+        self._presize(self._count + len(entries))
+
+        for entry in entries:
+            if self._remove_entry(entry) is None:
+                self._add_entry(entry)
+        self._shrink()
+        return
+
+    def _by_size(self, other):
+        """
+        ---------------------------------------------------------
+        Orders this Hash Set and other by the number of values.
+        Use: larger, smaller = self._by_size(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            larger - the set with more values, self if they are equal
+                (Hash_Set)
+            smaller - the other set (Hash_Set)
+        -------------------------------------------------------
+        """
+        if other._count > self._count:
+            larger = other
+            smaller = self
+        else:
+            larger = self
+            smaller = other
+        return larger, smaller
+
+    def _copy_set(self, n):
+        """
+        ---------------------------------------------------------
+        Returns a copy of this Hash Set with room for n values. The
+        stored hashes are reused and, since the values are distinct,
+        they are added without checking for duplicates.
+        Use: target = self._copy_set(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the number of values to make room for (int)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        target = type(self)(self._capacity, self._copy_policy,
+                            self._hash_function, self._incremental,
+                            self._bucket, self._load_factor)
+        # The copy shrinks no further than this Hash Set.
+        target._min_capacity = self._min_capacity
+        target._presize(n)
+
+        for entry in self._entries():
+            target._move_value(target._stored(entry))
+        target._count = self._count
+        return target
+
+    def _select(self, other, member):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values of this Hash Set that are
+        in other if member is True, or not in other if member is False.
+        If both tables have the same capacity and neither is being
+        rehashed, equal values are in slots at the same position, so
+        each slot is only compared with the matching slot of other.
+        Use: target = self._select(other, member)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+            member - True to keep the values in other, False to keep
+                the values not in other (boolean)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        target = type(self)(self._capacity, self._copy_policy,
+                            self._hash_function, self._incremental,
+                            self._bucket, self._load_factor)
+        target._min_capacity = self._min_capacity
+
+        if self._capacity == other._capacity and self._old_table is None \
+                and other._old_table is None:
+            for i in range(self._capacity):
+                slot = self._table[i]
+
+                if slot is not None:
+                    other_slot = other._table[i]
+
+                    for entry in self._slot_entries(slot):
+                        if (other_slot is not None and entry in other_slot) == member:
+                            target._move_value(target._stored(entry))
+                            target._count += 1
+        else:
+            for entry in self._entries():
+                if other._contains_entry(entry) == member:
+                    target._move_value(target._stored(entry))
+                    target._count += 1
+        return target
+
+    def _contains_entry(self, entry):
+        """
+        ---------------------------------------------------------
+        Determines if the Hash Set contains the value of entry. Like
+        _find_entry, it does not change the table, so it can be called
+        while iterating through the entries of the Hash Set.
+        Use: b = self._contains_entry(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a key (Hash_Entry)
+        Returns:
+            found - True if the Hash Set contains the key,
+                False otherwise (boolean)
+        -------------------------------------------------------
+        """
+        return self._find_entry(entry) is not None
+
+    def _add_entry(self, entry):
+        """
+        ---------------------------------------------------------
+        Adds entry to the Hash Set, with a copy of its value, if its
+        value is not already there. Creates the slot for entry if it
+        does not exist yet. Does not check the load factor.
+        Use: inserted = self._add_entry(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a value (Hash_Entry)
+        Returns:
+            inserted - True if entry is inserted, False otherwise.
+        -------------------------------------------------------
+        """
+        table, i = self._find_position(entry)
+        slot = table[i]
+
+        if slot is None:
+            slot = self._new_slot()
+            table[i] = slot
+
+        if entry in slot:
+            inserted = False
+        else:
+            inserted = True
+            self._slot_add(slot, self._stored(entry))
+            self._count += 1
+        return inserted
+
+    def _stored(self, entry):
+        """
+        ---------------------------------------------------------
+        Returns the entry to store for entry in this Hash Set: entry
+        itself if values are not copied, otherwise a new entry with a
+        copy of its value and the same hash. Values are copied only
+        here and in find, never when they are moved between slots.
+        Use: entry = self._stored(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a value (Hash_Entry)
+        Returns:
+            entry - the entry to store (Hash_Entry)
+        -------------------------------------------------------
+        """
+        if self._copy_policy != NONE:
+            entry = Hash_Entry(self._copy(entry._value), entry._hash)
+        return entry
+
+    def _remove_entry(self, entry):
+        """
+        ---------------------------------------------------------
+        Removes the entry matching entry from the Hash Set, if it
+        exists.
+        Use: entry = self._remove_entry(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a key (Hash_Entry)
+        Returns:
+            entry - the entry removed if it exists, None otherwise
+                (Hash_Entry)
+        -------------------------------------------------------
+        """
+        table, i = self._find_position(entry)
+        slot = table[i]
+
+        if slot is None:
+            entry = None
+        else:
+            entry = slot.remove(entry)
+
+            if entry is not None:
+                self._count -= 1
+        return entry
+
+    def _presize(self, n):
+        """
+        ---------------------------------------------------------
+        Grows the table, if necessary, so that it holds n values
+        without exceeding its load factor, and finishes any rehash in
+        progress. The number of slots grows by the same capacity * 2 + 1
+        steps as a rehash from insert, but the values are moved once.
+        Use: hs._presize(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the number of values to make room for (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        capacity = self._capacity
+
+        while n > self._load_factor * capacity:
+            capacity = capacity * 2 + 1
+
+        if capacity > self._capacity:
+            self._rehash(capacity)
+
+        self._finish_rehash()
+        return
+
+    def compact(self):
+        """
+        ---------------------------------------------------------
+        Moves the values into the smallest table, no smaller than the
+        initial table, that they fill to at most half of its load factor,
+        all at once. Slots that are empty are not created in the new
+        table.
+        Use: hs.compact()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        capacity = self._capacity
+
+        while capacity > self._min_capacity and \
+                self._count * 2 <= self._load_factor * ((capacity - 1) // 2):
+            capacity = (capacity - 1) // 2
+
+        self._rehash(max(capacity, self._min_capacity))
+        self._finish_rehash()
+        return
+
+    def _shrink(self):
+        """
+        ---------------------------------------------------------
+        Shrinks the table if it holds fewer than its shrink factor values
+        per slot. The number of slots is reversed through the same
+        capacity * 2 + 1 steps used to grow it, down to the initial
+        number of slots, until the table holds at least that many
+        values per slot, and the values are moved once.
+        Use: self._shrink()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        capacity = self._capacity
+
+        while capacity > self._min_capacity and \
+                self._count < self._shrink_factor * capacity:
+            capacity = max((capacity - 1) // 2, self._min_capacity)
+
+        if capacity < self._capacity:
+            self._rehash(capacity)
+        return
+
+    def _rehash(self, capacity):
+        """
+        ---------------------------------------------------------
+        Changes the number of slots in the Hash Set. If the Hash Set
+        is incremental, the old table is kept and each insert and remove
+        moves a few of its values to the new table, so that no single
+        operation moves them all. Otherwise all of the values are moved
+        at once. Finishes any rehash still in progress first.
+        Use: hs._rehash(capacity)
+        -------------------------------------------------------
+        Parameters:
+            capacity - the new number of slots (int > 0)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        while self._old_table is not None:
+            self._move_slot()
+
+        self._rehashes += 1
+        self._old_table = self._table
+        self._old_capacity = self._capacity
+        self._moved = 0
+        self._capacity = capacity
+        self._table = [None] * self._capacity
+
+        while not self._incremental and self._old_table is not None:
+            self._move_slot()
+        return
+
+    def _finish_rehash(self):
+        """
+        ---------------------------------------------------------
+        Moves all of the values left in the old table, if a rehash is
+        in progress, and ends the rehash.
+        Use: hs._finish_rehash()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        while self._old_table is not None:
+            self._move_slot()
+        return
+
+    def _move_values(self, n):
+        """
+        ---------------------------------------------------------
+        Moves up to n values from the old table to the new table, one
+        at a time from the first old slot that has not been moved.
+        Passing over an empty old slot counts as moving a value.
+        Use: hs._move_values(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the maximum number of values to move (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        moved = 0
+
+        while moved < n and self._old_table is not None:
+            old_slot = self._old_table[self._moved]
+
+            if old_slot is None or old_slot.is_empty():
+                self._move_slot()
+            else:
+                entry = next(iter(old_slot))
+                old_slot.remove(entry)
+                self._move_value(entry)
+            moved += 1
+        return
+
+    def _move_slot(self):
+        """
+        ---------------------------------------------------------
+        Moves the remaining values in the first old slot that has not
+        been moved to the new table. Ends the rehash when all of the
+        old slots are moved.
+        Use: hs._move_slot()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        old_slot = self._old_table[self._moved]
+
+        if old_slot is not None:
+            for entry in self._slot_entries(old_slot):
+                self._move_value(entry)
+
+        self._old_table[self._moved] = None
+        self._moved += 1
+
+        if self._moved == self._old_capacity:
+            self._old_table = None
+        return
+
+    def _move_value(self, entry):
+        """
+        ---------------------------------------------------------
+        Adds an entry from the old table to its slot in the new table.
+        The stored hash is used, so hash is not called again.
+        Use: hs._move_value(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry from the old table (Hash_Entry)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        i = entry._hash % self._capacity
+        slot = self._table[i]
+
+        if slot is None:
+            slot = self._new_slot()
+            self._table[i] = slot
+        self._slot_add(slot, entry)
+        return
+
+    def is_identical(self, other):
+        """
+        ---------------------------------------------------------
+        Determines whether two hash sets are identical.
+        Use: b = source.is_identical(target)
+        -------------------------------------------------------
+        Parameters:
+             target - another hash set (Hash_Set)
+        Returns:
+            identical - True if this hash set contains the same values
+                as other in the same order, otherwise returns False.
+                Hash sets with different numbers of slots, bucket
+                types or hash functions are not identical.
+        -------------------------------------------------------
+        """
+        for hs in (self, other):
+            # Finish the rehash so that the tables can be compared.
+            hs._finish_rehash()
+
+        is_identical = self._count == other._count and \
+            self._capacity == other._capacity and \
+            self._bucket == other._bucket and \
+            self._hash_function == other._hash_function
+        i = 0
+
+        while is_identical and i < len(self._table):
+            slot = self._table[i]
+            other_slot = other._table[i]
+
+            if slot is None or other_slot is None:
+                # A slot that has not been created is empty.
+                is_identical = (slot is None or slot.is_empty()) and \
+                    (other_slot is None or other_slot.is_empty())
+            else:
+                is_identical = slot.is_identical(other_slot)
+            i += 1
+        return is_identical
+
+    def stats(self):
+        """
+        ---------------------------------------------------------
+        Returns statistics on the slots of the Hash Set, and on its
+        lookups and rehashes. During a rehash, the old slots that have
+        not been moved are counted as well. Lookups, comparisons and
+        rehash time are only counted by a Counted_Hash_Set.
+        Use: s = hs.stats()
+        -------------------------------------------------------
+        Returns:
+            s - the statistics (dict):
+                values - the number of values (int)
+                slots - the number of slots (int)
+                load_factor - values per slot (float)
+                histogram - histogram[k] is the number of slots
+                    holding k values (list of int)
+                max_chain - the most values in one slot (int)
+                mean_chain - values per slot that is not empty (float)
+                rehashes - the number of rehashes started (int)
+                rehash_time - seconds spent moving values (float)
+                lookups - the number of keys looked up (int)
+                comparisons_per_lookup - entry comparisons per
+                    lookup, None if there were no lookups (float)
+        -------------------------------------------------------
+        """
+        slots = list(self._table)
+
+        if self._old_table is not None:
+            slots.extend(self._old_table[self._moved:])
+
+        histogram = [0]
+        used = 0
+
+        for slot in slots:
+            if slot is None:
+                length = 0
+            else:
+                length = len(slot)
+
+            while length >= len(histogram):
+                histogram.append(0)
+            histogram[length] += 1
+
+            if length > 0:
+                used += 1
+
+        if used > 0:
+            mean_chain = self._count / used
+        else:
+            mean_chain = 0.0
+
+        if self._lookups > 0:
+            comparisons = self._comparisons / self._lookups
+        else:
+            comparisons = None
+        return {
+            "values": self._count,
+            "slots": len(slots),
+            "load_factor": self._count / len(slots),
+            "histogram": histogram,
+            "max_chain": len(histogram) - 1,
+            "mean_chain": mean_chain,
+            "rehashes": self._rehashes,
+            "rehash_time": self._rehash_time,
+            "lookups": self._lookups,
+            "comparisons_per_lookup": comparisons,
+        }
+
+    def save(self, path):
+        """
+        ---------------------------------------------------------
+        Writes the values of the Hash Set to path in the memory-mapped
+        format of Hash_Set_mmap. Only int, float, str and bytes values
+        can be saved.
+        Use: hs.save(path)
+        -------------------------------------------------------
+        Parameters:
+            path - the name of the file to write (str)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        Hash_Set_mmap.save(self, path)
+        return
+
+    @staticmethod
+    def open_mmap(path):
+        """
+        ---------------------------------------------------------
+        Opens a file written by save as a read-only Hash Set that
+        serves __contains__ and find from a memory map of the file.
+        Use: hs = Hash_Set.open_mmap(path)
+        -------------------------------------------------------
+        Parameters:
+            path - the name of a file written by save (str)
+        Returns:
+            hs - a read-only hash set (Hash_Set_mmap.Hash_Set)
+        -------------------------------------------------------
+        """
+        return Hash_Set_mmap.Hash_Set(path)
+
+    def debug(self):
+        """
+        ---------------------------------------------------------
+        USE FOR TESTING ONLY
+        ---------------------------------------------------------
+        Prints the contents of the Hash Set starting at slot 0,
+        showing the slot currently being printed. Used for
+        debugging purposes.
+        Use: hs.debug()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        print(f"{self._capacity} slots")
+
+        for i in range(len(self._table)):
+            print(SEP)
+            print(f"Slot {i}")
+            slot = self._table[i]
+            print()
+
+            if slot is not None:
+                for v in self._slot_entries(slot):
+                    print(v)
+        print(SEP)
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the hash set
+        from first to last slots. Assumes slot has own iterator.
+        Use: for v in q:
+        -------------------------------------------------------
+        Returns:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        -------------------------------------------------------
+        """
+        for entry in self._entries():
+            yield entry._value
+
+    def _entries(self):
+        """
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the entries of
+        the hash set from first to last slot, starting with the old
+        slots that have not been moved during a rehash.
+        Use: for entry in self._entries():
+        -------------------------------------------------------
+        Returns:
+            yields
+            entry - the next entry in the hash set (Hash_Entry)
+        -------------------------------------------------------
+        """
+        if self._old_table is not None:
+            # Entries in the old slots that have not been moved yet.
+            for i in range(self._moved, self._old_capacity):
+                slot = self._old_table[i]
+
+                if slot is not None:
+                    for entry in self._slot_entries(slot):
+                        yield entry
+
+        for slot in self._table:
+            if slot is not None:
+                for entry in self._slot_entries(slot):
+                    yield entry
+
+
+class Counted_Hash_Set(Hash_Set):
+    """
+    -------------------------------------------------------
+    A Hash_Set that also counts its lookups, the entry comparisons
+    they make, and the time spent moving values during rehashes, for
+    stats. The counting is done by overriding the methods that look
+    up and move entries, so a Hash_Set that does not count pays
+    nothing for it.
+    Use: hs = Counted_Hash_Set(capacity)
+    -------------------------------------------------------
+    """
+
+    def __init__(self, capacity, copy_policy=DEEP, hash_function=BUILTIN,
+                 incremental=True, bucket=AVL_BUCKET,
+                 load_factor=Hash_Set._LOAD_FACTOR):
+        """
+        -------------------------------------------------------
+        Initializes an empty Counted_Hash_Set of size slots.
+        Use: hs = Counted_Hash_Set(slots)
+        -------------------------------------------------------
+        Parameter:
+            capacity - size of initial table in Hash Set  (int > 0)
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+            hash_function - how values are hashed (str)
+            incremental - True to move the values to a larger table a
+                few slots at a time as values are inserted and removed,
+                False to move them all at once (boolean)
+            bucket - the data structure of each slot (str)
+            load_factor - the table grows when it holds more than this
+                many values per slot (number > 0)
+        Returns:
+            A new Counted_Hash_Set object (Counted_Hash_Set)
+        -------------------------------------------------------
+        """
+        super().__init__(capacity, copy_policy, hash_function, incremental,
+                         bucket, load_factor)
+        return
+
+    def _find_entry(self, entry):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._find_entry and counts the lookup and its
+        comparisons.
+        Use: entry = self._find_entry(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a key (Hash_Entry)
+        Returns:
+            found - the stored entry matching entry, None if there
+                is none (Hash_Entry)
+        -------------------------------------------------------
+        """
+        self._lookups += 1
+        return super()._find_entry(_Counted_Entry(entry, self))
+
+    def _remove_entry(self, entry):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._remove_entry and counts the lookup and its
+        comparisons.
+        Use: entry = self._remove_entry(entry)
+        -------------------------------------------------------
+        Parameters:
+            entry - an entry containing a key (Hash_Entry)
+        Returns:
+            entry - the entry removed if it exists, None otherwise
+                (Hash_Entry)
+        -------------------------------------------------------
+        """
+        self._lookups += 1
+        return super()._remove_entry(_Counted_Entry(entry, self))
+
+    def _rehash(self, capacity):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._rehash and adds the time it takes to the
+        rehash time.
+        Use: hs._rehash(capacity)
+        -------------------------------------------------------
+        Parameters:
+            capacity - the new number of slots (int > 0)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        start = perf_counter()
+        super()._rehash(capacity)
+        self._rehash_time += perf_counter() - start
+        return
+
+    def _finish_rehash(self):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._finish_rehash and adds the time it takes to
+        the rehash time.
+        Use: hs._finish_rehash()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        start = perf_counter()
+        super()._finish_rehash()
+        self._rehash_time += perf_counter() - start
+        return
+
+    def _move_values(self, n):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._move_values and adds the time it takes to the
+        rehash time.
+        Use: hs._move_values(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the maximum number of values to move (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        start = perf_counter()
+        super()._move_values(n)
+        self._rehash_time += perf_counter() - start
+        return
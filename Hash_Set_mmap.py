@@ -0,0 +1,433 @@
+"""
+-------------------------------------------------------
+Memory-mapped, read-only version of the Hash Set ADT, and the file
+format it reads. save writes the values of any hash set to a file,
+and Hash_Set serves lookups from a memory map of that file without
+building a Python object for each value, so processes that open the
+same file share its pages in the page cache.
+File format (little-endian):
+    header - magic, number of values, number of index blocks, and
+        the key of the hash function
+    index - blocks of _BLOCK_ENTRIES hashes followed by the offsets
+        of the records of those values. An offset of 0 marks an
+        unused entry; the used entries of a block come first.
+    records - the values, each as a 4 byte length followed by a type
+        tag and the bytes of the value
+A value is stored in the first unused entry of the block its hash
+selects, or of the next block with one if that block is full.
+Only int, float, str and bytes values can be saved. Values that are
+equal match each other, as in a Python set: 2, 2.0 and True are
+hashed and compared as the same int, but each record keeps the type
+of the value saved, so find(2.0) returns 2 if 2 was saved.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+import mmap
+import os
+from hashlib import blake2b
+from struct import Struct
+
+# Constants
+_MAGIC = b"HSETMAP1"
+_HEADER = Struct("<8sQQ16s")
+_BLOCK_ENTRIES = 8
+_BLOCK = Struct(f"<{2 * _BLOCK_ENTRIES}Q")
+_LENGTH = Struct("<I")
+_FLOAT = Struct("<d")
+# The types of values that can be saved.
+_TYPES = (int, float, str, bytes)
+# Type tags of a whole number: an int, a float, and a bool.
+_WHOLE_TAGS = (b"i", b"w", b"t")
+# Records are written to the file this many bytes at a time.
+_WRITE_SIZE = 1 << 20
+
+
+def save(values, path):
+    """
+    -------------------------------------------------------
+    Writes values to path in the memory-mapped Hash Set format. The
+    index has room for a third more values than it holds. The file is
+    written under a temporary name and then renamed, so a process
+    that opens path sees either the old file or the new one.
+    Use: save(values, path)
+    -------------------------------------------------------
+    Parameters:
+        values - distinct int, float, str or bytes values, such as
+            a hash set (iterable of ?)
+        path - the name of the file to write (str)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    key = os.urandom(16)
+    records = []
+    hashes = []
+
+    for value in values:
+        data = _encode(value)
+        records.append(data)
+        hashes.append(_hash(_match_data(data), key))
+
+    n = len(records)
+    blocks = 1
+
+    while blocks * _BLOCK_ENTRIES * 3 < n * 4:
+        blocks *= 2
+
+    mask = blocks - 1
+    index_hashes = [0] * (blocks * _BLOCK_ENTRIES)
+    index_offsets = [0] * (blocks * _BLOCK_ENTRIES)
+    # Number of used entries in each block.
+    used = [0] * blocks
+    offset = _HEADER.size + blocks * _BLOCK.size
+
+    for i in range(n):
+        b = hashes[i] & mask
+
+        while used[b] == _BLOCK_ENTRIES:
+            b = (b + 1) & mask
+
+        j = b * _BLOCK_ENTRIES + used[b]
+        index_hashes[j] = hashes[i]
+        index_offsets[j] = offset
+        used[b] += 1
+        offset += _LENGTH.size + len(records[i])
+
+    temp = path + ".tmp"
+
+    with open(temp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, n, blocks, key))
+
+        for b in range(blocks):
+            j = b * _BLOCK_ENTRIES
+            f.write(_BLOCK.pack(*index_hashes[j:j + _BLOCK_ENTRIES],
+                                *index_offsets[j:j + _BLOCK_ENTRIES]))
+
+        buffer = bytearray()
+
+        for data in records:
+            buffer += _LENGTH.pack(len(data))
+            buffer += data
+
+            if len(buffer) >= _WRITE_SIZE:
+                f.write(buffer)
+                buffer = bytearray()
+        f.write(buffer)
+    os.replace(temp, path)
+    return
+
+
+def _encode(value):
+    """
+    -------------------------------------------------------
+    Returns the bytes that represent value in a file. A float that
+    is a whole number and a bool are stored as the int they equal,
+    with a type tag of their own.
+    Use: data = _encode(value)
+    -------------------------------------------------------
+    Parameters:
+        value - an int, float, str or bytes value (?)
+    Returns:
+        data - a type tag followed by the bytes of value (bytes)
+    -------------------------------------------------------
+    """
+    if isinstance(value, str):
+        data = b"s" + value.encode("utf-8", "surrogatepass")
+    elif isinstance(value, bytes):
+        data = b"b" + value
+    elif isinstance(value, float) and not value.is_integer():
+        data = b"f" + _FLOAT.pack(value)
+    else:
+        assert isinstance(value, (int, float)), \
+            f"Cannot save a value of type {type(value).__name__}"
+
+        if isinstance(value, bool):
+            tag = b"t"
+        elif isinstance(value, float):
+            tag = b"w"
+        else:
+            tag = b"i"
+        value = int(value)
+        data = tag + value.to_bytes((value.bit_length() + 8) // 8,
+                                    "little", signed=True)
+    return data
+
+
+def _match_data(data):
+    """
+    -------------------------------------------------------
+    Returns the bytes of data that are hashed and compared. Values
+    that are equal have the same bytes: the type tag of a whole
+    number is replaced by the int tag.
+    Use: data = _match_data(data)
+    -------------------------------------------------------
+    Parameters:
+        data - bytes returned by _encode (bytes)
+    Returns:
+        data - the bytes to hash and compare (bytes)
+    -------------------------------------------------------
+    """
+    if data[:1] in _WHOLE_TAGS:
+        data = b"i" + data[1:]
+    return data
+
+
+def _decode(data):
+    """
+    -------------------------------------------------------
+    Returns the value represented by data.
+    Use: value = _decode(data)
+    -------------------------------------------------------
+    Parameters:
+        data - bytes returned by _encode (bytes)
+    Returns:
+        value - the value (?)
+    -------------------------------------------------------
+    """
+    tag = data[:1]
+    body = data[1:]
+
+    if tag == b"s":
+        value = body.decode("utf-8", "surrogatepass")
+    elif tag == b"b":
+        value = body
+    elif tag == b"f":
+        value = _FLOAT.unpack(body)[0]
+    else:
+        value = int.from_bytes(body, "little", signed=True)
+
+        if tag == b"w":
+            value = float(value)
+        elif tag == b"t":
+            value = bool(value)
+    return value
+
+
+def _hash(data, key):
+    """
+    -------------------------------------------------------
+    Returns the keyed BLAKE2b hash of data. Unlike the built-in hash
+    of a str, it is the same in every process.
+    Use: h = _hash(data, key)
+    -------------------------------------------------------
+    Parameters:
+        data - the bytes of a value (bytes)
+        key - the key of the file (bytes)
+    Returns:
+        h - the hash (int >= 0)
+    -------------------------------------------------------
+    """
+    return int.from_bytes(blake2b(data, digest_size=8, key=key).digest(),
+                          "little")
+
+
+class Hash_Set:
+
+    def __init__(self, path):
+        """
+        -------------------------------------------------------
+        Opens a Hash Set file written by save, read-only. The file
+        is memory-mapped, not read: each lookup reads the index block
+        of its key and the records that have the same hash.
+        Use: hs = Hash_Set(path)
+        -------------------------------------------------------
+        Parameter:
+            path - the name of a file written by save (str)
+        Returns:
+            A new Hash_Set object (Hash_Set)
+        -------------------------------------------------------
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._blocks, self._key = \
+            _HEADER.unpack_from(self._map, 0)
+
+        assert magic == _MAGIC, f"Not a Hash Set file: {path}"
+        return
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the Hash Set.
+        Use: n = len(hs)
+        -------------------------------------------------------
+        Returns:
+            the number of values in the Hash Set.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the Hash Set is empty.
+        Use: b = hs.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if the Hash Set is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def _find_record(self, key):
+        """
+        -------------------------------------------------------
+        Follows the blocks from the block selected by the hash of key
+        until it finds the record of key or an unused entry. Only
+        the records whose hashes match are compared, as bytes. A key
+        of a type that cannot be saved is not in the Hash Set.
+        Use: offset = self._find_record(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a value to look for (?)
+        Returns:
+            offset - the offset of the record of key in the file, 0
+                if key is not in the Hash Set (int)
+        -------------------------------------------------------
+        """
+        offset = 0
+        searching = isinstance(key, _TYPES)
+
+        if searching:
+            data = _match_data(_encode(key))
+            hashkey = _hash(data, self._key)
+            mask = self._blocks - 1
+            b = hashkey & mask
+
+        while searching:
+            fields = _BLOCK.unpack_from(self._map,
+                                        _HEADER.size + b * _BLOCK.size)
+            j = 0
+
+            while searching and j < _BLOCK_ENTRIES:
+                record = fields[_BLOCK_ENTRIES + j]
+
+                if record == 0:
+                    # Unused entry: key is not in the Hash Set.
+                    searching = False
+                elif fields[j] == hashkey and \
+                        _LENGTH.unpack_from(self._map, record)[0] == len(data) \
+                        and _match_data(self._map[record + _LENGTH.size:
+                                                  record + _LENGTH.size
+                                                  + len(data)]) == data:
+                    offset = record
+                    searching = False
+                j += 1
+            b = (b + 1) & mask
+        return offset
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the Hash Set contains key.
+        Use: b = key in hs
+        -------------------------------------------------------
+        Parameters:
+            key - a value to look for (?)
+        Returns:
+            True if the Hash Set contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._find_record(key) != 0
+
+    def find(self, key):
+        """
+        ---------------------------------------------------------
+        Returns the value identified by key, read from the file. The
+        value has the type it was saved with, which may differ from
+        the type of an equal key.
+        Use: value = hs.find(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a value to look for (?)
+        Returns:
+            value - if it exists in the Hash Set, None otherwise.
+        -------------------------------------------------------
+        """
+        offset = self._find_record(key)
+
+        if offset == 0:
+            value = None
+        else:
+            value = self._read_record(offset)
+        return value
+
+    def _read_record(self, offset):
+        """
+        -------------------------------------------------------
+        Returns the value of the record at offset.
+        Use: value = self._read_record(offset)
+        -------------------------------------------------------
+        Parameters:
+            offset - the offset of a record in the file (int)
+        Returns:
+            value - the value of the record (?)
+        -------------------------------------------------------
+        """
+        start = offset + _LENGTH.size
+        length = _LENGTH.unpack_from(self._map, offset)[0]
+        return _decode(self._map[start:start + length])
+
+    def close(self):
+        """
+        -------------------------------------------------------
+        Closes the memory map. The Hash Set cannot be used after it
+        is closed.
+        Use: hs.close()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._map.close()
+        return
+
+    def __enter__(self):
+        """
+        -------------------------------------------------------
+        Returns the Hash Set for use in a with statement.
+        Use: with Hash_Set(path) as hs:
+        -------------------------------------------------------
+        Returns:
+            the Hash Set (Hash_Set)
+        -------------------------------------------------------
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        -------------------------------------------------------
+        Closes the Hash Set at the end of a with statement.
+        -------------------------------------------------------
+        Returns:
+            False, so exceptions are not suppressed (boolean)
+        -------------------------------------------------------
+        """
+        self.close()
+        return False
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the records of
+        the file in the order they were saved.
+        Use: for v in hs:
+        -------------------------------------------------------
+        Returns:
+            yields
+            value - the next value in the hash set (?)
+        -------------------------------------------------------
+        """
+        offset = _HEADER.size + self._blocks * _BLOCK.size
+
+        for _ in range(self._count):
+            value = self._read_record(offset)
+            offset += _LENGTH.size + _LENGTH.unpack_from(self._map, offset)[0]
+            yield value
@@ -0,0 +1,1059 @@
+"""
+-------------------------------------------------------
+Open addressing version of the Hash Set ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from time import perf_counter
+
+from Copy_Policy import DEEP, copier
+from Hash_Function import BUILTIN, hasher
+import Hash_Set_mmap
+
+# Constants
+SEP = '-' * 40
+# Markers for a slot that has never been used and for a slot whose
+# value has been removed (a tombstone).
+_EMPTY = object()
+_DELETED = object()
+# Probing uses the high bits of the hash a few at a time.
+_PERTURB_SHIFT = 5
+_PERTURB_MASK = (1 << 64) - 1
+
+
+class Hash_Set:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    # The table grows when more than this fraction of its slots
+    # are in use (live values plus tombstones).
+    _LOAD_FACTOR = 2 / 3
+    # The table shrinks when fewer than this fraction of its slots
+    # hold values. The gap to _LOAD_FACTOR keeps it from growing and
+    # shrinking over and over.
+    _SHRINK_FACTOR = _LOAD_FACTOR / 8
+    _MIN_CAPACITY = 8
+
+    def __init__(self, capacity, copy_policy=DEEP, hash_function=BUILTIN):
+        """
+        -------------------------------------------------------
+        Initializes an empty Hash_Set. Values and their hashes are
+        stored directly in two parallel lists of slots rather than in
+        one container per slot. A value that collides is stored in the
+        next free slot of its probe sequence.
+        Use: hs = Hash_Set(capacity)
+        Use: hs = Hash_Set(capacity, copy_policy, hash_function)
+        -------------------------------------------------------
+        Parameter:
+            capacity - size of initial table in Hash Set, rounded up
+                to a power of 2 (int > 0)
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+            hash_function - how values are hashed: BUILTIN, SEEDED,
+                or KEYED from Hash_Function (str)
+        Returns:
+            A new Hash_Set object (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert capacity > 0, "Capacity must be > 0"
+
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+        self._hash_function = hash_function
+        self._hash = hasher(hash_function)
+        self._capacity = Hash_Set._MIN_CAPACITY
+
+        while self._capacity < capacity:
+            self._capacity *= 2
+
+        # The table never shrinks below its initial size.
+        self._min_capacity = self._capacity
+        self._hashes = [None] * self._capacity
+        self._values = [_EMPTY] * self._capacity
+        self._count = 0
+        # Number of slots holding a value or a tombstone.
+        self._used = 0
+        # Number of rehashes. The other counters are only kept by a
+        # Counted_Hash_Set.
+        self._rehashes = 0
+        self._lookups = 0
+        self._probes = 0
+        self._rehash_time = 0.0
+        return
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the Hash Set.
+        Use: n = len(hs)
+        -------------------------------------------------------
+        Returns:
+            the number of values in the Hash Set.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the Hash Set is empty.
+        Use: b = hs.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if the Hash Set is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def _find_slot(self, key, hashkey):
+        """
+        -------------------------------------------------------
+        Follows the probe sequence of key until it finds key or an
+        empty slot. Stored hashes are compared before values, so
+        values are only compared when their hashes match. The probe
+        sequence is the one CPython uses for dict: the high bits of
+        the hash are mixed in a few at a time, so keys whose hashes
+        differ only in their high bits still spread out.
+        Use: i, found = self._find_slot(key, hashkey)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+            hashkey - hash(key) (int)
+        Returns:
+            i - index of the slot containing key if found, otherwise
+                index of the first tombstone or empty slot in which key
+                can be stored (int)
+            found - True if key is in the Hash Set, False otherwise
+                (boolean)
+        -------------------------------------------------------
+        """
+        mask = self._capacity - 1
+        perturb = hashkey & _PERTURB_MASK
+        i = hashkey & mask
+        value = self._values[i]
+        free = -1
+        found = False
+
+        while not found and value is not _EMPTY:
+            if value is _DELETED:
+                if free < 0:
+                    # Reuse the first tombstone if key is not found.
+                    free = i
+            elif self._hashes[i] == hashkey and value == key:
+                found = True
+
+            if not found:
+                perturb >>= _PERTURB_SHIFT
+                i = (i * 5 + perturb + 1) & mask
+                value = self._values[i]
+
+        if not found and free >= 0:
+            i = free
+        return i, found
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the Hash Set contains key.
+        Use: b = key in hs
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+        Returns:
+            True if the Hash Set contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        _, found = self._find_slot(key, self._hash(key))
+        return found
+
+    def insert(self, value):
+        """
+        ---------------------------------------------------------
+        Inserts a copy of value into the Hash Set, allows only one copy
+        of value. Calls _rehash if the Hash Set _LOAD_FACTOR is exceeded.
+        Use: inserted = hs.insert(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a comparable data element (?)
+        Returns:
+            inserted - True if value is inserted, False otherwise.
+        -------------------------------------------------------
+        """
+        inserted = self._add_hashed(value, self._hash(value))
+
+        if inserted:
+            if self._used > Hash_Set._LOAD_FACTOR * self._capacity:
+                self._rehash(self._count)
+        return inserted
+
+    def find(self, key):
+        """
+        ---------------------------------------------------------
+        Returns a copy of the value identified by key.
+        Use: value = hs.find(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+        Returns:
+            value - if it exists in the Hash Set, None otherwise.
+        -------------------------------------------------------
+        """
+        i, found = self._find_slot(key, self._hash(key))
+
+        if found:
+            value = self._copy(self._values[i])
+        else:
+            value = None
+        return value
+
+    def remove(self, key):
+        """
+        ---------------------------------------------------------
+        Removes the value matching key from the Hash Set, if it exists.
+        Calls _shrink in case the Hash Set is below _SHRINK_FACTOR.
+        Use: value = hs.remove(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+        Returns:
+            value - if it exists in the Hash Set, None otherwise.
+        -------------------------------------------------------
+        """
+        value, found = self._remove_hashed(key, self._hash(key))
+
+        if found:
+            self._shrink()
+        return value
+
+    def insert_many(self, values):
+        """
+        ---------------------------------------------------------
+        Inserts copies of values into the Hash Set, allows only one
+        copy of each value. All of the hashes are computed first, then
+        the table is grown at most once to hold all of the values.
+        Use: n = hs.insert_many(values)
+        -------------------------------------------------------
+        Parameters:
+            values - the values to insert (iterable of ?)
+        Returns:
+            n - the number of values inserted (int)
+        -------------------------------------------------------
+        """
+        values = list(values)
+        hashkeys = [self._hash(value) for value in values]
+        self._presize(self._count + len(values))
+        n = 0
+
+        for j in range(len(values)):
+            if self._add_hashed(values[j], hashkeys[j]):
+                n += 1
+        return n
+
+    def contains_many(self, keys):
+        """
+        ---------------------------------------------------------
+        Determines which of keys the Hash Set contains. All of the
+        hashes are computed first.
+        Use: found = hs.contains_many(keys)
+        -------------------------------------------------------
+        Parameters:
+            keys - the keys to look for (iterable of ?)
+        Returns:
+            found - for each key in order, True if the Hash Set
+                contains it, False otherwise (list of boolean)
+        -------------------------------------------------------
+        """
+        keys = list(keys)
+        hashkeys = [self._hash(key) for key in keys]
+        found = []
+
+        for j in range(len(keys)):
+            _, key_found = self._find_slot(keys[j], hashkeys[j])
+            found.append(key_found)
+        return found
+
+    def remove_many(self, keys):
+        """
+        ---------------------------------------------------------
+        Removes the values matching keys from the Hash Set, if they
+        exist. All of the hashes are computed first.
+        Use: values = hs.remove_many(keys)
+        -------------------------------------------------------
+        Parameters:
+            keys - the keys to remove (iterable of ?)
+        Returns:
+            values - for each key in order, the value removed if it
+                existed in the Hash Set, None otherwise (list of ?)
+        -------------------------------------------------------
+        """
+        keys = list(keys)
+        hashkeys = [self._hash(key) for key in keys]
+        values = []
+
+        for j in range(len(keys)):
+            value, _ = self._remove_hashed(keys[j], hashkeys[j])
+            values.append(value)
+        self._shrink()
+        return values
+
+    def union(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in either this Hash Set
+        or other. The larger set is copied and the values of the
+        smaller set are added to the copy.
+        Use: target = source.union(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        target = larger._copy_set(larger._count + smaller._count)
+
+        for hashkey, value in smaller._entries():
+            target._add_hashed(value, hashkey)
+        return target
+
+    def intersection(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in both this Hash Set and
+        other. The values of the smaller set are looked for in the
+        larger set.
+        Use: target = source.intersection(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        target = smaller._select(larger, True)
+        return target
+
+    def difference(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in this Hash Set that are
+        not in other. If other is the smaller set, this Hash Set is
+        copied and the values of other are removed from the copy.
+        Use: target = source.difference(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        if other._count < self._count:
+            target = self._copy_set(self._count)
+
+            for hashkey, value in other._entries():
+                target._remove_hashed(value, hashkey)
+        else:
+            target = self._select(other, False)
+        return target
+
+    def symmetric_difference(self, other):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of the values in exactly one of this
+        Hash Set and other. The larger set is copied, then each value
+        of the smaller set is removed from the copy if it is there and
+        added to the copy if it is not.
+        Use: target = source.symmetric_difference(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        target = larger._copy_set(larger._count + smaller._count)
+
+        for hashkey, value in smaller._entries():
+            _, found = target._remove_hashed(value, hashkey)
+
+            if not found:
+                target._add_hashed(value, hashkey)
+        return target
+
+    def issubset(self, other):
+        """
+        ---------------------------------------------------------
+        Determines if every value in this Hash Set is in other.
+        Use: b = source.issubset(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            subset - True if this Hash Set is a subset of other,
+                False otherwise (boolean)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        subset = self._count <= other._count
+        entries = self._entries()
+        entry = next(entries, None)
+
+        while subset and entry is not None:
+            _, subset = other._find_slot(entry[1], entry[0])
+            entry = next(entries, None)
+        return subset
+
+    def isdisjoint(self, other):
+        """
+        ---------------------------------------------------------
+        Determines if this Hash Set and other have no values in common.
+        The values of the smaller set are looked for in the larger set.
+        Use: b = source.isdisjoint(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            disjoint - True if no value is in both sets, False
+                otherwise (boolean)
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        larger, smaller = self._by_size(other)
+        disjoint = True
+        entries = smaller._entries()
+        entry = next(entries, None)
+
+        while disjoint and entry is not None:
+            _, found = larger._find_slot(entry[1], entry[0])
+            disjoint = not found
+            entry = next(entries, None)
+        return disjoint
+
+    def update(self, other):
+        """
+        ---------------------------------------------------------
+        Adds copies of the values of other to this Hash Set. The table
+        is grown at most once.
+        Use: source.update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        entries = list(other._entries())
+        self._presize(self._count + len(entries))
+
+        for hashkey, value in entries:
+            self._add_hashed(value, hashkey)
+        return
+
+    def intersection_update(self, other):
+        """
+        ---------------------------------------------------------
+        Removes the values of this Hash Set that are not in other. If
+        other is the smaller set, this Hash Set is rebuilt from the
+        values of other that it contains.
+        Use: source.intersection_update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        if other._count < self._count:
+            target = other._select(self, True)
+            self._capacity = target._capacity
+            self._hashes = target._hashes
+            self._values = target._values
+            self._count = target._count
+            self._used = target._used
+        else:
+            entries = [(hashkey, value) for hashkey, value in self._entries()
+                       if not other._find_slot(value, hashkey)[1]]
+
+            for hashkey, value in entries:
+                self._remove_hashed(value, hashkey)
+        self._shrink()
+        return
+
+    def difference_update(self, other):
+        """
+        ---------------------------------------------------------
+        Removes the values of other from this Hash Set. Iterates
+        through the smaller of the two sets.
+        Use: source.difference_update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        if other._count < self._count:
+            entries = list(other._entries())
+        else:
+            entries = [(hashkey, value) for hashkey, value in self._entries()
+                       if other._find_slot(value, hashkey)[1]]
+
+        for hashkey, value in entries:
+            self._remove_hashed(value, hashkey)
+        self._shrink()
+        return
+
+    def symmetric_difference_update(self, other):
+        """
+        ---------------------------------------------------------
+        Removes the values of other that are in this Hash Set and adds
+        copies of the ones that are not. The table is grown at most once.
+        Use: source.symmetric_difference_update(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._hash_function == other._hash_function, \
+            "Hash sets must use the same hash function"
+
+        entries = list(other._entries())
+        self._presize(self._count + len(entries))
+
+        for hashkey, value in entries:
+            _, found = self._remove_hashed(value, hashkey)
+
+            if not found:
+                self._add_hashed(value, hashkey)
+        self._shrink()
+        return
+
+    def _by_size(self, other):
+        """
+        ---------------------------------------------------------
+        Orders this Hash Set and other by the number of values.
+        Use: larger, smaller = self._by_size(other)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+        Returns:
+            larger - the set with more values, self if they are equal
+                (Hash_Set)
+            smaller - the other set (Hash_Set)
+        -------------------------------------------------------
+        """
+        if other._count > self._count:
+            larger = other
+            smaller = self
+        else:
+            larger = self
+            smaller = other
+        return larger, smaller
+
+    def _copy_set(self, n):
+        """
+        ---------------------------------------------------------
+        Returns a copy of this Hash Set with room for n values. The
+        stored hashes are reused.
+        Use: target = self._copy_set(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the number of values to make room for (int)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        target = type(self)(self._capacity, self._copy_policy,
+                            self._hash_function)
+        # The copy shrinks no further than this Hash Set.
+        target._min_capacity = self._min_capacity
+        target._presize(n)
+
+        for hashkey, value in self._entries():
+            target._add_hashed(value, hashkey)
+        return target
+
+    def _select(self, other, member):
+        """
+        ---------------------------------------------------------
+        Returns a new Hash Set of copies of the values of this Hash Set
+        that are in other if member is True, or not in other if member
+        is False. The stored hashes are reused.
+        Use: target = self._select(other, member)
+        -------------------------------------------------------
+        Parameters:
+            other - another hash set (Hash_Set)
+            member - True to keep the values in other, False to keep
+                the values not in other (boolean)
+        Returns:
+            target - a new hash set (Hash_Set)
+        -------------------------------------------------------
+        """
+        target = type(self)(self._capacity, self._copy_policy,
+                            self._hash_function)
+        target._min_capacity = self._min_capacity
+
+        for hashkey, value in self._entries():
+            _, found = other._find_slot(value, hashkey)
+
+            if found == member:
+                target._add_hashed(value, hashkey)
+        return target
+
+    def _presize(self, n):
+        """
+        ---------------------------------------------------------
+        Grows the table, if necessary, so that it holds n values
+        without exceeding _LOAD_FACTOR.
+        Use: self._presize(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the number of values to make room for (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        if self._used + n - self._count > Hash_Set._LOAD_FACTOR * self._capacity:
+            self._rehash(n)
+        return
+
+    def _add_hashed(self, value, hashkey):
+        """
+        ---------------------------------------------------------
+        Adds a copy of value to the Hash Set if it is not already
+        there. Does not check the load factor.
+        Use: inserted = self._add_hashed(value, hashkey)
+        -------------------------------------------------------
+        Parameters:
+            value - a comparable data element (?)
+            hashkey - hash(value) (int)
+        Returns:
+            inserted - True if value is inserted, False otherwise.
+        -------------------------------------------------------
+        """
+        i, found = self._find_slot(value, hashkey)
+
+        if found:
+            inserted = False
+        else:
+            inserted = True
+
+            if self._values[i] is _EMPTY:
+                self._used += 1
+            self._hashes[i] = hashkey
+            self._values[i] = self._copy(value)
+            self._count += 1
+        return inserted
+
+    def _remove_hashed(self, key, hashkey):
+        """
+        ---------------------------------------------------------
+        Removes the value matching key from the Hash Set, if it exists.
+        The slot is marked with a tombstone so that the probe sequences
+        passing through it are not cut short.
+        Use: value, found = self._remove_hashed(key, hashkey)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+            hashkey - hash(key) (int)
+        Returns:
+            value - the value removed if it exists, None otherwise (?)
+            found - True if a value was removed, False otherwise
+                (boolean)
+        -------------------------------------------------------
+        """
+        i, found = self._find_slot(key, hashkey)
+
+        if found:
+            value = self._values[i]
+            self._hashes[i] = None
+            self._values[i] = _DELETED
+            self._count -= 1
+        else:
+            value = None
+        return value, found
+
+    def _entries(self):
+        """
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the values of
+        the hash set and their hashes from first to last slot.
+        Use: for hashkey, value in self._entries():
+        -------------------------------------------------------
+        Returns:
+            yields
+            hashkey - the hash of the next value (int)
+            value - the next value in the hash set (?)
+        -------------------------------------------------------
+        """
+        for i in range(self._capacity):
+            value = self._values[i]
+
+            if value is not _EMPTY and value is not _DELETED:
+                yield self._hashes[i], value
+
+    def compact(self):
+        """
+        ---------------------------------------------------------
+        Moves the values into the smallest table, no smaller than the
+        initial table, that they fill to at most a third, dropping the
+        tombstones.
+        Use: hs.compact()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._rehash(self._count)
+        return
+
+    def _shrink(self):
+        """
+        ---------------------------------------------------------
+        Moves the values into a smaller table if fewer than
+        _SHRINK_FACTOR of the slots hold values.
+        Use: self._shrink()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        if self._capacity > self._min_capacity and \
+                self._count < Hash_Set._SHRINK_FACTOR * self._capacity:
+            self._rehash(self._count)
+        return
+
+    def _rehash(self, n):
+        """
+        ---------------------------------------------------------
+        Moves the values of the Hash Set into the smallest table, no
+        smaller than the initial table, that n values fill to at most a
+        third, dropping the tombstones. When n is the number of values,
+        the table doubles in size unless most of the used slots were
+        tombstones. The stored hashes are reused, so
+        hash is not called again.
+        Use: hs._rehash(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the number of values to make room for (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._rehashes += 1
+        old_hashes = self._hashes
+        old_values = self._values
+        self._capacity = self._min_capacity
+
+        while self._capacity * Hash_Set._LOAD_FACTOR < n * 2:
+            self._capacity *= 2
+
+        self._hashes = [None] * self._capacity
+        self._values = [_EMPTY] * self._capacity
+        self._used = self._count
+        mask = self._capacity - 1
+
+        for j in range(len(old_values)):
+            value = old_values[j]
+
+            if value is not _EMPTY and value is not _DELETED:
+                # The values are distinct, so only an empty slot is needed.
+                hashkey = old_hashes[j]
+                perturb = hashkey & _PERTURB_MASK
+                i = hashkey & mask
+
+                while self._values[i] is not _EMPTY:
+                    perturb >>= _PERTURB_SHIFT
+                    i = (i * 5 + perturb + 1) & mask
+
+                self._hashes[i] = hashkey
+                self._values[i] = value
+        return
+
+    def is_identical(self, other):
+        """
+        ---------------------------------------------------------
+        Determines whether two hash sets are identical.
+        Use: b = source.is_identical(target)
+        -------------------------------------------------------
+        Parameters:
+             target - another hash set (Hash_Set)
+        Returns:
+            identical - True if this hash set contains the same values
+                as other in the same order, otherwise returns False.
+        -------------------------------------------------------
+        """
+        identical = self._count == other._count
+        values = iter(self)
+        other_values = iter(other)
+        i = 0
+
+        while identical and i < self._count:
+            identical = next(values) == next(other_values)
+            i += 1
+        return identical
+
+    def _probe_length(self, hashkey, target):
+        """
+        ---------------------------------------------------------
+        Returns the number of slots in the probe sequence of hashkey up
+        to and including slot target, or the first empty slot if it
+        comes before target.
+        Use: probes = self._probe_length(hashkey, target)
+        -------------------------------------------------------
+        Parameters:
+            hashkey - a hash (int)
+            target - a slot index, -1 for the first empty slot (int)
+        Returns:
+            probes - the number of slots probed (int)
+        -------------------------------------------------------
+        """
+        mask = self._capacity - 1
+        perturb = hashkey & _PERTURB_MASK
+        i = hashkey & mask
+        probes = 1
+
+        while i != target and self._values[i] is not _EMPTY:
+            perturb >>= _PERTURB_SHIFT
+            i = (i * 5 + perturb + 1) & mask
+            probes += 1
+        return probes
+
+    def stats(self):
+        """
+        ---------------------------------------------------------
+        Returns statistics on the slots of the Hash Set, and on its
+        lookups and rehashes. The probe length of a value is the number
+        of slots probed to find it. Lookups, probes and rehash time are
+        only counted by a Counted_Hash_Set.
+        Use: s = hs.stats()
+        -------------------------------------------------------
+        Returns:
+            s - the statistics (dict):
+                values - the number of values (int)
+                slots - the number of slots (int)
+                load_factor - the fraction of slots holding values
+                    (float)
+                tombstones - the number of slots holding a removed
+                    value marker (int)
+                histogram - histogram[k] is the number of values with
+                    probe length k (list of int)
+                max_probe - the longest probe length (int)
+                mean_probe - the mean probe length (float)
+                rehashes - the number of rehashes (int)
+                rehash_time - seconds spent rehashing (float)
+                lookups - the number of keys looked up, including
+                    the lookups done by insert (int)
+                probes_per_lookup - slots probed per lookup, None if
+                    there were no lookups (float)
+        -------------------------------------------------------
+        """
+        histogram = [0]
+        total = 0
+
+        for i in range(self._capacity):
+            value = self._values[i]
+
+            if value is not _EMPTY and value is not _DELETED:
+                length = self._probe_length(self._hashes[i], i)
+
+                while length >= len(histogram):
+                    histogram.append(0)
+                histogram[length] += 1
+                total += length
+
+        if self._count > 0:
+            mean_probe = total / self._count
+        else:
+            mean_probe = 0.0
+
+        if self._lookups > 0:
+            probes = self._probes / self._lookups
+        else:
+            probes = None
+        return {
+            "values": self._count,
+            "slots": self._capacity,
+            "load_factor": self._count / self._capacity,
+            "tombstones": self._used - self._count,
+            "histogram": histogram,
+            "max_probe": len(histogram) - 1,
+            "mean_probe": mean_probe,
+            "rehashes": self._rehashes,
+            "rehash_time": self._rehash_time,
+            "lookups": self._lookups,
+            "probes_per_lookup": probes,
+        }
+
+    def save(self, path):
+        """
+        ---------------------------------------------------------
+        Writes the values of the Hash Set to path in the memory-mapped
+        format of Hash_Set_mmap. Only int, float, str and bytes values
+        can be saved.
+        Use: hs.save(path)
+        -------------------------------------------------------
+        Parameters:
+            path - the name of the file to write (str)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        Hash_Set_mmap.save(self, path)
+        return
+
+    @staticmethod
+    def open_mmap(path):
+        """
+        ---------------------------------------------------------
+        Opens a file written by save as a read-only Hash Set that
+        serves __contains__ and find from a memory map of the file.
+        Use: hs = Hash_Set.open_mmap(path)
+        -------------------------------------------------------
+        Parameters:
+            path - the name of a file written by save (str)
+        Returns:
+            hs - a read-only hash set (Hash_Set_mmap.Hash_Set)
+        -------------------------------------------------------
+        """
+        return Hash_Set_mmap.Hash_Set(path)
+
+    def debug(self):
+        """
+        ---------------------------------------------------------
+        USE FOR TESTING ONLY
+        ---------------------------------------------------------
+        Prints the contents of the Hash Set starting at slot 0,
+        showing the slot currently being printed. Used for
+        debugging purposes.
+        Use: hs.debug()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        print(f"{self._capacity} slots, {self._used} used")
+        print(SEP)
+
+        for i in range(self._capacity):
+            value = self._values[i]
+
+            if value is _DELETED:
+                print(f"Slot {i}: (deleted)")
+            elif value is not _EMPTY:
+                print(f"Slot {i}: {value}")
+        print(SEP)
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the hash set
+        from first to last slot.
+        Use: for v in hs:
+        -------------------------------------------------------
+        Returns:
+            yields
+            value - the next value in the hash set (?)
+        -------------------------------------------------------
+        """
+        for value in self._values:
+            if value is not _EMPTY and value is not _DELETED:
+                yield value
+
+
+class Counted_Hash_Set(Hash_Set):
+    """
+    -------------------------------------------------------
+    A Hash_Set that also counts its lookups, the slots they probe,
+    and the time spent rehashing, for stats. The counting is done by
+    overriding _find_slot and _rehash, so a Hash_Set that does not
+    count pays nothing for it.
+    Use: hs = Counted_Hash_Set(capacity)
+    -------------------------------------------------------
+    """
+
+    def _find_slot(self, key, hashkey):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._find_slot and counts the lookup and the slots
+        it probed.
+        Use: i, found = self._find_slot(key, hashkey)
+        -------------------------------------------------------
+        Parameters:
+            key - a comparable data element (?)
+            hashkey - hash(key) (int)
+        Returns:
+            i - the slot index returned by Hash_Set._find_slot (int)
+            found - True if key is in the Hash Set, False otherwise
+                (boolean)
+        -------------------------------------------------------
+        """
+        i, found = super()._find_slot(key, hashkey)
+        self._lookups += 1
+
+        if found:
+            self._probes += self._probe_length(hashkey, i)
+        else:
+            # The search ended at the first empty slot.
+            self._probes += self._probe_length(hashkey, -1)
+        return i, found
+
+    def _rehash(self, n):
+        """
+        ---------------------------------------------------------
+        Calls Hash_Set._rehash and adds the time it takes to the
+        rehash time.
+        Use: hs._rehash(n)
+        -------------------------------------------------------
+        Parameters:
+            n - the number of values to make room for (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        start = perf_counter()
+        super()._rehash(n)
+        self._rehash_time += perf_counter() - start
+        return
@@ -1,261 +1,47 @@
 """
 -------------------------------------------------------
-Sorted List version of the Hash Set ADT.
+Sorted linked List version of the Hash Set ADT: the chained Hash_Set
+with Sorted_List buckets by default.
 -------------------------------------------------------
 Author:  David Brown
 ID:      999999999
 Email:   dbrown@wlu.ca
 Section: CP164 A
-__updated__ = "2021-11-21"
+__updated__ = "2026-10-18"
 -------------------------------------------------------
 """
-# pylint: disable=W0212
-
 # Imports
-# Use any appropriate data structure here.
-from Sorted_List_array import Sorted_List
-# Define the new_slot slot creation function.
-new_slot = Sorted_List
-append = new_slot.insert
-
-# Constants
-SEP = '-' * 40
+from Copy_Policy import DEEP
+from Hash_Function import BUILTIN
+import Hash_Set_chained
+from Hash_Set_chained import SORTED_LIST_BUCKET
 
 
-class Hash_Set:
-    """
-    -------------------------------------------------------
-    Constants.
-    -------------------------------------------------------
-    """
-    _LOAD_FACTOR = 20
+class Hash_Set(Hash_Set_chained.Hash_Set):
 
-    def __init__(self, slots):
+    def __init__(self, capacity, copy_policy=DEEP, hash_function=BUILTIN,
+                 incremental=True, bucket=SORTED_LIST_BUCKET,
+                 load_factor=Hash_Set_chained.Hash_Set._LOAD_FACTOR):
         """
         -------------------------------------------------------
         Initializes an empty Hash_Set of size slots.
         Use: hs = Hash_Set(slots)
         -------------------------------------------------------
         Parameter:
-            size - number of initial slots in Hash Set (int > 0)
+            capacity - size of initial table in Hash Set  (int > 0)
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+            hash_function - how values are hashed (str)
+            incremental - True to move the values to a larger table a
+                few slots at a time as values are inserted and removed,
+                False to move them all at once (boolean)
+            bucket - the data structure of each slot (str)
+            load_factor - the table grows when it holds more than this
+                many values per slot (number > 0)
         Returns:
             A new Hash_Set object (Hash_Set)
         -------------------------------------------------------
         """
-        self._capacity = slots
-        self._table = []
-        self._count = 0
-
-        for _ in range(self._capacity):
-            self._table.append(new_slot())
+        super().__init__(capacity, copy_policy, hash_function, incremental,
+                         bucket, load_factor)
         return
-
-    def __len__(self):
-        """
-        -------------------------------------------------------
-        Returns the number of values in the Hash Set.
-        Use: n = len(hs)
-        -------------------------------------------------------
-        Returns:
-            the number of values in the Hash Set.
-        -------------------------------------------------------
-        """
-        return self._count
-
-    def is_empty(self):
-        """
-        -------------------------------------------------------
-        Determines if the Hash Set is empty.
-        Use: b = hs.is_empty()
-        -------------------------------------------------------
-        Returns:
-            True if the Hash Set is empty, False otherwise.
-        -------------------------------------------------------
-        """
-        return self._count == 0
-
-    def _find_slot(self, key):
-        """
-        -------------------------------------------------------
-        Returns the slot for a key value.
-        Use: list = hs._find_slot(key)
-        -------------------------------------------------------
-        Returns:
-            slot - list at the position of hash key in self._table
-        -------------------------------------------------------
-        """
-        hashkey = hash(key) % self._capacity
-        slot = self._table[hashkey]
-        return slot
-
-    def __contains__(self, key):
-        """
-        ---------------------------------------------------------
-        Determines if the Hash Set contains key.
-        Use: b = key in hs
-        -------------------------------------------------------
-        Parameters:
-            key - a comparable data element (?)
-        Returns:
-            True if the Hash Set contains key, False otherwise.
-        -------------------------------------------------------
-        """
-        slot = self._find_slot(key)
-        return key in slot
-
-    def insert(self, value):
-        """
-        ---------------------------------------------------------
-        Inserts value into the Hash Set, allows only one copy of value.
-        Calls _rehash if the Hash Set _LOAD_FACTOR is exceeded.
-        Use: inserted = hs.insert(value)
-        -------------------------------------------------------
-        Parameters:
-            value - a comparable data element (?)
-        Returns:
-            inserted - True if value is inserted, False otherwise.
-        -------------------------------------------------------
-        """
-        slot = self._find_slot(value)
-
-        if value in slot:
-            inserted = False
-        else:
-            inserted = True
-            slot.insert(value)
-            self._count += 1
-
-            if self._count > (Hash_Set._LOAD_FACTOR * self._capacity):
-                self._rehash()
-        return inserted
-
-    def find(self, key):
-        """
-        ---------------------------------------------------------
-        Returns the value identified by key.
-        Use: value = hs.find(key)
-        -------------------------------------------------------
-        Parameters:
-            key - a comparable data element (?)
-        Returns:
-            value - if it exists in the Hash Set, None otherwise.
-        -------------------------------------------------------
-        """
-        slot = self._find_slot(key)
-        value = slot.find(key)
-        return value
-
-    def remove(self, key):
-        """
-        ---------------------------------------------------------
-        Removes the value matching key from the Hash Set, if it exists.
-        Use: value = hs.remove(key)
-        -------------------------------------------------------
-        Parameters:
-            key - a comparable data element (?)
-        Returns:
-            value - if it exists in the Hash Set, None otherwise.
-        -------------------------------------------------------
-        """
-        slot = self._find_slot(key)
-        value = slot.remove(key)
-
-        if value is not None:
-            self._count -= 1
-        return value
-
-    def _rehash(self):
-        """
-        ---------------------------------------------------------
-        Increases the number of slots in the Hash Set and reallocates the
-        existing data within the Hash Set to the new table.
-        Use: hs._rehash()
-        -------------------------------------------------------
-        Returns:
-            None
-        -------------------------------------------------------
-        """
-        # Copy the current data to a temporary slot.
-        temp_table = self._table
-        # Increase the number of slots and define them.
-        self._capacity = self._capacity * 2 + 1
-        self._table = []
-
-        for _ in range(self._capacity):
-            self._table.append(new_slot())
-
-        # Copy old data to new slots.
-        while len(temp_table) > 0:
-            old_slot = temp_table.pop(0)
-
-            while not old_slot.is_empty():
-                value = old_slot.remove_front()
-                slot = self._find_slot(value)
-                slot.insert(value)
-        return
-
-    def is_identical(self, other):
-        """
-        ---------------------------------------------------------
-        Determines whether two hash sets are identical.
-        Use: b = source.is_identical(target)
-        -------------------------------------------------------
-        Parameters:
-             target - another hash set (Hash_Set)
-        Returns:
-            identical - True if this hash set contains the same values
-                as other in the same order, otherwise returns False.
-        -------------------------------------------------------
-        """
-        is_identical = True
-        i = 0
-
-        while is_identical and i < len(self._table):
-            is_identical = self._table[i].is_identical(other._table[i])
-            i += 1
-        return is_identical
-
-    def debug(self):
-        """
-        ---------------------------------------------------------
-        USE FOR TESTING ONLY
-        ---------------------------------------------------------
-        Prints the contents of the Hash Set starting at slot 0,
-        showing the slot currently being printed. Used for
-        debugging purposes.
-        Use: hs.debug()
-        -------------------------------------------------------
-        Returns:
-            None
-        -------------------------------------------------------
-        """
-        print(f"{self._capacity} slots")
-
-        for i in range(len(self._table)):
-            print(SEP)
-            print(f"Slot {i}")
-            slot = self._table[i]
-            print()
-
-            for v in slot:
-                print(v)
-        print(SEP)
-        return
-
-    def __iter__(self):
-        """
-        USE FOR TESTING ONLY
-        -------------------------------------------------------
-        Generates a Python iterator. Iterates through the hash set
-        from first to last slots. Assumes slot has own iterator.
-        Use: for v in q:
-        -------------------------------------------------------
-        Returns:
-            yields
-            value - the next value in the list (?)
-        -------------------------------------------------------
-        -------------------------------------------------------
-        """
-        for slot in self._table:
-            for item in slot:
-                yield item
@@ -11,16 +11,251 @@ __updated__ = "2022-03-10"
 """
 # pylint: disable=protected-access
 
-from copy import deepcopy
+from bisect import bisect_left
+from Copy_Policy import DEEP, copier
 from random import randint
 
 
+def _first_positions(values, others=None):
+    """
+    -------------------------------------------------------
+    Returns the positions of the first occurrence of each value in
+    values that is equal to a value in others, or of every value if
+    others is None. Uses sets if the values are hashable, O(n + m),
+    sorting if they are totally ordered, O((n + m) log(n + m)), and
+    compares every pair of values otherwise, O(n(n + m)).
+    Use: positions = _first_positions(values, others)
+    -------------------------------------------------------
+    Parameters:
+        values - the values to keep (list of ?)
+        others - the values to look for values in (list of ?)
+    Returns:
+        positions - the positions in values of the values kept, in
+            increasing order (list of int)
+    -------------------------------------------------------
+    """
+    try:
+        positions = _first_hashed(values, others)
+    except TypeError:
+        # A value cannot be hashed.
+        try:
+            positions = _first_sorted(values, others)
+        except TypeError:
+            # Two values cannot be ordered, or are only partly ordered.
+            positions = _first_scanned(values, others)
+    return positions
+
+
+def _first_hashed(values, others):
+    """
+    -------------------------------------------------------
+    _first_positions for hashable values. O(n + m)
+    Use: positions = _first_hashed(values, others)
+    -------------------------------------------------------
+    Parameters:
+        values - the values to keep (list of ?)
+        others - the values to look for values in (list of ?)
+    Returns:
+        positions - the positions in values of the values kept
+            (list of int)
+    -------------------------------------------------------
+    """
+    if others is None:
+        keys = None
+    else:
+        keys = set(others)
+
+    seen = set()
+    positions = []
+
+    for i in range(len(values)):
+        value = values[i]
+
+        if (keys is None or value in keys) and value not in seen:
+            seen.add(value)
+            positions.append(i)
+    return positions
+
+
+def _first_sorted(values, others):
+    """
+    -------------------------------------------------------
+    _first_positions for totally ordered values. The positions of
+    values are sorted by value, so equal values are next to each
+    other with the first occurrence first, and each value is looked
+    for in others by binary search. Values such as sets are only
+    partly ordered, and sorting does not put equal sets together, so
+    each pair of neighbours must be in order or equal; raises
+    TypeError if they are not. O((n + m) log(n + m))
+    Use: positions = _first_sorted(values, others)
+    -------------------------------------------------------
+    Parameters:
+        values - the values to keep (list of ?)
+        others - the values to look for values in (list of ?)
+    Returns:
+        positions - the positions in values of the values kept
+            (list of int)
+    -------------------------------------------------------
+    """
+    order = sorted(range(len(values)), key=values.__getitem__)
+
+    if others is not None:
+        others = sorted(others)
+
+        for j in range(1, len(others)):
+            _check_order(others[j - 1], others[j])
+
+    positions = []
+
+    for k in range(len(order)):
+        value = values[order[k]]
+
+        if k == 0 or _check_order(values[order[k - 1]], value):
+            # The first occurrence of value.
+            if others is None:
+                positions.append(order[k])
+            else:
+                j = bisect_left(others, value)
+
+                if j < len(others) and others[j] == value:
+                    positions.append(order[k])
+    positions.sort()
+    return positions
+
+
+def _check_order(previous, value):
+    """
+    -------------------------------------------------------
+    Determines whether two neighbouring sorted values are different.
+    Raises TypeError if they are neither in order nor equal.
+    Use: different = _check_order(previous, value)
+    -------------------------------------------------------
+    Parameters:
+        previous - a value (?)
+        value - the value sorted after previous (?)
+    Returns:
+        different - True if previous < value, False if they are
+            equal (boolean)
+    -------------------------------------------------------
+    """
+    if previous < value:
+        different = True
+    elif previous == value:
+        different = False
+    else:
+        raise TypeError("Values are not totally ordered")
+    return different
+
+
+def _first_scanned(values, others):
+    """
+    -------------------------------------------------------
+    _first_positions for values that can only be compared for
+    equality. O(n(n + m))
+    Use: positions = _first_scanned(values, others)
+    -------------------------------------------------------
+    Parameters:
+        values - the values to keep (list of ?)
+        others - the values to look for values in (list of ?)
+    Returns:
+        positions - the positions in values of the values kept
+            (list of int)
+    -------------------------------------------------------
+    """
+    kept = []
+    positions = []
+
+    for i in range(len(values)):
+        value = values[i]
+
+        if (others is None or value in others) and value not in kept:
+            kept.append(value)
+            positions.append(i)
+    return positions
+
+
+def _merge_runs(head, left, right, key):
+    """
+    -------------------------------------------------------
+    Merges two sorted chains of nodes into one sorted chain by
+    relinking the nodes, and links it after head. Nodes of left come
+    before equal nodes of right, so the merge is stable. key is
+    called once for each node as it reaches the head of its chain.
+    The loops without a key compare node values directly, as most
+    sorts have no key. If a comparison or key raises an exception,
+    the rest of left and then the rest of right are linked after the
+    nodes already merged before it is raised again, so the chain
+    after head still holds every node.
+    Use: _merge_runs(head, left, right, key)
+    -------------------------------------------------------
+    Parameters:
+        head - the node to link the merged chain after (_List_Node)
+        left - the front of a sorted chain, ending with None (_List_Node)
+        right - the front of a sorted chain, ending with None (_List_Node)
+        key - a function that returns the part of a value to
+            compare, None to compare whole values (function)
+    Returns:
+        None
+    -------------------------------------------------------
+    """
+    rear = head
+
+    try:
+        if key is None:
+            # Take from right only if its head is strictly smaller.
+            while left is not None and right is not None:
+                if right._value < left._value:
+                    rear._next = right
+                    rear = right
+                    right = right._next
+                else:
+                    rear._next = left
+                    rear = left
+                    left = left._next
+        else:
+            left_key = key(left._value)
+            right_key = key(right._value)
+
+            while left is not None and right is not None:
+                if right_key < left_key:
+                    rear._next = right
+                    rear = right
+                    right = right._next
+
+                    if right is not None:
+                        right_key = key(right._value)
+                else:
+                    rear._next = left
+                    rear = left
+                    left = left._next
+
+                    if left is not None:
+                        left_key = key(left._value)
+    except Exception:
+        # Neither chain is empty when a comparison or key fails.
+        tail = left
+
+        while tail._next is not None:
+            tail = tail._next
+        tail._next = right
+        rear._next = left
+        raise
+
+    # Link the rest of the chain that is not empty.
+    if left is None:
+        rear._next = right
+    else:
+        rear._next = left
+    return
+
+
 class _List_Node:
+    __slots__ = ('_value', '_next')
 
     def __init__(self, value, next_):
         """
         -------------------------------------------------------
-        Initializes a list node that contains a copy of value
+        Initializes a list node that contains value
         and a link to the next node in the list.
         Use: node = _List_Node(value, _next)
         -------------------------------------------------------
@@ -31,18 +266,21 @@ class _List_Node:
             a new _List_Node object (_List_Node)
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._next = next_
 
 
 class List:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty list.
         Use: lst = List()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             a new List object (List)
         -------------------------------------------------------
@@ -50,6 +288,8 @@ class List:
         self._front = None
         self._rear = None
         self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
 
     def is_empty(self):
         """
@@ -88,7 +328,7 @@ class List:
         -------------------------------------------------------
         """
         # Create the new node.
-        node = _List_Node(value, self._front)
+        node = _List_Node(self._copy(value), self._front)
 
         if self._rear is None:
             # List is empty - update the rear of the List..
@@ -135,7 +375,7 @@ class List:
 
         if i <= 0:
             # Add value to the front of the list
-            node = _List_Node(value, self._front)
+            node = _List_Node(self._copy(value), self._front)
 
             if self._rear is None:
                 # List is empty - update the rear of the List..
@@ -144,7 +384,7 @@ class List:
             self._front = node
         elif i >= self._count:
             # Add value to the rear of the list
-            node = _List_Node(value, None)
+            node = _List_Node(self._copy(value), None)
 
             if self._front is None:
                 # list is empty - update the front of the List.
@@ -165,7 +405,7 @@ class List:
                 current = current._next
                 j += 1
             # Create the new node.
-            node = _List_Node(value, current)
+            node = _List_Node(self._copy(value), current)
             previous._next = node
         # Increment the count
         self._count += 1
@@ -314,7 +554,7 @@ class List:
         _, current, _ = self._linear_search(key)
 
         if current is not None:
-            value = deepcopy(current._value)
+            value = self._copy(current._value)
         else:
             value = None
         return value
@@ -331,7 +571,7 @@ class List:
         """
         assert self._front is not None, "Cannot peek at an empty list"
 
-        value = deepcopy(self._front._value)
+        value = self._copy(self._front._value)
         return value
 
     def index(self, key):
@@ -392,7 +632,7 @@ class List:
             current = current._next
             j += 1
 
-        value = deepcopy(current._value)
+        value = self._copy(current._value)
         return value
 
     def __setitem__(self, i, value):
@@ -422,7 +662,7 @@ class List:
             current = current._next
             j += 1
 
-        current._value = deepcopy(value)
+        current._value = self._copy(value)
         return
 
     def __contains__(self, key):
@@ -459,7 +699,7 @@ class List:
             if max_node._value < current._value:
                 max_node = current
             current = current._next
-        max_data = deepcopy(max_node._value)
+        max_data = self._copy(max_node._value)
         return max_data
 
     def min(self):
@@ -481,7 +721,7 @@ class List:
             if min_node._value > current._value:
                 min_node = current
             current = current._next
-        min_data = deepcopy(min_node._value)
+        min_data = self._copy(min_node._value)
         return min_data
 
     def count(self, key):
@@ -528,40 +768,154 @@ class List:
 
         return
 
-    def clean(self):
+    def clean(self, key=None):
         """
         ---------------------------------------------------------
-        Removes duplicates from the sorted list. The list contains
-        one and only one of each value formerly present in the list.
-        The first occurrence of each value is preserved.
+        Removes duplicates from the list. The list contains one and
+        only one of each value formerly present in the list. The first
+        occurrence of each value is preserved. Values are duplicates
+        if they are equal, or if key is given, if key returns equal
+        results for them. O(n) if the values (or key results) are
+        hashable, O(n log n) if they are totally ordered, and O(n^2)
+        otherwise, such as for sets, which are only partly ordered.
+        The nodes that are kept are not copied.
         Use: source.clean()
+        Use: source.clean(key)
         -------------------------------------------------------
+        Parameters:
+            key - a function that returns the part of a value to
+                compare, None to compare whole values (function)
         Returns:
             None
         -------------------------------------------------------
         """
-        key_node = self._front
+        values = self._values()
 
-        while key_node is not None:
-            # Loop through every node - compare each node with the rest
-            previous = key_node
-            current = key_node._next
+        if key is not None:
+            values = [key(value) for value in values]
 
-            while current is not None:
-                # Always search to the end of the list (may have > 1 duplicate)
-                if current._value == key_node._value:
-                    # Remove the current node by connecting the node before it
-                    # to the node after it.
-                    self._count -= 1
-                    previous._next = current._next
+        positions = _first_positions(values)
+        previous = None
+        current = self._front
+        i = 0
+        j = 0
+
+        while current is not None:
+            if j < len(positions) and positions[j] == i:
+                # Keep current: link it after the last node kept.
+                if previous is None:
+                    self._front = current
                 else:
-                    previous = current
-                # Move to the _next node.
+                    previous._next = current
+                previous = current
+                j += 1
+            current = current._next
+            i += 1
+
+        if previous is not None:
+            previous._next = None
+        self._rear = previous
+        self._count = len(positions)
+        return
+
+    def sort(self, key=None, reverse=False):
+        """
+        -------------------------------------------------------
+        Sorts the list in place by relinking its nodes. The sort is
+        stable: equal values keep their order. No nodes or values
+        are copied. Nodes are merged bottom-up like a binary counter:
+        runs[i] holds a sorted chain of 2^i nodes, or None, and each
+        node merges with the runs below the first empty one.
+        O(n log n) comparisons and O(log n) extra space. If a
+        comparison or key raises an exception, all of the nodes are
+        linked back into the list, in no particular order, before it
+        is raised again.
+        Use: source.sort()
+        Use: source.sort(key, reverse)
+        -------------------------------------------------------
+        Parameters:
+            key - a function that returns the part of a value to
+                compare, None to compare whole values (function)
+            reverse - True to sort from largest to smallest (bool)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        if reverse:
+            # Sorting the reversed list and reversing the result keeps
+            # equal values in their original order.
+            self.reverse()
+
+        # Each merge links its chain after head. A node is in runs, in
+        # the chain after head, or not yet read from current.
+        head = _List_Node(None, None)
+        runs = []
+        current = self._front
+
+        try:
+            while current is not None:
+                run = current
                 current = current._next
-            # Update the rear
-            self._rear = previous
-            # Check for duplicates of the _next remaining node in the list
-            key_node = key_node._next
+                run._next = None
+                i = 0
+
+                while i < len(runs) and runs[i] is not None:
+                    # runs[i] holds earlier nodes than run.
+                    left = runs[i]
+                    runs[i] = None
+                    _merge_runs(head, left, run, key)
+                    run = head._next
+                    head._next = None
+                    i += 1
+
+                if i == len(runs):
+                    runs.append(run)
+                else:
+                    runs[i] = run
+
+            # Larger runs hold earlier nodes: merge from the smallest up.
+            for i in range(1, len(runs)):
+                if runs[i - 1] is not None:
+                    right = runs[i - 1]
+                    runs[i - 1] = None
+
+                    if runs[i] is None:
+                        runs[i] = right
+                    else:
+                        left = runs[i]
+                        runs[i] = None
+                        _merge_runs(head, left, right, key)
+                        runs[i] = head._next
+                        head._next = None
+        except Exception:
+            # Relink every node so that the list stays whole.
+            self._front = None
+            self._rear = None
+
+            for chain in [head._next] + runs + [current]:
+                if chain is not None:
+                    if self._front is None:
+                        self._front = chain
+                    else:
+                        self._rear._next = chain
+                    self._rear = chain
+
+                    while self._rear._next is not None:
+                        self._rear = self._rear._next
+            raise
+
+        if len(runs) == 0:
+            self._front = None
+        else:
+            self._front = runs[-1]
+        self._rear = self._front
+
+        if self._front is not None:
+            while self._rear._next is not None:
+                self._rear = self._rear._next
+
+        if reverse:
+            self.reverse()
         return
 
     def pop(self, *args):
@@ -711,8 +1065,8 @@ class List:
             target2 - contains other alternating values from source (List)
         -------------------------------------------------------
         """
-        target1 = List()
-        target2 = List()
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
         left = True
 
         while self._front is not None:
@@ -729,8 +1083,10 @@ class List:
         """
         -------------------------------------------------------
         Update the current list with values that appear in both
-        source1 and source2. Values do not repeat.
-        (iterative algorithm)
+        source1 and source2. Values do not repeat, and are in the order
+        of their first occurrence in source1. O(n + m) for hashable
+        values, O((n + m) log(n + m)) for totally ordered values, and
+        O(n(n + m)) otherwise.
         Use: target.intersection(source1, source2)
         -------------------------------------------------------
         Parameters:
@@ -742,28 +1098,20 @@ class List:
         """
         assert self._front is None, "Target list must be empty"
 
-        source1_node = source1._front
-
-        while source1_node is not None:
-            value = source1_node._value
-            _, current, _ = source2._linear_search(value)
-
-            if current is not None:
-                # Value exists in both source lists.
-                _, current, _ = self._linear_search(value)
+        values = source1._values()
 
-                if current is None:
-                    # Value does not appear in target list.
-                    self._append(value)
-            source1_node = source1_node._next
+        for i in _first_positions(values, source2._values()):
+            self._append(values[i])
         return
 
     def union(self, source1, source2):
         """
         -------------------------------------------------------
         Update the current list with all values that appear in
-        source1 and source2. Values do not repeat.
-        (iterative algorithm)
+        source1 and source2. Values do not repeat, and are in the order
+        of their first occurrence in source1 and then source2. O(n + m)
+        for hashable values, O((n + m) log(n + m)) for totally ordered
+        values, and O((n + m)^2) otherwise.
         Use: target.union(source1, source2)
         -------------------------------------------------------
         Parameters:
@@ -775,29 +1123,30 @@ class List:
         """
         assert self._front is None, "Target list must be empty"
 
-        source1_node = source1._front
-
-        while source1_node is not None:
-            value = source1_node._value
-            _, current, _ = self._linear_search(value)
-
-            if current is None:
-                # Value does not exist in new list.
-                self._append(value)
-            source1_node = source1_node._next
-
-        source2_node = source2._front
+        values = source1._values() + source2._values()
 
-        while source2_node is not None:
-            value = source2_node._value
-            _, current, _ = self._linear_search(value)
+        for i in _first_positions(values):
+            self._append(values[i])
+        return
 
-            if current is None:
-                # Value does not exist in current list.
-                self._append(value)
+    def _values(self):
+        """
+        -------------------------------------------------------
+        Returns the values of the list in a Python list, front to
+        rear. The values are not copied.
+        Use: values = self._values()
+        -------------------------------------------------------
+        Returns:
+            values - the values of the list (list of ?)
+        -------------------------------------------------------
+        """
+        values = []
+        current = self._front
 
-            source2_node = source2_node._next
-        return
+        while current is not None:
+            values.append(current._value)
+            current = current._next
+        return values
 
     def split(self):
         """
@@ -811,8 +1160,8 @@ class List:
             target2 - a new List with <= 50% of the original List (List)
         -------------------------------------------------------
         """
-        target1 = List()
-        target2 = List()
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
         # Split
         middle = self._count // 2 + self._count % 2
         prev = None
@@ -858,8 +1207,8 @@ class List:
             target2 - a new List of values > key (List)
         -------------------------------------------------------
         """
-        target1 = List()
-        target2 = List()
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
 
         while self._front is not None:
 
@@ -985,7 +1334,7 @@ class List:
         -------------------------------------------------------
         """
         # Create the new node.
-        node = _List_Node(value, None)
+        node = _List_Node(self._copy(value), None)
 
         if self._front is None:
             # list is empty - update the front of the List.
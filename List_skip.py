@@ -0,0 +1,1151 @@
+"""
+-------------------------------------------------------
+Indexable skip list version of the list ADT.
+Positional access, insert, and pop are O(log n) expected.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from random import getrandbits
+
+from Copy_Policy import DEEP, copier
+from List_linked import _first_positions
+
+# Constants
+# Nodes have at most this many levels: enough for 4^16 values.
+_MAX_HEIGHT = 16
+
+
+def _random_height():
+    """
+    -------------------------------------------------------
+    Returns a random node height. Each level above the first is
+    present with probability 1/4, so nodes average 4/3 levels and
+    a search follows about 2 log2(n) links.
+    Use: height = _random_height()
+    -------------------------------------------------------
+    Returns:
+        height - the number of levels of a new node
+            (1 <= int <= _MAX_HEIGHT)
+    -------------------------------------------------------
+    """
+    # The lowest set bit is at position t with probability 1/2^(t + 1).
+    bits = getrandbits(2 * _MAX_HEIGHT - 1) | (1 << (2 * _MAX_HEIGHT - 1))
+    return ((bits & -bits).bit_length() + 1) // 2
+
+
+class _Skip_Node:
+    __slots__ = ('_value', '_next', '_width')
+
+    def __init__(self, value, height):
+        """
+        -------------------------------------------------------
+        Initializes a skip list node that contains value and height
+        unlinked levels. _next[level] is the next node with at least
+        level + 1 levels, and _width[level] is how many positions
+        away it is. The last node on a level links to None, and its
+        width is the distance to the position after the last value.
+        Use: node = _Skip_Node(value, height)
+        -------------------------------------------------------
+        Parameters:
+            value - value for node (?)
+            height - number of levels in node (int > 0)
+        Returns:
+            a new _Skip_Node object (_Skip_Node)
+        -------------------------------------------------------
+        """
+        self._value = value
+        self._next = [None] * height
+        self._width = [0] * height
+
+
+class List:
+
+    def __init__(self, copy_policy=DEEP):
+        """
+        -------------------------------------------------------
+        Initializes an empty list.
+        Use: lst = List()
+        -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+        Returns:
+            a new List object (List)
+        -------------------------------------------------------
+        """
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+        self._clear()
+
+    def _clear(self):
+        """
+        -------------------------------------------------------
+        Empties the list. The head node is at position 0, the values
+        at positions 1 to n, and _rears[level] is the last node on
+        each level, or the head if the level has no values.
+        Use: self._clear()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._head = _Skip_Node(None, 1)
+        self._head._width[0] = 1
+        self._rears = [self._head]
+        self._count = 0
+        return
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the list is empty.
+        Use: b = lst.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if the list is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the list.
+        Use: n = len(lst)
+        -------------------------------------------------------
+        Returns:
+            the number of values in the list.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def prepend(self, value):
+        """
+        -------------------------------------------------------
+        Adds a copy of value to the front of the List.
+        Use: lst.prepend(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element. (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._link(0, _Skip_Node(self._copy(value), _random_height()))
+        return
+
+    def append(self, value):
+        """
+        ---------------------------------------------------------
+        Adds a copy of value to the end of the List.
+        Use: lst.append(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._append(value)
+        return
+
+    def insert(self, i, value):
+        """
+        -------------------------------------------------------
+        Insert value at a given position. i is the index of the element
+        before which to insert value.
+        If i is outside of range of -len(list) to len(list) - 1, the value is
+        prepended or appended as appropriate.
+        Use: lst.insert(i, value)
+        -------------------------------------------------------
+        Parameters:
+            i - index value (int)
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        # Negative index adjustment.
+        if i < 0:
+            i = self._count + i
+
+        if i < 0:
+            i = 0
+        elif i > self._count:
+            i = self._count
+
+        self._link(i, _Skip_Node(self._copy(value), _random_height()))
+        return
+
+    def _grow(self, height):
+        """
+        -------------------------------------------------------
+        Adds empty levels to the head until it has at least height
+        levels. Private helper method.
+        Use: self._grow(height)
+        -------------------------------------------------------
+        Parameters:
+            height - the number of levels needed (int > 0)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        head = self._head
+
+        while len(head._next) < height:
+            head._next.append(None)
+            head._width.append(self._count + 1)
+            self._rears.append(head)
+        return
+
+    def _shrink(self):
+        """
+        -------------------------------------------------------
+        Removes the empty levels from the top of the head, so that
+        searches do not start on them. Private helper method.
+        Use: self._shrink()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        head = self._head
+
+        while len(head._next) > 1 and head._next[-1] is None:
+            head._next.pop()
+            head._width.pop()
+            self._rears.pop()
+        return
+
+    def _predecessors(self, i):
+        """
+        -------------------------------------------------------
+        Finds, on each level, the last node before index i.
+        Private helper method. O(log n) expected.
+        Use: update, positions = self._predecessors(i)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (0 <= int <= len(list))
+        Returns:
+            update - update[level] is the last node on level at a
+                position <= i, possibly the head (list of _Skip_Node)
+            positions - positions[level] is the position of
+                update[level] (list of int)
+        -------------------------------------------------------
+        """
+        node = self._head
+        position = 0
+        level = len(node._next) - 1
+        update = [None] * (level + 1)
+        positions = [0] * (level + 1)
+
+        while level >= 0:
+            # The width of a link to None always passes i.
+            while position + node._width[level] <= i:
+                position += node._width[level]
+                node = node._next[level]
+            update[level] = node
+            positions[level] = position
+            level -= 1
+        return update, positions
+
+    def _node(self, i):
+        """
+        -------------------------------------------------------
+        Returns the node at index i. Private helper method.
+        O(log n) expected.
+        Use: node = self._node(i)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (0 <= int < len(list))
+        Returns:
+            node - the node at index i (_Skip_Node)
+        -------------------------------------------------------
+        """
+        node = self._head
+        remaining = i + 1
+        level = len(node._next) - 1
+
+        while level >= 0:
+            while node._width[level] <= remaining:
+                remaining -= node._width[level]
+                node = node._next[level]
+            level -= 1
+        return node
+
+    def _link(self, i, node):
+        """
+        -------------------------------------------------------
+        Links node into the list at index i. Appending uses the
+        rears rather than a search. Private helper method.
+        O(log n) expected.
+        Use: self._link(i, node)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (0 <= int <= len(list))
+            node - an unlinked node (_Skip_Node)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        height = len(node._next)
+        self._grow(height)
+        levels = len(self._head._next)
+
+        if i == self._count:
+            # The width from each rear to the end already reaches the
+            # new node.
+            update = self._rears
+
+            for level in range(height):
+                update[level]._next[level] = node
+                node._next[level] = None
+                node._width[level] = 1
+                self._rears[level] = node
+        else:
+            update, positions = self._predecessors(i)
+
+            for level in range(height):
+                previous = update[level]
+                node._next[level] = previous._next[level]
+                node._width[level] = positions[level] + \
+                    previous._width[level] - i
+                previous._next[level] = node
+                previous._width[level] = i + 1 - positions[level]
+
+                if node._next[level] is None:
+                    self._rears[level] = node
+
+        for level in range(height, levels):
+            # Links that pass over the new node are one longer.
+            update[level]._width[level] += 1
+        self._count += 1
+        return
+
+    def _unlink(self, i):
+        """
+        -------------------------------------------------------
+        Unlinks and returns the node at index i. Private helper method.
+        O(log n) expected.
+        Use: node = self._unlink(i)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (0 <= int < len(list))
+        Returns:
+            node - the node that was at index i (_Skip_Node)
+        -------------------------------------------------------
+        """
+        update, _ = self._predecessors(i)
+        node = update[0]._next[0]
+        height = len(node._next)
+
+        for level in range(height):
+            previous = update[level]
+            previous._next[level] = node._next[level]
+            previous._width[level] += node._width[level] - 1
+
+            if self._rears[level] is node:
+                self._rears[level] = previous
+
+        for level in range(height, len(update)):
+            # Links that passed over the node are one shorter.
+            update[level]._width[level] -= 1
+        self._count -= 1
+        self._shrink()
+        return node
+
+    def _nodes(self):
+        """
+        -------------------------------------------------------
+        Returns the nodes of the list in order. Private helper method.
+        Use: nodes = self._nodes()
+        -------------------------------------------------------
+        Returns:
+            nodes - the nodes from front to rear (list of _Skip_Node)
+        -------------------------------------------------------
+        """
+        nodes = []
+        current = self._head._next[0]
+
+        while current is not None:
+            nodes.append(current)
+            current = current._next[0]
+        return nodes
+
+    def _relink(self, nodes):
+        """
+        -------------------------------------------------------
+        Makes the list contain exactly nodes, in order, by relinking
+        every level. Each node keeps its height. Private helper method.
+        O(n) expected.
+        Use: self._relink(nodes)
+        -------------------------------------------------------
+        Parameters:
+            nodes - the nodes of the new list (list of _Skip_Node)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        levels = 1
+
+        for node in nodes:
+            if len(node._next) > levels:
+                levels = len(node._next)
+
+        head = self._head
+        head._next = [None] * levels
+        head._width = [0] * levels
+        rears = [head] * levels
+        positions = [0] * levels
+        position = 0
+
+        for node in nodes:
+            position += 1
+
+            for level in range(len(node._next)):
+                rear = rears[level]
+                rear._next[level] = node
+                rear._width[level] = position - positions[level]
+                rears[level] = node
+                positions[level] = position
+
+        for level in range(levels):
+            rears[level]._next[level] = None
+            rears[level]._width[level] = position + 1 - positions[level]
+
+        self._rears = rears
+        self._count = position
+        return
+
+    def _linear_search(self, key):
+        """
+        -------------------------------------------------------
+        Searches for the first occurrence of key in list.
+        Private helper method.
+        (iterative algorithm)
+        Use: current, index = self._linear_search(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            current - pointer to the node containing key (_Skip_Node)
+            index - index of the node containing key (int)
+        -------------------------------------------------------
+        """
+        current = self._head._next[0]
+        index = 0
+
+        while current is not None and current._value != key:
+            current = current._next[0]
+            index += 1
+
+        if current is None:
+            index = -1
+        return current, index
+
+    def remove(self, key):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the first value in list that matches key.
+        Use: value = lst.remove(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            value - the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        current, index = self._linear_search(key)
+
+        if current is None:
+            # Key is not found.
+            value = None
+        else:
+            value = self._unlink(index)._value
+        return value
+
+    def remove_front(self):
+        """
+        -------------------------------------------------------
+        Removes the first node in the list and returns its value.
+        Use: value = lst.remove_front()
+        -------------------------------------------------------
+        Returns:
+            value - the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot remove from an empty list"
+
+        value = self._unlink(0)._value
+        return value
+
+    def remove_many(self, key):
+        """
+        -------------------------------------------------------
+        Finds and removes all values in the list that match key.
+        Use: lst.remove_many(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        nodes = []
+        current = self._head._next[0]
+
+        while current is not None:
+            if current._value != key:
+                nodes.append(current)
+            current = current._next[0]
+
+        self._relink(nodes)
+        return
+
+    def find(self, key):
+        """
+        -------------------------------------------------------
+        Finds and returns a copy of the first value in list that matches key.
+        Use: value = lst.find(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            value - a copy of the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        current, _ = self._linear_search(key)
+
+        if current is not None:
+            value = self._copy(current._value)
+        else:
+            value = None
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Returns a copy of the first value in list.
+        Use: value = lst.peek()
+        -------------------------------------------------------
+        Returns:
+            value - a copy of the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot peek at an empty list"
+
+        value = self._copy(self._head._next[0]._value)
+        return value
+
+    def index(self, key):
+        """
+        -------------------------------------------------------
+        Finds location of a value by key in list.
+        Use: n = lst.index(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            i - the index of the location of key in the list, -1 if
+                key is not in the list.
+        -------------------------------------------------------
+        """
+        _, i = self._linear_search(key)
+        return i
+
+    def _is_valid_index(self, i):
+        """
+        -------------------------------------------------------
+        Private helper method to validate an index value.
+        Python index values can be positive or negative and range from
+          -len(list) to len(list) - 1
+        Use: assert self._is_valid_index(i)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (int)
+        Returns:
+            True if i is a valid index, False otherwise.
+        -------------------------------------------------------
+        """
+        n = self._count
+        return -n <= i < n
+
+    def __getitem__(self, i):
+        """
+        ---------------------------------------------------------
+        Returns a copy of the nth element of the list.
+        O(log n) expected.
+        Use: value = l[i]
+        -------------------------------------------------------
+        Parameters:
+            i - index of the element to access (int)
+        Returns:
+            value - the i-th element of list (?)
+        -------------------------------------------------------
+        """
+        assert self._is_valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        value = self._copy(self._node(i)._value)
+        return value
+
+    def __setitem__(self, i, value):
+        """
+        ---------------------------------------------------------
+        Places a copy of value into the list at position n.
+        O(log n) expected.
+        Use: l[i] = value
+        -------------------------------------------------------
+        Parameters:
+            i - index of the element to access (int)
+            value - a data value (?)
+        Returns:
+            The i-th element of list contains a copy of value. The
+                existing value at i is overwritten.
+        -------------------------------------------------------
+        """
+        assert self._is_valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        self._node(i)._value = self._copy(value)
+        return
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the list contains key.
+        Use: b = key in l
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            True if the list contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        current, _ = self._linear_search(key)
+        return current is not None
+
+    def max(self):
+        """
+        -------------------------------------------------------
+        Finds the maximum value in list.
+        Use: value = lst.max()
+        -------------------------------------------------------
+        Returns:
+            max_data - a copy of the maximum value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot find maximum of an empty list"
+
+        max_node = self._head._next[0]
+        current = max_node._next[0]
+
+        while current is not None:
+            if max_node._value < current._value:
+                max_node = current
+            current = current._next[0]
+        max_data = self._copy(max_node._value)
+        return max_data
+
+    def min(self):
+        """
+        -------------------------------------------------------
+        Finds the minimum value in list.
+        Use: value = lst.min()
+        -------------------------------------------------------
+        Returns:
+            min_data - a copy of the minimum value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot find minimum of an empty list"
+
+        min_node = self._head._next[0]
+        current = min_node._next[0]
+
+        while current is not None:
+            if min_node._value > current._value:
+                min_node = current
+            current = current._next[0]
+        min_data = self._copy(min_node._value)
+        return min_data
+
+    def count(self, key):
+        """
+        -------------------------------------------------------
+        Finds the number of times key appears in list.
+        Use: n = lst.count(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            number - number of times key appears in list (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        current = self._head._next[0]
+
+        while current is not None:
+            if key == current._value:
+                number += 1
+            current = current._next[0]
+        return number
+
+    def reverse(self):
+        """
+        -------------------------------------------------------
+        Reverses the order of the elements in list.
+        Use: source.reverse()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        nodes = self._nodes()
+        nodes.reverse()
+        self._relink(nodes)
+        return
+
+    def clean(self, key=None):
+        """
+        ---------------------------------------------------------
+        Removes duplicates from the list. The list contains one and
+        only one of each value formerly present in the list. The first
+        occurrence of each value is preserved. Values are duplicates
+        if they are equal, or if key is given, if key returns equal
+        results for them. O(n) if the values (or key results) are
+        hashable, O(n log n) if they are totally ordered, and O(n^2)
+        otherwise, such as for sets, which are only partly ordered.
+        Use: source.clean()
+        Use: source.clean(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a function that returns the part of a value to
+                compare, None to compare whole values (function)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        nodes = self._nodes()
+        values = []
+
+        for node in nodes:
+            if key is None:
+                values.append(node._value)
+            else:
+                values.append(key(node._value))
+
+        kept = []
+
+        for i in _first_positions(values):
+            kept.append(nodes[i])
+
+        self._relink(kept)
+        return
+
+    def sort(self, key=None, reverse=False):
+        """
+        -------------------------------------------------------
+        Sorts the list in place by relinking its nodes. The sort is
+        stable: equal values keep their order. No nodes or values
+        are copied. O(n log n)
+        Use: source.sort()
+        Use: source.sort(key, reverse)
+        -------------------------------------------------------
+        Parameters:
+            key - a function that returns the part of a value to
+                compare, None to compare whole values (function)
+            reverse - True to sort from largest to smallest (bool)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        nodes = self._nodes()
+
+        if key is None:
+            nodes.sort(key=lambda node: node._value, reverse=reverse)
+        else:
+            nodes.sort(key=lambda node: key(node._value), reverse=reverse)
+
+        self._relink(nodes)
+        return
+
+    def pop(self, *args):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the value in list whose index matches args.
+        O(log n) expected.
+        Use: value = lst.pop(args)
+        -------------------------------------------------------
+        Parameters:
+            args - an array of arguments (?)
+                args[0], if it exists, is the index
+        Returns:
+            value - if args exists, the value at position args, otherwise the last
+                value in the list, value is removed from the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot pop from an empty list"
+        assert len(args) <= 1, "No more than 1 argument allowed"
+
+        if len(args) == 1:
+            assert self._is_valid_index(args[0]), "Invalid index value"
+
+            if args[0] < 0:
+                # index is negative
+                n = self._count + args[0]
+            else:
+                n = args[0]
+        else:
+            # pop the last element
+            n = self._count - 1
+
+        value = self._unlink(n)._value
+        return value
+
+    def is_identical(self, target):
+        """
+        ---------------------------------------------------------
+        Determines whether two lists are identical.
+        (iterative version)
+        Use: b = source.is_identical(target)
+        -------------------------------------------------------
+        Parameters:
+            target - another list (List)
+        Returns:
+            identical - True if this list contains the same values as
+                target in the same order, otherwise False.
+        -------------------------------------------------------
+        """
+        if self._count != target._count:
+            identical = False
+        else:
+            source_node = self._head._next[0]
+            target_node = target._head._next[0]
+
+            while source_node is not None and source_node._value == target_node._value:
+                source_node = source_node._next[0]
+                target_node = target_node._next[0]
+
+            identical = source_node is None
+        return identical
+
+    def split_alt(self):
+        """
+        -------------------------------------------------------
+        Splits the source list into separate target lists with values
+        alternating into the targets. At finish source list is empty.
+        Order of source values is preserved.
+        Use: target1, target2 = source.split()
+        -------------------------------------------------------
+        Returns:
+            target1 - contains alternating values from source (List)
+            target2 - contains other alternating values from source (List)
+        -------------------------------------------------------
+        """
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
+        nodes = self._nodes()
+        target1._relink(nodes[0::2])
+        target2._relink(nodes[1::2])
+        self._clear()
+        return target1, target2
+
+    def intersection(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Update the current list with values that appear in both
+        source1 and source2. Values do not repeat.
+        O(n + m) for hashable values.
+        Use: target.intersection(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - a linked list (List)
+            source2 - a linked list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = source1._values()
+
+        for i in _first_positions(values, source2._values()):
+            self._append(values[i])
+        return
+
+    def union(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Update the current list with all values that appear in
+        source1 and source2. Values do not repeat.
+        O(n + m) for hashable values.
+        Use: target.union(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - a linked list (List)
+            source2 - a linked list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = source1._values() + source2._values()
+
+        for i in _first_positions(values):
+            self._append(values[i])
+        return
+
+    def _values(self):
+        """
+        -------------------------------------------------------
+        Returns the values of the list in a Python list.
+        Private helper method.
+        Use: values = self._values()
+        -------------------------------------------------------
+        Returns:
+            values - the values from front to rear (list of ?)
+        -------------------------------------------------------
+        """
+        values = []
+        current = self._head._next[0]
+
+        while current is not None:
+            values.append(current._value)
+            current = current._next[0]
+        return values
+
+    def split(self):
+        """
+        -------------------------------------------------------
+        Splits list into two parts. target1 contains the first half,
+        target2 the second half. Current list becomes empty.
+        Each level is cut once, so the split is O(log n) expected.
+        Use: target1, target2 = lst.split()
+        -------------------------------------------------------
+        Returns:
+            target1 - a new List with >= 50% of the original List (List)
+            target2 - a new List with <= 50% of the original List (List)
+        -------------------------------------------------------
+        """
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
+        middle = self._count // 2 + self._count % 2
+        update, positions = self._predecessors(middle)
+        target2._grow(len(update))
+        head2 = target2._head
+
+        for level in range(len(update)):
+            # Break each level after the last node at or before middle.
+            previous = update[level]
+            head2._next[level] = previous._next[level]
+            head2._width[level] = positions[level] + \
+                previous._width[level] - middle
+
+            if previous._next[level] is not None:
+                target2._rears[level] = self._rears[level]
+
+            previous._next[level] = None
+            previous._width[level] = middle + 1 - positions[level]
+            self._rears[level] = previous
+
+        target2._count = self._count - middle
+        target2._shrink()
+        # target1 takes over the head of the source list.
+        target1._head = self._head
+        target1._rears = self._rears
+        target1._count = middle
+        target1._shrink()
+        # Clean up source
+        self._clear()
+        return target1, target2
+
+    def split_key(self, key):
+        """
+        -------------------------------------------------------
+        Splits list so that target1 contains all values < key,
+        and target2 contains all values >= key.
+        Use: target1, target2 = lst.split_key(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a key value to split the list upon (?)
+        Returns:
+            target1 - a new List of values < key (List)
+            target2 - a new List of values >= key (List)
+        -------------------------------------------------------
+        """
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
+        nodes1 = []
+        nodes2 = []
+        current = self._head._next[0]
+
+        while current is not None:
+            if current._value < key:
+                nodes1.append(current)
+            else:
+                nodes2.append(current)
+            current = current._next[0]
+
+        target1._relink(nodes1)
+        target2._relink(nodes2)
+        self._clear()
+        return target1, target2
+
+    def _move_front_to_front(self, source):
+        """
+        -------------------------------------------------------
+        Moves the front node from the source List to the front
+        of the current List. Private helper method.
+        Use: self._move_front_to_front(source)
+        -------------------------------------------------------
+        Parameters:
+            source - a non-empty List (List)
+        Returns:
+            The current List contains the old front of the source List and
+            its count is updated. The source List front and count are updated.
+        -------------------------------------------------------
+        """
+        assert source._count > 0, "Cannot move the front of an empty List"
+
+        self._link(0, source._unlink(0))
+        return
+
+    def _move_front_to_rear(self, source):
+        """
+        -------------------------------------------------------
+        Moves the front node from the source List to the rear
+        of the current List. Private helper method.
+        Use: self._move_front_to_rear(source)
+        -------------------------------------------------------
+        Parameters:
+            source - a non-empty List (List)
+        Returns:
+            The current List contains the old front of the source List and
+            its count is updated. The source List front and count are updated.
+        -------------------------------------------------------
+        """
+        assert source._count > 0, "Cannot move the front of an empty List"
+
+        self._link(self._count, source._unlink(0))
+        return
+
+    def combine(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Combines two source lists into the current target list.
+        When finished, the contents of source1 and source2 are interlaced
+        into target and source1 and source2 are empty.
+        Order of source values is preserved.
+        Use: target.combine(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - a linked list (List)
+            source2 - a linked list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._count == 0, "Target list must be empty"
+
+        nodes1 = source1._nodes()
+        nodes2 = source2._nodes()
+        nodes = []
+        i = 0
+
+        while i < len(nodes1) or i < len(nodes2):
+            if i < len(nodes1):
+                nodes.append(nodes1[i])
+
+            if i < len(nodes2):
+                nodes.append(nodes2[i])
+            i += 1
+
+        self._relink(nodes)
+        source1._clear()
+        source2._clear()
+        return
+
+    def _append(self, value):
+        """
+        ---------------------------------------------------------
+        Helper method to add a copy of value to the end of the List.
+        Use: self._append(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._link(self._count,
+                   _Skip_Node(self._copy(value), _random_height()))
+        return
+
+    def _append_list(self, source):
+        """
+        -------------------------------------------------------
+        Helper method to append the entire source list to the rear of the target list.
+        The source list becomes empty. Each level of source is linked
+        after the rear of the same level, so no values are visited:
+        O(log n) expected.
+        Use: target._append_list(source)
+        -------------------------------------------------------
+        Parameters:
+            source - a skip list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._count > 0, "Cannot append an empty list"
+
+        source_head = source._head
+        self._grow(len(source_head._next))
+
+        for level in range(len(self._head._next)):
+            rear = self._rears[level]
+
+            if level < len(source_head._next):
+                # The width from rear to the end now continues through
+                # the source head's first link.
+                rear._next[level] = source_head._next[level]
+                rear._width[level] += source_head._width[level] - 1
+
+                if source_head._next[level] is not None:
+                    self._rears[level] = source._rears[level]
+            else:
+                rear._width[level] += source._count
+
+        self._count += source._count
+        # Empty the source list.
+        source._clear()
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the list
+        from front to rear.
+        Use: for v in s:
+        -------------------------------------------------------
+        Returns:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        """
+        current = self._head._next[0]
+
+        while current is not None:
+            yield current._value
+            current = current._next[0]
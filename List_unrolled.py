@@ -0,0 +1,996 @@
+"""
+-------------------------------------------------------
+Unrolled linked version of the list ADT: each node holds
+up to _CAPACITY values in a Python list.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from Copy_Policy import DEEP, copier
+from List_linked import _first_positions
+
+# Constants
+# The most values a node holds. A node that overflows is split in half.
+_CAPACITY = 64
+
+
+class _List_Node:
+    __slots__ = ('_values', '_next')
+
+    def __init__(self, values, next_):
+        """
+        -------------------------------------------------------
+        Initializes a list node that contains values
+        and a link to the next node in the list.
+        Nodes in a list are never empty.
+        Use: node = _List_Node(values, _next)
+        -------------------------------------------------------
+        Parameters:
+            values - values for node (list of ?)
+            next_ - another list node (_List_Node)
+        Returns:
+            a new _List_Node object (_List_Node)
+        -------------------------------------------------------
+        """
+        self._values = values
+        self._next = next_
+
+
+class List:
+
+    def __init__(self, copy_policy=DEEP):
+        """
+        -------------------------------------------------------
+        Initializes an empty list.
+        Use: lst = List()
+        -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+        Returns:
+            a new List object (List)
+        -------------------------------------------------------
+        """
+        self._front = None
+        self._rear = None
+        self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the list is empty.
+        Use: b = lst.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if the list is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._front is None
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the list.
+        Use: n = len(lst)
+        -------------------------------------------------------
+        Returns:
+            the number of values in the list.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def prepend(self, value):
+        """
+        -------------------------------------------------------
+        Adds a copy of value to the front of the List.
+        Use: lst.prepend(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element. (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._add(0, self._copy(value))
+        return
+
+    def append(self, value):
+        """
+        ---------------------------------------------------------
+        Adds a copy of value to the end of the List.
+        Use: lst.append(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._append(value)
+        return
+
+    def insert(self, i, value):
+        """
+        -------------------------------------------------------
+        Insert value at a given position. i is the index of the element
+        before which to insert value.
+        If i is outside of range of -len(list) to len(list) - 1, the value is
+        prepended or appended as appropriate.
+        Use: lst.insert(i, value)
+        -------------------------------------------------------
+        Parameters:
+            i - index value (int)
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        # Negative index adjustment.
+        if i < 0:
+            i = self._count + i
+
+        if i < 0:
+            i = 0
+        elif i > self._count:
+            i = self._count
+
+        self._add(i, self._copy(value))
+        return
+
+    def _locate(self, i):
+        """
+        -------------------------------------------------------
+        Finds the node that holds index i. Whole nodes are skipped,
+        so this is O(n / _CAPACITY). Private helper method.
+        Use: previous, current, offset = self._locate(i)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (0 <= int < len(list))
+        Returns:
+            previous - the node before current (_List_Node)
+            current - the node that holds index i (_List_Node)
+            offset - the position of index i in current._values (int)
+        -------------------------------------------------------
+        """
+        previous = None
+        current = self._front
+
+        while i >= len(current._values):
+            i -= len(current._values)
+            previous = current
+            current = current._next
+        return previous, current, i
+
+    def _add(self, i, value):
+        """
+        -------------------------------------------------------
+        Adds value itself at index i. Values are appended to the rear
+        node until it is full. A node that overflows is split in
+        half, so that later inserts near it do not split it again.
+        Private helper method.
+        Use: self._add(i, value)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (0 <= int <= len(list))
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        if self._front is None:
+            self._front = _List_Node([value], None)
+            self._rear = self._front
+        elif i == self._count:
+            if len(self._rear._values) == _CAPACITY:
+                self._rear._next = _List_Node([value], None)
+                self._rear = self._rear._next
+            else:
+                self._rear._values.append(value)
+        else:
+            _, current, offset = self._locate(i)
+            current._values.insert(offset, value)
+
+            if len(current._values) > _CAPACITY:
+                # Move the second half into a new node.
+                half = len(current._values) // 2
+                current._next = _List_Node(current._values[half:],
+                                           current._next)
+                del current._values[half:]
+
+                if self._rear is current:
+                    self._rear = current._next
+        self._count += 1
+        return
+
+    def _delete(self, previous, current, offset):
+        """
+        -------------------------------------------------------
+        Removes and returns the value at offset in current. current
+        is unlinked if it becomes empty. Private helper method.
+        Use: value = self._delete(previous, current, offset)
+        -------------------------------------------------------
+        Parameters:
+            previous - the node before current (_List_Node)
+            current - a node in the list (_List_Node)
+            offset - a position in current._values (int)
+        Returns:
+            value - the value removed (?)
+        -------------------------------------------------------
+        """
+        value = current._values.pop(offset)
+        self._count -= 1
+
+        if len(current._values) == 0:
+            if previous is None:
+                self._front = current._next
+            else:
+                previous._next = current._next
+
+            if self._rear is current:
+                self._rear = previous
+        return value
+
+    def _linear_search(self, key):
+        """
+        -------------------------------------------------------
+        Searches for the first occurrence of key in list.
+        Private helper method.
+        (iterative algorithm)
+        Use: previous, current, offset, index = self._linear_search(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            previous - pointer to the node before current (_List_Node)
+            current - pointer to the node containing key (_List_Node)
+            offset - position of key in current._values (int)
+            index - index of key in the list, -1 if not found (int)
+        -------------------------------------------------------
+        """
+        previous = None
+        current = self._front
+        offset = 0
+        index = 0
+
+        while current is not None and current._values[offset] != key:
+            offset += 1
+            index += 1
+
+            if offset == len(current._values):
+                previous = current
+                current = current._next
+                offset = 0
+
+        if current is None:
+            index = -1
+        return previous, current, offset, index
+
+    def remove(self, key):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the first value in list that matches key.
+        Use: value = lst.remove(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            value - the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        previous, current, offset, _ = self._linear_search(key)
+
+        if current is None:
+            # Key is not found.
+            value = None
+        else:
+            value = self._delete(previous, current, offset)
+        return value
+
+    def remove_front(self):
+        """
+        -------------------------------------------------------
+        Removes the first node in the list and returns its value.
+        Use: value = lst.remove_front()
+        -------------------------------------------------------
+        Returns:
+            value - the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot remove from an empty list"
+
+        value = self._delete(None, self._front, 0)
+        return value
+
+    def remove_many(self, key):
+        """
+        -------------------------------------------------------
+        Finds and removes all values in the list that match key.
+        Use: lst.remove_many(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = []
+        current = self._front
+
+        while current is not None:
+            for value in current._values:
+                if value != key:
+                    values.append(value)
+            current = current._next
+
+        self._rebuild(values)
+        return
+
+    def find(self, key):
+        """
+        -------------------------------------------------------
+        Finds and returns a copy of the first value in list that matches key.
+        Use: value = lst.find(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            value - a copy of the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        _, current, offset, _ = self._linear_search(key)
+
+        if current is not None:
+            value = self._copy(current._values[offset])
+        else:
+            value = None
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Returns a copy of the first value in list.
+        Use: value = lst.peek()
+        -------------------------------------------------------
+        Returns:
+            value - a copy of the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot peek at an empty list"
+
+        value = self._copy(self._front._values[0])
+        return value
+
+    def index(self, key):
+        """
+        -------------------------------------------------------
+        Finds location of a value by key in list.
+        Use: n = lst.index(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            i - the index of the location of key in the list, -1 if
+                key is not in the list.
+        -------------------------------------------------------
+        """
+        _, _, _, i = self._linear_search(key)
+        return i
+
+    def _is_valid_index(self, i):
+        """
+        -------------------------------------------------------
+        Private helper method to validate an index value.
+        Python index values can be positive or negative and range from
+          -len(list) to len(list) - 1
+        Use: assert self._is_valid_index(i)
+        -------------------------------------------------------
+        Parameters:
+            i - an index value (int)
+        Returns:
+            True if i is a valid index, False otherwise.
+        -------------------------------------------------------
+        """
+        n = self._count
+        return -n <= i < n
+
+    def __getitem__(self, i):
+        """
+        ---------------------------------------------------------
+        Returns a copy of the nth element of the list.
+        Use: value = l[i]
+        -------------------------------------------------------
+        Parameters:
+            i - index of the element to access (int)
+        Returns:
+            value - the i-th element of list (?)
+        -------------------------------------------------------
+        """
+        assert self._is_valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        _, current, offset = self._locate(i)
+        value = self._copy(current._values[offset])
+        return value
+
+    def __setitem__(self, i, value):
+        """
+        ---------------------------------------------------------
+        Places a copy of value into the list at position n.
+        Use: l[i] = value
+        -------------------------------------------------------
+        Parameters:
+            i - index of the element to access (int)
+            value - a data value (?)
+        Returns:
+            The i-th element of list contains a copy of value. The
+                existing value at i is overwritten.
+        -------------------------------------------------------
+        """
+        assert self._is_valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        _, current, offset = self._locate(i)
+        current._values[offset] = self._copy(value)
+        return
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the list contains key.
+        Use: b = key in l
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            True if the list contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        _, current, _, _ = self._linear_search(key)
+        return current is not None
+
+    def max(self):
+        """
+        -------------------------------------------------------
+        Finds the maximum value in list.
+        Use: value = lst.max()
+        -------------------------------------------------------
+        Returns:
+            max_data - a copy of the maximum value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot find maximum of an empty list"
+
+        max_data = self._front._values[0]
+        current = self._front
+
+        while current is not None:
+            for value in current._values:
+                if max_data < value:
+                    max_data = value
+            current = current._next
+        max_data = self._copy(max_data)
+        return max_data
+
+    def min(self):
+        """
+        -------------------------------------------------------
+        Finds the minimum value in list.
+        Use: value = lst.min()
+        -------------------------------------------------------
+        Returns:
+            min_data - a copy of the minimum value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot find minimum of an empty list"
+
+        min_data = self._front._values[0]
+        current = self._front
+
+        while current is not None:
+            for value in current._values:
+                if min_data > value:
+                    min_data = value
+            current = current._next
+        min_data = self._copy(min_data)
+        return min_data
+
+    def count(self, key):
+        """
+        -------------------------------------------------------
+        Finds the number of times key appears in list.
+        Use: n = lst.count(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a partial data element (?)
+        Returns:
+            number - number of times key appears in list (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        current = self._front
+
+        while current is not None:
+            number += current._values.count(key)
+            current = current._next
+        return number
+
+    def reverse(self):
+        """
+        -------------------------------------------------------
+        Reverses the order of the elements in list. The values in
+        each node are reversed, then the nodes are relinked in
+        reverse order.
+        Use: source.reverse()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._rear = self._front
+        current = self._front
+        self._front = None
+
+        while current is not None:
+            current._values.reverse()
+            temp = current._next
+            current._next = self._front
+            self._front = current
+            current = temp
+        return
+
+    def clean(self, key=None):
+        """
+        ---------------------------------------------------------
+        Removes duplicates from the list. The list contains one and
+        only one of each value formerly present in the list. The first
+        occurrence of each value is preserved. Values are duplicates
+        if they are equal, or if key is given, if key returns equal
+        results for them. O(n) if the values (or key results) are
+        hashable, O(n log n) if they are totally ordered, and O(n^2)
+        otherwise, such as for sets, which are only partly ordered.
+        Use: source.clean()
+        Use: source.clean(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a function that returns the part of a value to
+                compare, None to compare whole values (function)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = self._values()
+
+        if key is None:
+            keys = values
+        else:
+            keys = [key(value) for value in values]
+
+        kept = []
+
+        for i in _first_positions(keys):
+            kept.append(values[i])
+
+        self._rebuild(kept)
+        return
+
+    def sort(self, key=None, reverse=False):
+        """
+        -------------------------------------------------------
+        Sorts the list in place. The sort is stable: equal values
+        keep their order. The values are sorted in a Python list and
+        written back into the same nodes. O(n log n)
+        Use: source.sort()
+        Use: source.sort(key, reverse)
+        -------------------------------------------------------
+        Parameters:
+            key - a function that returns the part of a value to
+                compare, None to compare whole values (function)
+            reverse - True to sort from largest to smallest (bool)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = self._values()
+        values.sort(key=key, reverse=reverse)
+        current = self._front
+        i = 0
+
+        while current is not None:
+            j = i + len(current._values)
+            current._values[:] = values[i:j]
+            i = j
+            current = current._next
+        return
+
+    def pop(self, *args):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the value in list whose index matches args.
+        Use: value = lst.pop(args)
+        -------------------------------------------------------
+        Parameters:
+            args - an array of arguments (?)
+                args[0], if it exists, is the index
+        Returns:
+            value - if args exists, the value at position args, otherwise the last
+                value in the list, value is removed from the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot pop from an empty list"
+        assert len(args) <= 1, "No more than 1 argument allowed"
+
+        if len(args) == 1:
+            assert self._is_valid_index(args[0]), "Invalid index value"
+
+            if args[0] < 0:
+                # index is negative
+                n = self._count + args[0]
+            else:
+                n = args[0]
+        else:
+            # pop the last element
+            n = self._count - 1
+
+        previous, current, offset = self._locate(n)
+        value = self._delete(previous, current, offset)
+        return value
+
+    def is_identical(self, target):
+        """
+        ---------------------------------------------------------
+        Determines whether two lists are identical.
+        Use: b = source.is_identical(target)
+        -------------------------------------------------------
+        Parameters:
+            target - another list (List)
+        Returns:
+            identical - True if this list contains the same values as
+                target in the same order, otherwise False.
+        -------------------------------------------------------
+        """
+        # The two lists may be split into nodes differently.
+        identical = self._count == target._count and \
+            self._values() == target._values()
+        return identical
+
+    def split_alt(self):
+        """
+        -------------------------------------------------------
+        Splits the source list into separate target lists with values
+        alternating into the targets. At finish source list is empty.
+        Order of source values is preserved.
+        Use: target1, target2 = source.split()
+        -------------------------------------------------------
+        Returns:
+            target1 - contains alternating values from source (List)
+            target2 - contains other alternating values from source (List)
+        -------------------------------------------------------
+        """
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
+        values = self._values()
+        target1._rebuild(values[0::2])
+        target2._rebuild(values[1::2])
+        self._rebuild([])
+        return target1, target2
+
+    def intersection(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Update the current list with values that appear in both
+        source1 and source2. Values do not repeat.
+        O(n + m) for hashable values.
+        Use: target.intersection(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - a linked list (List)
+            source2 - a linked list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = source1._values()
+
+        for i in _first_positions(values, source2._values()):
+            self._append(values[i])
+        return
+
+    def union(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Update the current list with all values that appear in
+        source1 and source2. Values do not repeat.
+        O(n + m) for hashable values.
+        Use: target.union(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - a linked list (List)
+            source2 - a linked list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = source1._values() + source2._values()
+
+        for i in _first_positions(values):
+            self._append(values[i])
+        return
+
+    def _values(self):
+        """
+        -------------------------------------------------------
+        Returns the values of the list in a Python list.
+        Private helper method.
+        Use: values = self._values()
+        -------------------------------------------------------
+        Returns:
+            values - the values from front to rear (list of ?)
+        -------------------------------------------------------
+        """
+        values = []
+        current = self._front
+
+        while current is not None:
+            values.extend(current._values)
+            current = current._next
+        return values
+
+    def _rebuild(self, values):
+        """
+        -------------------------------------------------------
+        Replaces the contents of the list with values, stored in full
+        nodes. The values are not copied. Private helper method.
+        Use: self._rebuild(values)
+        -------------------------------------------------------
+        Parameters:
+            values - the new values of the list (list of ?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._front = None
+        self._rear = None
+
+        for i in range(0, len(values), _CAPACITY):
+            node = _List_Node(values[i:i + _CAPACITY], None)
+
+            if self._rear is None:
+                self._front = node
+            else:
+                self._rear._next = node
+            self._rear = node
+
+        self._count = len(values)
+        return
+
+    def split(self):
+        """
+        -------------------------------------------------------
+        Splits list into two parts. target1 contains the first half,
+        target2 the second half. Current list becomes empty.
+        At most the node that holds the middle is divided.
+        Use: target1, target2 = lst.split()
+        -------------------------------------------------------
+        Returns:
+            target1 - a new List with >= 50% of the original List (List)
+            target2 - a new List with <= 50% of the original List (List)
+        -------------------------------------------------------
+        """
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
+        middle = self._count // 2 + self._count % 2
+
+        if 0 < middle < self._count:
+            previous, current, offset = self._locate(middle)
+
+            if offset > 0:
+                # Divide the node that holds the middle.
+                current._next = _List_Node(current._values[offset:],
+                                           current._next)
+                del current._values[offset:]
+
+                if self._rear is current:
+                    self._rear = current._next
+                previous = current
+
+            target2._front = previous._next
+            target2._rear = self._rear
+            target2._count = self._count - middle
+            previous._next = None
+            self._rear = previous
+
+        # Define target1
+        if middle > 0:
+            target1._front = self._front
+            target1._rear = self._rear
+            target1._count = middle
+
+        # Clean up source
+        self._front = None
+        self._rear = None
+        self._count = 0
+        return target1, target2
+
+    def split_key(self, key):
+        """
+        -------------------------------------------------------
+        Splits list so that target1 contains all values < key,
+        and target2 contains all values >= key.
+        Use: target1, target2 = lst.split_key(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a key value to split the list upon (?)
+        Returns:
+            target1 - a new List of values < key (List)
+            target2 - a new List of values >= key (List)
+        -------------------------------------------------------
+        """
+        target1 = List(self._copy_policy)
+        target2 = List(self._copy_policy)
+        values1 = []
+        values2 = []
+        current = self._front
+
+        while current is not None:
+            for value in current._values:
+                if value < key:
+                    values1.append(value)
+                else:
+                    values2.append(value)
+            current = current._next
+
+        target1._rebuild(values1)
+        target2._rebuild(values2)
+        self._rebuild([])
+        return target1, target2
+
+    def _move_front_to_front(self, source):
+        """
+        -------------------------------------------------------
+        Moves the front value from the source List to the front
+        of the current List. The value is not copied.
+        Private helper method.
+        Use: self._move_front_to_front(source)
+        -------------------------------------------------------
+        Parameters:
+            source - a non-empty List (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._front is not None, \
+            "Cannot move the front of an empty List"
+
+        self._add(0, source._delete(None, source._front, 0))
+        return
+
+    def _move_front_to_rear(self, source):
+        """
+        -------------------------------------------------------
+        Moves the front value from the source List to the rear
+        of the current List. The value is not copied.
+        Private helper method.
+        Use: self._move_front_to_rear(source)
+        -------------------------------------------------------
+        Parameters:
+            source - a non-empty List (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._front is not None, \
+            "Cannot move the front of an empty List"
+
+        self._add(self._count, source._delete(None, source._front, 0))
+        return
+
+    def combine(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Combines two source lists into the current target list.
+        When finished, the contents of source1 and source2 are interlaced
+        into target and source1 and source2 are empty.
+        Order of source values is preserved.
+        (iterative algorithm)
+        Use: target.combine(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - a linked list (List)
+            source2 - a linked list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert self._front is None, "Target list must be empty"
+
+        while source1._front is not None and source2._front is not None:
+            self._move_front_to_rear(source1)
+            self._move_front_to_rear(source2)
+
+        if source1._front is not None:
+            self._append_list(source1)
+
+        if source2._front is not None:
+            self._append_list(source2)
+        return
+
+    def _append(self, value):
+        """
+        ---------------------------------------------------------
+        Helper method to add a copy of value to the end of the List.
+        Use: self._append(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._add(self._count, self._copy(value))
+        return
+
+    def _append_list(self, source):
+        """
+        -------------------------------------------------------
+        Helper method to append the entire source list to the rear of the target list.
+        The source list becomes empty. The source nodes are linked
+        after the target rear, so the append is O(1) even though the
+        old rear node may not be full.
+        Use: target._append_list(source)
+        -------------------------------------------------------
+        Parameters:
+            source - an unrolled list (List)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._front is not None, "Cannot append an empty list"
+
+        # Update the target list
+        if self._rear is None:
+            # Current list is empty.
+            self._front = source._front
+        else:
+            self._rear._next = source._front
+
+        self._rear = source._rear
+        self._count += source._count
+        # Empty the source list.
+        source._front = None
+        source._rear = None
+        source._count = 0
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the list
+        from front to rear.
+        Use: for v in s:
+        -------------------------------------------------------
+        Returns:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        """
+        current = self._front
+
+        while current is not None:
+            yield from current._values
+            current = current._next
@@ -0,0 +1,333 @@
+"""
+-------------------------------------------------------
+Array-based (binary heap) version of the Priority Queue ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from Copy_Policy import DEEP, NONE, copier
+
+
+def _precedes(value1, order1, value2, order2):
+    """
+    -------------------------------------------------------
+    Determines whether an entry has priority over another entry.
+    Values with the same priority are ordered by insertion order.
+    Use: b = _precedes(value1, order1, value2, order2)
+    -------------------------------------------------------
+    Parameters:
+        value1 - value of the first entry (?)
+        order1 - insertion order of the first entry (int)
+        value2 - value of the second entry (?)
+        order2 - insertion order of the second entry (int)
+    Returns:
+        True if the first entry has priority, False otherwise (boolean)
+    -------------------------------------------------------
+    """
+    return value1 < value2 or (not value2 < value1 and order1 < order2)
+
+
+class Priority_Queue:
+
+    def __init__(self, copy_policy=DEEP, values=None):
+        """
+        -------------------------------------------------------
+        Initializes a priority queue. Values are stored in a binary
+        heap in a Python list: the children of the value at index i
+        are at 2i + 1 and 2i + 2. A parallel list holds the insertion
+        order of each value so that values of equal priority are
+        removed in the order they were inserted.
+        Use: pq = Priority_Queue()
+        Use: pq = Priority_Queue(copy_policy, values)
+        -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+            values - an iterable of initial values, added in O(n)
+                time (iterable of ?)
+        Returns:
+            a new Priority_Queue object (Priority_Queue)
+        -------------------------------------------------------
+        """
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+        self._values = []
+        self._order = []
+        # Insertion order of the next value to be inserted.
+        self._next_order = 0
+
+        if values is not None:
+            for value in values:
+                self._values.append(self._copy(value))
+            self._next_order = len(self._values)
+            self._order = list(range(self._next_order))
+            self._heapify()
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the priority queue is empty.
+        Use: b = pq.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if priority queue is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return len(self._values) == 0
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the length of the priority queue.
+        Use: n = len(pq)
+        -------------------------------------------------------
+        Returns:
+            the number of values in the priority queue.
+        -------------------------------------------------------
+        """
+        return len(self._values)
+
+    def insert(self, value):
+        """
+        -------------------------------------------------------
+        A copy of value is inserted into the priority queue.
+        Values are stored in heap order. O(log n)
+        Use: pq.insert(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._values.append(self._copy(value))
+        self._order.append(self._next_order)
+        self._next_order += 1
+        self._sift_up(len(self._values) - 1)
+        return
+
+    def remove(self):
+        """
+        -------------------------------------------------------
+        Removes and returns the highest priority value from the priority
+        queue. O(log n)
+        Use: value = pq.remove()
+        -------------------------------------------------------
+        Returns:
+            value - the highest priority value in the priority queue -
+                the value is removed from the priority queue. (?)
+        -------------------------------------------------------
+        """
+        assert len(self._values) > 0, "Cannot remove from an empty priority queue"
+
+        value = self._values[0]
+        # Move the last entry to the root and restore the heap.
+        last_value = self._values.pop()
+        last_order = self._order.pop()
+
+        if len(self._values) > 0:
+            self._values[0] = last_value
+            self._order[0] = last_order
+            self._sift_down(0)
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Peeks at the highest priority value of the priority queue.
+        Use: v = pq.peek()
+        -------------------------------------------------------
+        Returns:
+            a copy of the highest priority value in the priority queue -
+                the value is not removed from the priority queue. (?)
+        -------------------------------------------------------
+        """
+        assert len(self._values) > 0, "Cannot peek at an empty priority queue"
+
+        return self._copy(self._values[0])
+
+    def split_key(self, key):
+        """
+        -------------------------------------------------------
+        Splits a priority queue into two depending on an external
+        priority key. The source priority queue is empty when the method
+        ends. The order of the values in source is preserved. O(n)
+        Use: target1, target2 = source.split_key(key)
+        -------------------------------------------------------
+        Parameters:
+            key - a data object (?)
+        Returns:
+            target1 - a priority queue that contains all values
+                with priority higher than key (Priority_Queue)
+            target2 - priority queue that contains all values with
+                priority lower than or equal to key (Priority_Queue)
+        -------------------------------------------------------
+        """
+        target1 = Priority_Queue(self._copy_policy)
+        target2 = Priority_Queue(self._copy_policy)
+
+        for i in range(len(self._values)):
+            value = self._values[i]
+
+            if value < key:
+                target = target1
+            else:
+                target = target2
+            target._values.append(value)
+            target._order.append(self._order[i])
+
+        for target in (target1, target2):
+            # Insertion orders are kept so that ties stay in order.
+            target._next_order = self._next_order
+            target._heapify()
+
+        # Empty the original queue
+        self._values = []
+        self._order = []
+        return target1, target2
+
+    def combine(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Combines two source queues into the current target priority queue.
+        When finished, the contents of source1 and source2 are inserted
+        into target and source1 and source2 are empty. Order is preserved
+        with source1 elements having priority over source2 elements with the
+        same priority value. O(n)
+        Use: target.combine(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - an array-based priority queue (Priority_Queue)
+            source2 - an array-based priority queue (Priority_Queue)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        for source in (source1, source2):
+            # Shift the source insertion orders after the current ones.
+            offset = self._next_order
+            self._values.extend(source._values)
+
+            for order in source._order:
+                self._order.append(order + offset)
+            self._next_order += source._next_order
+            source._values = []
+            source._order = []
+            source._next_order = 0
+
+        self._heapify()
+        return
+
+    def _heapify(self):
+        """
+        -------------------------------------------------------
+        Rearranges the values into heap order, sifting down every
+        parent from the last one up to the root. O(n)
+        Use: self._heapify()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        for i in range(len(self._values) // 2 - 1, -1, -1):
+            self._sift_down(i)
+        return
+
+    def _sift_up(self, i):
+        """
+        -------------------------------------------------------
+        Moves the entry at i up the heap until its parent has priority
+        over it. The entry at i must be the most recently inserted, so
+        it never has priority over an equal parent.
+        Use: self._sift_up(i)
+        -------------------------------------------------------
+        Parameters:
+            i - index of the entry to move (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = self._values
+        orders = self._order
+        value = values[i]
+        order = orders[i]
+        parent = (i - 1) // 2
+
+        while i > 0 and value < values[parent]:
+            # Move the parent down.
+            values[i] = values[parent]
+            orders[i] = orders[parent]
+            i = parent
+            parent = (i - 1) // 2
+
+        values[i] = value
+        orders[i] = order
+        return
+
+    def _sift_down(self, i):
+        """
+        -------------------------------------------------------
+        Moves the entry at i down the heap until it has priority over
+        both of its children.
+        Use: self._sift_down(i)
+        -------------------------------------------------------
+        Parameters:
+            i - index of the entry to move (int)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        values = self._values
+        orders = self._order
+        n = len(values)
+        value = values[i]
+        order = orders[i]
+        child = 2 * i + 1
+        moving = True
+
+        while moving and child < n:
+            right = child + 1
+
+            if right < n and _precedes(values[right], orders[right],
+                                       values[child], orders[child]):
+                # The right child has the higher priority.
+                child = right
+
+            if _precedes(values[child], orders[child], value, order):
+                # Move the child up.
+                values[i] = values[child]
+                orders[i] = orders[child]
+                i = child
+                child = 2 * i + 1
+            else:
+                moving = False
+
+        values[i] = value
+        orders[i] = order
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the queue
+        in priority order, without changing it. O(n log n)
+        Use: for value in pq:
+        -------------------------------------------------------
+        Returns:
+            value - the next value in the priority queue (?)
+        -------------------------------------------------------
+        """
+        temp = Priority_Queue(NONE)
+        temp._values = self._values[:]
+        temp._order = self._order[:]
+
+        while len(temp._values) > 0:
+            yield temp.remove()
@@ -12,15 +12,16 @@ __updated__ = "2022-03-02"
 # pylint: disable=protected-access
 
 # Imports
-from copy import deepcopy
+from Copy_Policy import DEEP, copier
 
 
 class _PQ_Node:
+    __slots__ = ('_value', '_next')
 
     def __init__(self, value, _next):
         """
         -------------------------------------------------------
-        Initializes a priority queue node that contains a copy of value
+        Initializes a priority queue node that contains value
         and a link to the next node in the priority queue
         Use: node = _PQ_Node(value, _next)
         -------------------------------------------------------
@@ -31,18 +32,21 @@ class _PQ_Node:
             a new Priority_Queue object (_PQ_Node)
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._next = _next
 
 
 class Priority_Queue:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty priority queue.
         Use: pq = Priority_Queue()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             a new Priority_Queue object (Priority_Queue)
         -------------------------------------------------------
@@ -50,6 +54,8 @@ class Priority_Queue:
         self._front = None
         self._rear = None
         self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
 
     def is_empty(self):
         """
@@ -90,15 +96,15 @@ class Priority_Queue:
         """
         if self._front is None:
             # Priority queue is empty
-            node = _PQ_Node(value, None)
+            node = _PQ_Node(self._copy(value), None)
             self._front = node
             self._rear = node
         elif value < self._front._value:
             # New value has highest priority
-            self._front = _PQ_Node(value, self._front)
+            self._front = _PQ_Node(self._copy(value), self._front)
         elif value >= self._rear._value:
             # New value has lowest priority
-            node = _PQ_Node(value, None)
+            node = _PQ_Node(self._copy(value), None)
             self._rear._next = node
             self._rear = node
         else:
@@ -112,7 +118,7 @@ class Priority_Queue:
 
             # Create the new node and link it to curr.
             # The previous node is linked to the new node.
-            prev._next = _PQ_Node(value, curr)
+            prev._next = _PQ_Node(self._copy(value), curr)
         # Increment the priority queue size.
         self._count += 1
         return
@@ -152,7 +158,7 @@ class Priority_Queue:
         """
         assert self._count > 0, "Cannot peek at an empty priority queue"
 
-        return deepcopy(self._front._value)
+        return self._copy(self._front._value)
 
     def split(self):
         """
@@ -166,8 +172,8 @@ class Priority_Queue:
             target2 - <= 50% of the source Sorted_List (Sorted_List)
         -------------------------------------------------------
         """
-        target1 = Priority_Queue()
-        target2 = Priority_Queue()
+        target1 = Priority_Queue(self._copy_policy)
+        target2 = Priority_Queue(self._copy_policy)
         # Split
         middle = self._count // 2 + self._count % 2
         prev = None
@@ -214,8 +220,8 @@ class Priority_Queue:
                 from the curr queue  (Priority_Queue)
         -------------------------------------------------------
         """
-        target1 = Priority_Queue()
-        target2 = Priority_Queue()
+        target1 = Priority_Queue(self._copy_policy)
+        target2 = Priority_Queue(self._copy_policy)
         left = True
 
         while self._front is not None:
@@ -244,8 +250,8 @@ class Priority_Queue:
                 priority lower than or equal to key (Priority_Queue)
         -------------------------------------------------------
         """
-        target1 = Priority_Queue()
-        target2 = Priority_Queue()
+        target1 = Priority_Queue(self._copy_policy)
+        target2 = Priority_Queue(self._copy_policy)
 
         if self._count > 0:
 
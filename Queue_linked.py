@@ -11,15 +11,16 @@ __updated__ = "2022-03-07"
 """
 # pylint: disable=protected-access
 
-from copy import deepcopy
+from Copy_Policy import DEEP, copier
 
 
 class _Queue_Node:
+    __slots__ = ('_value', '_next')
 
     def __init__(self, value, next_):
         """
         -------------------------------------------------------
-        Initializes a queue node that contains a copy of value
+        Initializes a queue node that contains value
         and a link to the next node in the queue.
         Use: node = _Queue_Node(value, _next)
         -------------------------------------------------------
@@ -30,19 +31,22 @@ class _Queue_Node:
             a new _Queue_Node object (_Queue_Node)
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._next = next_
 
 
 class Queue:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty queue. Values are stored in a
         linked structure.
         Use: queue = Queue()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             a new Queue object (Queue)
         -------------------------------------------------------
@@ -50,6 +54,8 @@ class Queue:
         self._front = None
         self._rear = None
         self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
 
     def is_empty(self):
         """
@@ -99,7 +105,7 @@ class Queue:
             a copy of value is added to the rear of queue.
         -------------------------------------------------------
         """
-        node = _Queue_Node(value, None)
+        node = _Queue_Node(self._copy(value), None)
 
         if self._front is None:
             self._front = node
@@ -144,7 +150,7 @@ class Queue:
         """
         assert self._front is not None, "Cannot peek at an empty queue"
 
-        return deepcopy(self._front._value)
+        return self._copy(self._front._value)
 
     def _move_front_to_rear(self, source):
         """
@@ -252,8 +258,8 @@ class Queue:
             target2 - contains remaining values from source (Queue)
         -------------------------------------------------------
         """
-        target1 = Queue()
-        target2 = Queue()
+        target1 = Queue(self._copy_policy)
+        target2 = Queue(self._copy_policy)
         left = True
 
         while self._front is not None:
@@ -0,0 +1,367 @@
+"""
+-------------------------------------------------------
+Unrolled linked version of the Queue ADT: each node holds
+up to _CAPACITY values in a Python list.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from itertools import islice
+
+from Copy_Policy import DEEP, copier
+
+# Constants
+# The most values a node holds.
+_CAPACITY = 64
+
+
+class _Queue_Node:
+    __slots__ = ('_values', '_start', '_next')
+
+    def __init__(self, value, next_):
+        """
+        -------------------------------------------------------
+        Initializes a queue node that contains value and a link to
+        the next node in the queue. The node's values are
+        _values[_start:]; the values before _start have been removed.
+        Use: node = _Queue_Node(value, _next)
+        -------------------------------------------------------
+        Parameters:
+            value - first value for node (?)
+            next_ - another Queue node (_Queue_Node)
+        Returns:
+            a new _Queue_Node object (_Queue_Node)
+        -------------------------------------------------------
+        """
+        self._values = [value]
+        self._start = 0
+        self._next = next_
+
+
+class Queue:
+
+    def __init__(self, copy_policy=DEEP):
+        """
+        -------------------------------------------------------
+        Initializes an empty queue. Values are stored in a
+        linked structure of nodes that hold up to _CAPACITY values.
+        Use: queue = Queue()
+        -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+        Returns:
+            a new Queue object (Queue)
+        -------------------------------------------------------
+        """
+        self._front = None
+        self._rear = None
+        self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the queue is empty.
+        Use: b = queue.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if queue is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def is_full(self):
+        """
+        -------------------------------------------------------
+        Determines if the queue is full.
+        Use: b = queue.is_full()
+        -------------------------------------------------------
+        Returns:
+            True if queue is full, False otherwise.
+        -------------------------------------------------------
+        """
+        return False
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the length of the queue.
+        Use: n = len(queue)
+        -------------------------------------------------------
+        Returns:
+            the number of values in queue.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def insert(self, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value into the queue.
+        Use: queue.insert(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            a copy of value is added to the rear of queue.
+        -------------------------------------------------------
+        """
+        self._add_rear(self._copy(value))
+        return
+
+    def _add_rear(self, value):
+        """
+        -------------------------------------------------------
+        Adds value itself to the rear of the queue. A new node is
+        linked only when the rear node is full. Private helper method.
+        Use: self._add_rear(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        if self._rear is None:
+            self._front = _Queue_Node(value, None)
+            self._rear = self._front
+        elif len(self._rear._values) == _CAPACITY:
+            self._rear._next = _Queue_Node(value, None)
+            self._rear = self._rear._next
+        else:
+            self._rear._values.append(value)
+        self._count += 1
+        return
+
+    def remove(self):
+        """
+        -------------------------------------------------------
+        Removes and returns value from the queue.
+        Use: value = queue.remove()
+        -------------------------------------------------------
+        Returns:
+            value - the value at the front of the queue - the value is
+            removed from queue (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot remove from an empty queue"
+
+        value = self._remove_front()
+        return value
+
+    def _remove_front(self):
+        """
+        -------------------------------------------------------
+        Removes and returns the value at the front of a non-empty
+        queue. The front node is unlinked once all of its values have
+        been removed. Private helper method.
+        Use: value = self._remove_front()
+        -------------------------------------------------------
+        Returns:
+            value - the value at the front of the queue (?)
+        -------------------------------------------------------
+        """
+        node = self._front
+        value = node._values[node._start]
+        # Release the value so the node does not keep it alive.
+        node._values[node._start] = None
+        node._start += 1
+        self._count -= 1
+
+        if node._start == len(node._values):
+            self._front = node._next
+
+            if self._front is None:
+                self._rear = None
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Peeks at the front of queue.
+        Use: value = queue.peek()
+        -------------------------------------------------------
+        Returns:
+            a copy of the value at the front of queue -
+            the value is not removed from queue (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot peek at an empty queue"
+
+        return self._copy(self._front._values[self._front._start])
+
+    def _move_front_to_rear(self, source):
+        """
+        -------------------------------------------------------
+        Moves the front value from the source queue to the rear of the
+        target queue. Equivalent of self.insert(source.remove()), but
+        the value is not copied.
+        Use: target._move_front_to_rear(source)
+        -------------------------------------------------------
+        Parameters:
+            source - an unrolled queue (Queue)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._front is not None, "Cannot move the front of an empty queue"
+
+        self._add_rear(source._remove_front())
+        return
+
+    def _append_queue(self, source):
+        """
+        -------------------------------------------------------
+        Appends the entire source queue to the rear of the target queue.
+        The source queue becomes empty. The source nodes are linked
+        after the target rear, so the append is O(1) even though the
+        old rear node may not be full.
+        Use: target._append_queue(source)
+        -------------------------------------------------------
+        Parameters:
+            source - an unrolled queue (Queue)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._front is not None, "Cannot append an empty queue"
+
+        # Update the target queue
+        if self._front is None:
+            # Current queue is empty.
+            self._front = source._front
+        else:
+            self._rear._next = source._front
+        self._rear = source._rear
+        self._count += source._count
+        # Empty the source queue.
+        source._front = None
+        source._rear = None
+        source._count = 0
+        return
+
+    def combine(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Combines two source queues into the current target queue.
+        When finished, the contents of source1 and source2 are interlaced
+        into target and source1 and source2 are empty.
+        (iterative algorithm)
+        Use: target.combine(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - an unrolled queue (Queue)
+            source2 - an unrolled queue (Queue)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        while source1._front is not None and source2._front is not None:
+            self._move_front_to_rear(source1)
+            self._move_front_to_rear(source2)
+
+        if source1._front is not None:
+            self._append_queue(source1)
+
+        if source2._front is not None:
+            self._append_queue(source2)
+        return
+
+    def split_alt(self):
+        """
+        -------------------------------------------------------
+        Splits the source queue into separate target queues with values
+        alternating into the targets. At finish source queue is empty.
+        (iterative algorithm)
+        Use: target1, target2 = source.split_alt()
+        -------------------------------------------------------
+        Returns:
+            target1 - contains alternating values from source (Queue)
+            target2 - contains remaining values from source (Queue)
+        -------------------------------------------------------
+        """
+        target1 = Queue(self._copy_policy)
+        target2 = Queue(self._copy_policy)
+        left = True
+
+        while self._front is not None:
+            # Move values to alternate queues.
+            if left:
+                target1._move_front_to_rear(self)
+            else:
+                target2._move_front_to_rear(self)
+            left = not left
+        return target1, target2
+
+    def is_identical(self, target):
+        """
+        -------------------------------------------------------
+        Determines whether two queues are identical.
+        Values of self and target are compared and if all contents
+        are identical and in the same order, returns True, otherwise
+        returns False. Queues are unchanged.
+        (iterative algorithm)
+        Use: b = source.is_identical(target)
+        -------------------------------------------------------
+        Parameters:
+            target - a queue (Queue)
+        Returns:
+            identical - True if self and target are identical, False
+                otherwise. (boolean)
+        -------------------------------------------------------
+        """
+        identical = self._count == target._count
+        source_node = self._front
+        target_node = target._front
+
+        if identical and source_node is not None:
+            source_i = source_node._start
+            target_i = target_node._start
+
+        while identical and source_node is not None:
+            if source_node._values[source_i] != target_node._values[target_i]:
+                identical = False
+            else:
+                # The two queues may be split into nodes differently.
+                source_i += 1
+
+                if source_i == len(source_node._values):
+                    source_node = source_node._next
+
+                    if source_node is not None:
+                        source_i = source_node._start
+                target_i += 1
+
+                if target_i == len(target_node._values):
+                    target_node = target_node._next
+
+                    if target_node is not None:
+                        target_i = target_node._start
+        return identical
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the queue
+        from front to rear.
+        Use: for v in q:
+        -------------------------------------------------------
+        Returns:
+            value - the next value in the queue (?)
+        -------------------------------------------------------
+        """
+        current = self._front
+
+        while current is not None:
+            yield from islice(current._values, current._start, None)
+            current = current._next
@@ -12,10 +12,11 @@ __updated__ = "2022-02-10"
 # pylint: disable=W0212
 
 # Imports
-from copy import deepcopy
+from Copy_Policy import DEEP, copier
 
 
 class _SL_Node:
+    __slots__ = ('_value', '_next')
 
     def __init__(self, value, next_):
         """
@@ -27,23 +28,26 @@ class _SL_Node:
             value - value value for node (?)
             next_ - another sorted list node (_ListNode)
         Returns:
-            Initializes a list node that contains a copy of value
+            Initializes a list node that contains value
             and a link to the next node in the list.
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._next = next_
         return
 
 
 class Sorted_List:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty Sorted_List.
         Use: sl = Sorted_List()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             a Sorted_List object (Sorted_List)
         -------------------------------------------------------
@@ -51,6 +55,8 @@ class Sorted_List:
         self._front = None
         self._rear = None
         self._count = 0
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
 
     def is_empty(self):
         """
@@ -92,15 +98,15 @@ class Sorted_List:
         """
         if self._front is None:
             # sorted list is empty
-            node = _SL_Node(value, None)
+            node = _SL_Node(self._copy(value), None)
             self._front = node
             self._rear = node
         elif value < self._front._value:
             # New value has lowest value
-            self._front = _SL_Node(value, self._front)
+            self._front = _SL_Node(self._copy(value), self._front)
         elif value >= self._rear._value:
             # New value has highest value
-            node = _SL_Node(value, None)
+            node = _SL_Node(self._copy(value), None)
             self._rear._next = node
             self._rear = node
         else:
@@ -114,7 +120,7 @@ class Sorted_List:
 
             # Create the new node and link it to curr.
             # The previous node is linked to the new node.
-            prev._next = _SL_Node(value, curr)
+            prev._next = _SL_Node(self._copy(value), curr)
         # Increment the sorted list size.
         self._count += 1
         return
@@ -266,7 +272,7 @@ class Sorted_List:
         _, current, i = self._linear_search(key)
 
         if i != -1:
-            value = deepcopy(current._value)
+            value = self._copy(current._value)
         else:
             value = None
         return value
@@ -283,7 +289,7 @@ class Sorted_List:
         """
         assert self._front is not None, "Cannot peek at an empty list"
 
-        value = deepcopy(self._front._value)
+        value = self._copy(self._front._value)
         return value
 
     def index(self, key):
@@ -344,7 +350,7 @@ class Sorted_List:
             current = current._next
             j += 1
 
-        value = deepcopy(current._value)
+        value = self._copy(current._value)
         return value
 
     def __contains__(self, key):
@@ -374,7 +380,7 @@ class Sorted_List:
         """
         assert self._front is not None, "Cannot find maximum of an empty list"
 
-        value = deepcopy(self._rear._value)
+        value = self._copy(self._rear._value)
         return value
 
     def min(self):
@@ -389,7 +395,7 @@ class Sorted_List:
         """
         assert self._front is not None, "Cannot find minimum of an empty list"
 
-        value = deepcopy(self._front._value)
+        value = self._copy(self._front._value)
         return value
 
     def count(self, key):
@@ -537,12 +543,12 @@ class Sorted_List:
                 # Value exists in both lists.
                 if self._front is None:
                     # Add new node to self
-                    self._front = _SL_Node(source1_node._value, None)
+                    self._front = _SL_Node(self._copy(source1_node._value), None)
                     self._rear = self._front
                     self._count += 1
                 elif self._rear._value < source1_node._value:
                     # Add new node to the end of self
-                    self._rear._next = _SL_Node(source1_node._value, None)
+                    self._rear._next = _SL_Node(self._copy(source1_node._value), None)
                     self._rear = self._rear._next
                     self._count += 1
                 else:
@@ -588,12 +594,12 @@ class Sorted_List:
 
             if self._front is None:
                 # Add new node to self
-                self._front = _SL_Node(new_value, None)
+                self._front = _SL_Node(self._copy(new_value), None)
                 self._rear = self._front
                 self._count += 1
             elif self._rear._value < new_value:
                 # Add new node to the end of self
-                self._rear._next = _SL_Node(new_value, None)
+                self._rear._next = _SL_Node(self._copy(new_value), None)
                 self._rear = self._rear._next
                 self._count += 1
 
@@ -607,7 +613,7 @@ class Sorted_List:
 
         if self._front is None and source_node is not None:
             # Add at least one value to the front of self
-            self._front = _SL_Node(source_node._value, None)
+            self._front = _SL_Node(self._copy(source_node._value), None)
             self._rear = self._front
             self._count += 1
             source_node = source_node._next
@@ -617,7 +623,7 @@ class Sorted_List:
 
             if self._rear._value < source_node._value:
                 # Add new node to the end of self
-                self._rear._next = _SL_Node(source_node._value, None)
+                self._rear._next = _SL_Node(self._copy(source_node._value), None)
                 self._rear = self._rear._next
                 self._count += 1
             source_node = source_node._next
@@ -635,8 +641,8 @@ class Sorted_List:
             target2 - a new Sorted_List of values > key (Sorted_List)
         -------------------------------------------------------
         """
-        target1 = Sorted_List()
-        target2 = Sorted_List()
+        target1 = Sorted_List(self._copy_policy)
+        target2 = Sorted_List(self._copy_policy)
 
         if self._count > 0:
 
@@ -690,8 +696,8 @@ class Sorted_List:
             target2 - contains other alternating values from source (Sorted_List)
         -------------------------------------------------------
         """
-        target1 = Sorted_List()
-        target2 = Sorted_List()
+        target1 = Sorted_List(self._copy_policy)
+        target2 = Sorted_List(self._copy_policy)
         left = True
 
         while self._front is not None:
@@ -716,8 +722,8 @@ class Sorted_List:
             target2 - <= 50% of the source Sorted_List (Sorted_List)
         -------------------------------------------------------
         """
-        target1 = Sorted_List()
-        target2 = Sorted_List()
+        target1 = Sorted_List(self._copy_policy)
+        target2 = Sorted_List(self._copy_policy)
         # Split
         middle = self._count // 2 + self._count % 2
         prev = None
@@ -9,15 +9,16 @@ Section: CP164 C
 __updated__ = "2019-04-27"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from Copy_Policy import DEEP, copier
 
 
 class _Stack_Node:
+    __slots__ = ('_value', '_next')
 
     def __init__(self, value, next_):
         """
         -------------------------------------------------------
-        Initializes a stack node that contains a copy of value
+        Initializes a stack node that contains value
         and a link to the next node in the stack.
         Use: node = _Stack_Node(value, _next)
         -------------------------------------------------------
@@ -28,24 +29,29 @@ class _Stack_Node:
             a new _Stack_Node object (_Stack_Node)
         -------------------------------------------------------
         """
-        self._value = deepcopy(value)
+        self._value = value
         self._next = next_
 
 
 class Stack:
 
-    def __init__(self):
+    def __init__(self, copy_policy=DEEP):
         """
         -------------------------------------------------------
         Initializes an empty stack. Values are stored in a 
         linked structure.
         Use: source = Stack()
         -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
         Returns:
             a new Stack object (Stack)
         -------------------------------------------------------
         """
         self._top = None
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
 
     def _move_top_to_top(self, source):
         """
@@ -141,7 +147,7 @@ class Stack:
         """
         assert self._top is not None, "Cannot peek at an empty stack"
 
-        value = deepcopy(self._top._value)
+        value = self._copy(self._top._value)
         return value
 
     def pop(self):
@@ -174,7 +180,7 @@ class Stack:
             None
         -------------------------------------------------------
         """
-        self._top = _Stack_Node(value, self._top)
+        self._top = _Stack_Node(self._copy(value), self._top)
         return
 
     def split_alt(self):
@@ -189,8 +195,8 @@ class Stack:
             target2 - contains other alternating values from source (Stack)
         -------------------------------------------------------
         """
-        target1 = Stack()
-        target2 = Stack()
+        target1 = Stack(self._copy_policy)
+        target2 = Stack(self._copy_policy)
         left = True
 
         while self._top is not None:
@@ -0,0 +1,269 @@
+"""
+-------------------------------------------------------
+Unrolled linked version of the Stack ADT: each node holds
+up to _CAPACITY values in a Python list.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+Section: CP164 A
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# pylint: disable=protected-access
+
+# Imports
+from Copy_Policy import DEEP, copier
+
+# Constants
+# The most values a node holds.
+_CAPACITY = 64
+
+
+class _Stack_Node:
+    __slots__ = ('_values', '_next')
+
+    def __init__(self, value, next_):
+        """
+        -------------------------------------------------------
+        Initializes a stack node that contains value and a link to
+        the node below it. The last value in _values is the top of
+        the node. Nodes in a stack are never empty.
+        Use: node = _Stack_Node(value, _next)
+        -------------------------------------------------------
+        Parameters:
+            value - first value for node (?)
+            next_ - another stack node (_Stack_Node)
+        Returns:
+            a new _Stack_Node object (_Stack_Node)
+        -------------------------------------------------------
+        """
+        self._values = [value]
+        self._next = next_
+
+
+class Stack:
+
+    def __init__(self, copy_policy=DEEP):
+        """
+        -------------------------------------------------------
+        Initializes an empty stack. Values are stored in a
+        linked structure of nodes that hold up to _CAPACITY values.
+        Use: source = Stack()
+        -------------------------------------------------------
+        Parameters:
+            copy_policy - how values are copied as they are stored
+                and returned: DEEP, SHALLOW, or NONE (str)
+        Returns:
+            a new Stack object (Stack)
+        -------------------------------------------------------
+        """
+        self._top = None
+        self._copy_policy = copy_policy
+        self._copy = copier(copy_policy)
+
+    def _add_top(self, value):
+        """
+        -------------------------------------------------------
+        Pushes value itself onto the stack. A new node is linked only
+        when the top node is full. Private helper method.
+        Use: self._add_top(value)
+        -------------------------------------------------------
+        Parameters:
+            value - a data element (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        if self._top is None or len(self._top._values) == _CAPACITY:
+            self._top = _Stack_Node(value, self._top)
+        else:
+            self._top._values.append(value)
+        return
+
+    def _remove_top(self):
+        """
+        -------------------------------------------------------
+        Pops and returns the top of a non-empty stack. The top node is
+        unlinked once it is empty. Private helper method.
+        Use: value = self._remove_top()
+        -------------------------------------------------------
+        Returns:
+            value - the value at the top of stack (?)
+        -------------------------------------------------------
+        """
+        value = self._top._values.pop()
+
+        if len(self._top._values) == 0:
+            self._top = self._top._next
+        return value
+
+    def _move_top_to_top(self, source):
+        """
+        -------------------------------------------------------
+        Moves the top value from the source stack to the target stack.
+        Equivalent of self.push(source.pop()), but the value is not
+        copied.
+        Use: target._move_top_to_top(source)
+        -------------------------------------------------------
+        Parameters:
+            source - an unrolled stack (Stack)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        assert source._top is not None, "Cannot move the top of an empty stack"
+
+        self._add_top(source._remove_top())
+        return
+
+    def reverse(self):
+        """
+        -------------------------------------------------------
+        Reverses the contents of source. The values in each node are
+        reversed, then the nodes are relinked in reverse order.
+        Use: source.reverse()
+        -------------------------------------------------------
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        new_top = None
+
+        while self._top is not None:
+            self._top._values.reverse()
+            temp = self._top._next
+            self._top._next = new_top
+            new_top = self._top
+            self._top = temp
+        self._top = new_top
+        return
+
+    def combine(self, source1, source2):
+        """
+        -------------------------------------------------------
+        Combines two source stacks into the current target stack.
+        When finished, the contents of source1 and source2 are interlaced
+        into target and source1 and source2 are empty.
+        Use: target.combine(source1, source2)
+        -------------------------------------------------------
+        Parameters:
+            source1 - an unrolled stack (Stack)
+            source2 - an unrolled stack (Stack)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        while source1._top is not None and source2._top is not None:
+            self._move_top_to_top(source1)
+            self._move_top_to_top(source2)
+
+        while source1._top is not None:
+            self._move_top_to_top(source1)
+
+        while source2._top is not None:
+            self._move_top_to_top(source2)
+        return
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the stack is empty.
+        Use: b = source.is_empty()
+        -------------------------------------------------------
+        Returns:
+            True if source is empty, False otherwise
+        -------------------------------------------------------
+        """
+        return self._top is None
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Returns a copy of the value at the top of source.
+        Attempting to peek at an empty stack throws an exception.
+        Use: value = source.peek()
+        -------------------------------------------------------
+        Returns:
+            value - a copy of the value at the top of source (?)
+        -------------------------------------------------------
+        """
+        assert self._top is not None, "Cannot peek at an empty stack"
+
+        value = self._copy(self._top._values[-1])
+        return value
+
+    def pop(self):
+        """
+        -------------------------------------------------------
+        Pops and returns the top of stack. The value is removed
+        from source. Attempting to pop from an empty stack
+        throws an exception.
+        Use: value = source.pop()
+        -------------------------------------------------------
+        Returns:
+            value - the value at the top of stack (?)
+        -------------------------------------------------------
+        """
+        assert self._top is not None, "Cannot pop from an empty stack"
+
+        value = self._remove_top()
+        return value
+
+    def push(self, value):
+        """
+        -------------------------------------------------------
+        Pushes a copy of value onto the top of source.
+        Use: source.push(value)
+        -------------------------------------------------------
+        Parameters:
+            value - value to be added to source (?)
+        Returns:
+            None
+        -------------------------------------------------------
+        """
+        self._add_top(self._copy(value))
+        return
+
+    def split_alt(self):
+        """
+        -------------------------------------------------------
+        Splits the source stack into separate target stacks with values
+        alternating into the targets. At finish source stack is empty.
+        Use: target1, target2 = source.split_alt()
+        -------------------------------------------------------
+        Returns:
+            target1 - contains alternating values from source (Stack)
+            target2 - contains other alternating values from source (Stack)
+        -------------------------------------------------------
+        """
+        target1 = Stack(self._copy_policy)
+        target2 = Stack(self._copy_policy)
+        left = True
+
+        while self._top is not None:
+
+            if left:
+                target1._move_top_to_top(self)
+            else:
+                target2._move_top_to_top(self)
+            left = not left
+        return target1, target2
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through source
+        from top to bottom.
+        Use: for value in source:
+        -------------------------------------------------------
+        Returns:
+            _value - the next value in source (?)
+        -------------------------------------------------------
+        """
+        current = self._top
+
+        while current is not None:
+            yield from reversed(current._values)
+            current = current._next